@@ -0,0 +1,227 @@
+"""
+Бенчмарк GitClient на синтетических репозиториях.
+
+Репозиторий заданного размера генерируется детерминированно (по seed) через `build_repo`, то есть одним
+потоком `git fast-import`, и кешируется во временном каталоге. Замеряются время, commits/s и пиковая память методов
+`get_issue_id_list_from_merge_commits` и `get_issue_id_list_from_commit_messages`. Каждый замер выполняется
+в отдельном процессе, поэтому пиковая память git относится только к процессам git этого замера.
+
+Запуск:
+    python -m benchmarks.bench_git_client --commits 10000 100000 --merge-ratio 0.05
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import resource
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from src import GitClient
+from src.git.git_repo_builder import Operation, build_repo
+from typing import Callable, Dict, Iterator, List, NamedTuple
+
+
+MAINLINE = "develop"
+START_TAG = "bench-start"
+END_TAG = "bench-end"
+FEATURE_BRANCH = "bench-feature"
+
+# Распределение имен исходных веток: шаблон и вес. В последнем шаблоне нет идентификатора задачи.
+BRANCH_NAME_DISTRIBUTION = [
+    ("feature/{issue_id}-some-feature", 60),
+    ("bugfix/{issue_id}", 25),
+    ("release/v1.0.0/hotfix/{issue_id}-fix-something", 10),
+    ("chore/cleanup-{number}", 5),
+]
+
+
+class RepoSpec(NamedTuple):
+    """
+    Параметры синтетического репозитория.
+    """
+
+    commits: int
+    merge_ratio: float
+    branch_length: int
+    project_ids: tuple
+    seed: int
+
+    @property
+    def key(self) -> str:
+        return "-".join([
+            f"c{self.commits}", f"m{self.merge_ratio}", f"b{self.branch_length}", "_".join(self.project_ids), f"s{self.seed}"
+        ])
+
+
+def generate_operations(spec: RepoSpec) -> Iterator[Operation]:
+    """
+    Генерирует описание графа: основная ветка с фича-ветками, слитыми через merge-коммиты.
+
+    Фича-ветка в среднем содержит `spec.branch_length` коммитов, вероятность ее появления подбирается так,
+    чтобы доля merge-коммитов среди всех коммитов была примерно равна `spec.merge_ratio`.
+
+    Args:
+        spec (RepoSpec): Параметры репозитория.
+
+    Yields:
+        Operation: Операции описания графа для `build_repo`.
+    """
+    rng = random.Random(spec.seed)
+    templates = [template for template, _ in BRANCH_NAME_DISTRIBUTION]
+    weights = [weight for _, weight in BRANCH_NAME_DISTRIBUTION]
+    # Доля слияний r = q / (q * L + 1), где q — вероятность фича-ветки на шаге, L — ее средняя длина.
+    if spec.merge_ratio * spec.branch_length < 1:
+        branch_probability = spec.merge_ratio / (1 - spec.merge_ratio * spec.branch_length)
+    else:
+        branch_probability = 1.0
+
+    yield ("commit", "Initial commit")
+    yield ("tag", START_TAG)
+
+    commits = 1
+    while commits < spec.commits:
+        project_id = rng.choice(spec.project_ids)
+        number = rng.randint(1, 100_000)
+        issue_id = f"{project_id}-{number}"
+
+        if rng.random() < branch_probability:
+            branch = rng.choices(templates, weights)[0].format(issue_id=issue_id, number=number)
+            # Все фича-ветки создаются под одним именем, а настоящее имя попадает только в сообщение слияния
+            yield ("branch", FEATURE_BRANCH)
+            length = rng.randint(1, 2 * spec.branch_length - 1)
+            for i in range(length):
+                yield ("commit", f"{issue_id} message {i + 1}")
+            yield ("checkout", MAINLINE)
+            yield ("merge", FEATURE_BRANCH, f"Merge branch '{branch}' into {MAINLINE}")
+            commits += length + 1
+        else:
+            yield ("commit", rng.choice([f"{issue_id} message", f"fix: message #{issue_id}", "message without issue"]))
+            commits += 1
+
+    yield ("tag", END_TAG)
+
+
+class Measurement(NamedTuple):
+    name: str
+    seconds: float
+    commits_per_second: float
+    issues: int
+    python_peak_mb: float
+    git_peak_mb: float
+
+
+def measure(name: str, commits: int, run: Callable[[], List[str]], trace_memory: bool) -> Measurement:
+    """
+    Замеряет один вызов: время без трассировки памяти, затем (по желанию) пиковую память Python.
+    Пиковая память git заполняется в `run_case`.
+
+    Args:
+        name (str): Название замера.
+        commits (int): Число коммитов в диапазоне.
+        run (Callable[[], List[str]]): Замеряемый вызов.
+        trace_memory (bool): Выполнить повторный вызов под `tracemalloc`.
+
+    Returns:
+        Measurement: Результат замера.
+    """
+    started = time.perf_counter()
+    issues = run()
+    seconds = time.perf_counter() - started
+
+    python_peak = 0
+    if trace_memory:
+        tracemalloc.start()
+        run()
+        _, python_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return Measurement(name, seconds, commits / seconds, len(issues), python_peak / 2**20, 0.0)
+
+
+# Параметры GitClient для каждого сравниваемого способа обхода истории.
+BACKENDS: Dict[str, Dict[str, bool]] = {
+    "git-log": {},
+    "gitpython": {"use_git_log": False},
+}
+
+# Замеряемые вызовы.
+CASES: Dict[str, Callable[[GitClient, str], List[str]]] = {
+    "merge_commits": lambda client, project_id: client.get_issue_id_list_from_merge_commits(
+        START_TAG, END_TAG, project_id, MAINLINE
+    ),
+    "commit_messages": lambda client, project_id: client.get_issue_id_list_from_commit_messages(
+        START_TAG, END_TAG, project_id
+    ),
+}
+
+
+def run_case(repo_dir: str, backend: str, case: str, commits: int, project_id: str, trace_memory: bool) -> Measurement:
+    """
+    Выполняет один замер в отдельном процессе, чтобы пиковая память git относилась только к нему.
+
+    После замера репозиторий закрывается: постоянные процессы `git cat-file` GitPython завершаются
+    и учитываются в `RUSAGE_CHILDREN` наравне с `git log`.
+
+    Args:
+        repo_dir (str): Путь к репозиторию.
+        backend (str): Ключ `BACKENDS`.
+        case (str): Ключ `CASES`.
+        commits (int): Число коммитов в диапазоне.
+        project_id (str): Префикс проекта.
+        trace_memory (bool): Замерять пиковую память Python.
+
+    Returns:
+        Measurement: Результат замера.
+    """
+    client = GitClient(repo_dir, **BACKENDS[backend])
+    measurement = measure(f"{backend} {case}", commits, lambda: CASES[case](client, project_id), trace_memory)
+    client.repo.close()
+
+    # ru_maxrss в Linux измеряется в килобайтах; это максимум по дочерним процессам git этого замера.
+    git_peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    return measurement._replace(git_peak_mb=git_peak)
+
+
+def run_benchmark(spec: RepoSpec, root: str, trace_memory: bool) -> List[Measurement]:
+    repo_dir = build_repo(generate_operations(spec), MAINLINE, cache_key=spec.key, cache_root=root)
+    commits = int(subprocess.check_output(["git", "rev-list", "--count", END_TAG], cwd=repo_dir))
+    project_id = spec.project_ids[0]
+
+    measurements = []
+    for backend in BACKENDS:
+        for case in CASES:
+            # Новый процесс на каждый замер: RUSAGE_CHILDREN не включает сборку репозитория и прошлые замеры
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                measurements.append(
+                    executor.submit(run_case, repo_dir, backend, case, commits, project_id, trace_memory).result()
+                )
+
+    return measurements
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк GitClient на синтетических репозиториях.")
+    parser.add_argument("--commits", type=int, nargs="+", default=[10_000], help="Размеры репозиториев.")
+    parser.add_argument("--merge-ratio", type=float, default=0.05, help="Доля merge-коммитов.")
+    parser.add_argument("--branch-length", type=int, default=3, help="Средняя длина фича-ветки.")
+    parser.add_argument("--projects", nargs="+", default=["TMOB", "TAND", "TIOS"], help="Префиксы проектов.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--root", default=os.path.join(tempfile.gettempdir(), "auto-changelog-bench"))
+    parser.add_argument("--no-memory", action="store_true", help="Не замерять пиковую память Python.")
+    args = parser.parse_args()
+
+    print(f"{'commits':>9}  {'case':<28} {'seconds':>8} {'commits/s':>11} {'issues':>7} {'py peak MB':>11} {'git peak MB':>12}")
+    for commits in args.commits:
+        spec = RepoSpec(commits, args.merge_ratio, args.branch_length, tuple(args.projects), args.seed)
+        for m in run_benchmark(spec, args.root, not args.no_memory):
+            print(
+                f"{commits:>9}  {m.name:<28} {m.seconds:>8.3f} {m.commits_per_second:>11.0f} "
+                f"{m.issues:>7} {m.python_peak_mb:>11.1f} {m.git_peak_mb:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Бенчмарк памяти на одну задачу для разных представлений задач YouTrack.
+
+Задачи декодируются из JSON так же, как ответ YouTrack, после чего замеряется память,
+которую удерживает контейнер с результатом (по `tracemalloc`).
+
+Запуск:
+    python -m benchmarks.bench_issue_memory --issues 100000 1000000
+"""
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from src.youtrack.youtrack_issue import CompactIssue, Issue, convert_to_issue
+from src.youtrack.youtrack_issue_table import IssueTable
+from typing import Any, Callable, Dict, Iterator, NamedTuple
+
+
+STATES = ["Open", "In Progress", "Review", "Testing", "Fixed", "Won't fix"]
+
+
+def generate_payloads(count: int, seed: int) -> Iterator[str]:
+    """
+    Генерирует JSON отдельных задач; строки каждой задачи создаются заново, как при разборе ответа.
+
+    Args:
+        count (int): Число задач.
+        seed (int): Начальное значение генератора случайных чисел.
+
+    Yields:
+        str: JSON задачи в формате YouTrack.
+    """
+    rng = random.Random(seed)
+    for number in range(count):
+        yield json.dumps({
+            "idReadable": f"TMOB-{number}",
+            "summary": f"Задача номер {number} из релиза",
+            "updated": 1_700_000_000_000 + rng.randint(0, 10**9),
+            "customFields": [{"name": "State", "value": {"name": rng.choice(STATES)}}],
+        })
+
+
+def convert_without_interning(data: Dict[str, Any]) -> Issue:
+    fields = data.get("customFields") or ()
+    return Issue(data["idReadable"], data["summary"], fields[0]["value"]["name"] if fields else None, data.get("updated"))
+
+
+class Case(NamedTuple):
+    name: str
+    build: Callable[[Iterator[Dict[str, Any]]], Any]
+
+
+CASES = [
+    Case("Issue, без интернирования", lambda items: [convert_without_interning(item) for item in items]),
+    Case("Issue", lambda items: [convert_to_issue(item) for item in items]),
+    Case("CompactIssue", lambda items: [CompactIssue.from_issue(convert_to_issue(item)) for item in items]),
+    Case("IssueTable", lambda items: IssueTable(convert_to_issue(item) for item in items)),
+]
+
+
+def measure(case: Case, count: int, seed: int) -> float:
+    """
+    Замеряет память, удерживаемую контейнером с задачами.
+
+    Args:
+        case (Case): Представление задач.
+        count (int): Число задач.
+        seed (int): Начальное значение генератора случайных чисел.
+
+    Returns:
+        float: Байт на задачу.
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    container = case.build(json.loads(payload) for payload in generate_payloads(count, seed))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(container) == count
+    del container
+    return (current - baseline) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк памяти на одну задачу YouTrack.")
+    parser.add_argument("--issues", type=int, nargs="+", default=[100_000], help="Число задач.")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'issues':>9}  {'case':<28} {'bytes/issue':>12}")
+    for count in args.issues:
+        for case in CASES:
+            print(f"{count:>9}  {case.name:<28} {measure(case, count, args.seed):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Нагрузочный бенчмарк YouTrackClient на локальной замене YouTrack.
+
+Сервер (`FakeYouTrackServer`) запускается на локальном интерфейсе, поэтому бенчмарк работает без сети.
+Для каждого размера списка ID несколько раз вызывается `get_issues` и замеряются issues/s,
+а также p50/p99 времени одного вызова.
+
+Запуск:
+    python -m benchmarks.bench_youtrack_client --sizes 10 100 1000 --latency 0.05 --throttle-rate 0.05
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from src.youtrack.youtrack_client import YouTrackClient
+from src.youtrack.youtrack_fake_server import FakeYouTrackServer, generate_issues
+from src.youtrack.youtrack_scheduler import RequestScheduler
+from typing import List, NamedTuple
+
+
+class Measurement(NamedTuple):
+    size: int
+    calls: int
+    issues_per_second: float
+    p50_ms: float
+    p99_ms: float
+    requests: int
+    retries: int
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Возвращает перцентиль выборки (ближайшее значение сверху).
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def measure(server: FakeYouTrackServer, issue_ids: List[str], size: int, calls: int, seed: int) -> Measurement:
+    """
+    Замеряет последовательные вызовы `get_issues` со случайными списками ID одного размера.
+
+    Args:
+        server (FakeYouTrackServer): Запущенный сервер.
+        issue_ids (List[str]): Все ID задач на сервере.
+        size (int): Размер списка ID в одном вызове.
+        calls (int): Число вызовов.
+        seed (int): Начальное значение генератора случайных чисел.
+
+    Returns:
+        Measurement: Результат замера.
+    """
+    rng = random.Random(seed)
+    scheduler = RequestScheduler(base_delay=0.01)
+    requests_before = len(server.requests)
+    durations = []
+    fetched = 0
+
+    async with YouTrackClient(server.url, "token", scheduler=scheduler) as client:
+        started = time.perf_counter()
+        for _ in range(calls):
+            call_started = time.perf_counter()
+            fetched += len(await client.get_issues(rng.sample(issue_ids, size)))
+            durations.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+
+    return Measurement(
+        size,
+        calls,
+        fetched / elapsed,
+        statistics.median(durations) * 1000,
+        percentile(durations, 0.99) * 1000,
+        len(server.requests) - requests_before,
+        scheduler.retries,
+    )
+
+
+async def run_benchmark(args: argparse.Namespace) -> List[Measurement]:
+    issues = generate_issues(max(args.sizes), seed=args.seed)
+    issue_ids = [issue["idReadable"] for issue in issues]
+    server = FakeYouTrackServer(
+        issues,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=0,
+        seed=args.seed,
+    )
+    async with server:
+        return [await measure(server, issue_ids, size, args.calls, args.seed) for size in args.sizes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузочный бенчмарк YouTrackClient на локальной замене YouTrack.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Размеры списков ID.")
+    parser.add_argument("--calls", type=int, default=20, help="Число вызовов на каждый размер.")
+    parser.add_argument("--latency", type=float, default=0.02, help="Задержка ответа сервера в секундах.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Доля ответов 500.")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Доля ответов 429.")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'ids':>6} {'calls':>6} {'issues/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'requests':>9} {'retries':>8}")
+    for m in asyncio.run(run_benchmark(args)):
+        print(
+            f"{m.size:>6} {m.calls:>6} {m.issues_per_second:>10.0f} {m.p50_ms:>8.1f} {m.p99_ms:>8.1f} "
+            f"{m.requests:>9} {m.retries:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,8 @@ from src import YouTrackClient
 
 
 async def main(youtrack_token: str):
-    client = YouTrackClient("https://yt.skbkontur.ru", youtrack_token)
-    issues = await client.get_issues(["TMOB-166", "TMOB-167"])
+    async with YouTrackClient("https://yt.skbkontur.ru", youtrack_token) as client:
+        issues = await client.get_issues(["TMOB-166", "TMOB-167"])
     for issue in issues:
         print(f"ID: {issue.id}, Title: {issue.title}, State: {issue.state}")
 
@@ -1,7 +1,8 @@
-from .git import GitClient
+from .git import AsyncGitClient, GitClient
 from .youtrack import Issue, YouTrackClient
 
 __all__ = [
+  "AsyncGitClient",
   "GitClient",
   "Issue",
   "YouTrackClient",
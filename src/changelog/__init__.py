@@ -0,0 +1,11 @@
+from .changelog_aggregator import AggregatedChangelogEntry, RepositoryRange, collect_multi_repo_changelog
+from .changelog_pipeline import ChangelogEntry, collect_changelog
+
+
+__all__ = [
+  "AggregatedChangelogEntry",
+  "ChangelogEntry",
+  "RepositoryRange",
+  "collect_changelog",
+  "collect_multi_repo_changelog",
+]
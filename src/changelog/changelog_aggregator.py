@@ -0,0 +1,103 @@
+import asyncio
+from ..git import AsyncGitClient, GitClient, IssueOccurrence, IssueSource
+from ..youtrack import Issue, YouTrackClient
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
+
+
+class RepositoryRange(NamedTuple):
+    """
+    Диапазон коммитов одного репозитория, входящий в общий список изменений.
+    """
+
+    name: str  # Имя репозитория в результате (например, 'ios')
+    git_client: Union[GitClient, AsyncGitClient]
+    commit_from: str
+    commit_to: str
+    target_branch: Optional[str] = None
+
+
+class AggregatedChangelogEntry(NamedTuple):
+    """
+    Задача общего списка изменений с появлениями в каждом репозитории и данными из YouTrack.
+    """
+
+    issue_id: str
+    occurrences: Dict[str, List[IssueOccurrence]]  # Появления задачи по имени репозитория
+    issue: Optional[Issue]  # None, если задача не найдена в YouTrack
+
+
+async def scan_repository(
+    repository: RepositoryRange,
+    project_ids: Sequence[str],
+    sources: Iterable[IssueSource],
+    first_parent: bool,
+) -> List[IssueOccurrence]:
+    """
+    Сканирует диапазон одного репозитория, не блокируя цикл событий.
+
+    `GitClient` выполняет обход в пуле потоков; `AsyncGitClient` — на текущем цикле событий.
+
+    Args:
+        repository (RepositoryRange): Репозиторий и диапазон коммитов.
+        project_ids (Sequence[str]): Префиксы проектов.
+        sources (Iterable[IssueSource]): Источники задач.
+        first_parent (bool): Обходить только цепочку первых родителей `commit_to`.
+
+    Returns:
+        List[IssueOccurrence]: Появления задач в порядке обнаружения.
+    """
+    args = (repository.commit_from, repository.commit_to, project_ids, repository.target_branch, sources, first_parent)
+    if isinstance(repository.git_client, AsyncGitClient):
+        return [occurrence async for occurrence in repository.git_client.iter_issue_occurrences(*args)]
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, lambda: list(repository.git_client.iter_issue_occurrences(*args)))
+
+
+async def collect_multi_repo_changelog(
+    repositories: Sequence[RepositoryRange],
+    youtrack_client: YouTrackClient,
+    project_ids: Iterable[str],
+    sources: Iterable[IssueSource] = tuple(IssueSource),
+    first_parent: bool = False,
+) -> List[AggregatedChangelogEntry]:
+    """
+    Собирает общий список изменений нескольких репозиториев одним запросом данных задач.
+
+    Репозитории сканируются параллельно, идентификаторы задач объединяются с сохранением появлений
+    в каждом репозитории, после чего все уникальные задачи запрашиваются одним вызовом `get_issues`.
+
+    Args:
+        repositories (Sequence[RepositoryRange]): Репозитории и их диапазоны коммитов.
+        youtrack_client (YouTrackClient): Клиент YouTrack.
+        project_ids (Iterable[str]): Префиксы проектов (например, ['TMOB', 'TAND', 'TIOS']).
+        sources (Iterable[IssueSource], optional): Источники задач. По умолчанию все.
+        first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`.
+
+    Returns:
+        List[AggregatedChangelogEntry]: Задачи в порядке первого появления: сначала из первого репозитория,
+            затем новые задачи из следующих.
+
+    Raises:
+        ValueError: Если имена репозиториев повторяются.
+    """
+    names = [repository.name for repository in repositories]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Имена репозиториев должны быть уникальными: {names}")
+
+    project_ids = tuple(project_ids)
+    sources = tuple(sources)
+    scans = await asyncio.gather(
+        *(scan_repository(repository, project_ids, sources, first_parent) for repository in repositories)
+    )
+
+    occurrences: Dict[str, Dict[str, List[IssueOccurrence]]] = {}
+    for name, scan in zip(names, scans):
+        for occurrence in scan:
+            occurrences.setdefault(occurrence.issue_id, {}).setdefault(name, []).append(occurrence)
+
+    issues = {issue.id: issue for issue in await youtrack_client.get_issues(list(occurrences))}
+    return [
+        AggregatedChangelogEntry(issue_id, by_repository, issues.get(issue_id))
+        for issue_id, by_repository in occurrences.items()
+    ]
@@ -0,0 +1,140 @@
+import asyncio
+import threading
+from contextlib import aclosing, closing
+from ..git import AsyncGitClient, GitClient, IssueOccurrence, IssueSource
+from ..youtrack import Issue, YouTrackClient
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+
+# Сколько новых задач набирается, прежде чем отправить их в YouTrack одним вызовом.
+DEFAULT_BATCH_SIZE = 50
+
+# Сколько секунд неполная пачка может ждать новых задач с момента появления в ней первой задачи.
+DEFAULT_BATCH_DELAY = 0.05
+
+
+class ChangelogEntry(NamedTuple):
+    """
+    Задача из диапазона коммитов вместе с данными из YouTrack.
+    """
+
+    occurrence: IssueOccurrence
+    issue: Optional[Issue]  # None, если задача не найдена в YouTrack
+
+
+async def collect_changelog(
+    git_client: Union[GitClient, AsyncGitClient],
+    youtrack_client: YouTrackClient,
+    commit_from: str,
+    commit_to: str,
+    project_ids: Iterable[str],
+    target_branch: Optional[str] = None,
+    sources: Iterable[IssueSource] = tuple(IssueSource),
+    first_parent: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    batch_delay: float = DEFAULT_BATCH_DELAY,
+) -> List[ChangelogEntry]:
+    """
+    Собирает задачи диапазона коммитов и их данные из YouTrack, совмещая обход истории с запросами.
+
+    Обход git выполняется в отдельном потоке (для `AsyncGitClient` — задачей на том же цикле событий)
+    и передает найденные задачи в очередь. Новые задачи
+    набираются в пачки по `batch_size` (неполная пачка отправляется через `batch_delay` секунд после
+    появления в ней первой задачи) и запрашиваются в YouTrack, пока обход продолжается.
+
+    Args:
+        git_client (Union[GitClient, AsyncGitClient]): Клиент репозитория.
+        youtrack_client (YouTrackClient): Клиент YouTrack.
+        commit_from (str): Хеш или имя начального коммита.
+        commit_to (str): Хеш или имя конечного коммита.
+        project_ids (Iterable[str]): Префиксы проектов (например, ['TMOB', 'TAND', 'TIOS']).
+        target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+        sources (Iterable[IssueSource], optional): Источники задач. По умолчанию все.
+        first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`.
+        batch_size (int, optional): Размер пачки задач для одного вызова YouTrack.
+        batch_delay (float, optional): Наибольшее время от появления первой задачи в пачке до ее отправки.
+
+    Returns:
+        List[ChangelogEntry]: Задачи в порядке обнаружения (задача, найденная в обоих источниках,
+            встречается дважды, но запрашивается один раз).
+    """
+    loop = asyncio.get_running_loop()
+    found: asyncio.Queue = asyncio.Queue()
+    stopped = threading.Event()
+
+    def walk():
+        try:
+            occurrences = git_client.iter_issue_occurrences(
+                commit_from, commit_to, project_ids, target_branch, sources, first_parent
+            )
+            # closing: при остановке обход прерывается, а процесс `git log` завершается сразу
+            with closing(occurrences):
+                for occurrence in occurrences:
+                    if stopped.is_set():
+                        return
+                    loop.call_soon_threadsafe(found.put_nowait, occurrence)
+        finally:
+            loop.call_soon_threadsafe(found.put_nowait, None)
+
+    async def walk_async():
+        try:
+            occurrences = git_client.iter_issue_occurrences(
+                commit_from, commit_to, project_ids, target_branch, sources, first_parent
+            )
+            async with aclosing(occurrences):
+                async for occurrence in occurrences:
+                    found.put_nowait(occurrence)
+        finally:
+            found.put_nowait(None)
+
+    if isinstance(git_client, AsyncGitClient):
+        walker = asyncio.create_task(walk_async())
+    else:
+        walker = loop.run_in_executor(None, walk)
+    occurrences: List[IssueOccurrence] = []
+    fetches: List[asyncio.Task] = []
+    pending: List[str] = []
+    deadline = 0.0  # Время отправки неполной пачки
+    seen = set()
+
+    def send_pending():
+        if pending:
+            fetches.append(asyncio.create_task(youtrack_client.get_issues(list(pending))))
+            pending.clear()
+
+    try:
+        while True:
+            try:
+                if pending:
+                    occurrence = await asyncio.wait_for(found.get(), max(0.0, deadline - loop.time()))
+                else:
+                    occurrence = await found.get()
+            except asyncio.TimeoutError:
+                send_pending()
+                continue
+
+            if occurrence is None:
+                break
+
+            occurrences.append(occurrence)
+            if occurrence.issue_id not in seen:
+                seen.add(occurrence.issue_id)
+                if not pending:
+                    deadline = loop.time() + batch_delay
+                pending.append(occurrence.issue_id)
+                if len(pending) >= batch_size:
+                    send_pending()
+
+        send_pending()
+        await walker  # Пробрасывает ошибку обхода, если она была
+        issues: Dict[str, Issue] = {
+            issue.id: issue for batch in await asyncio.gather(*fetches) for issue in batch
+        }
+    except BaseException:
+        stopped.set()
+        walker.cancel()
+        for fetch in fetches:
+            fetch.cancel()
+        raise
+
+    return [ChangelogEntry(occurrence, issues.get(occurrence.issue_id)) for occurrence in occurrences]
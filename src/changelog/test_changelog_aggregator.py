@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+import shutil
+from ..git import AsyncGitClient, GitClient, IssueSource
+from ..git.git_repo_builder import create_release_builder
+from ..youtrack import YouTrackClient
+from ..youtrack.youtrack_fake_server import FakeYouTrackServer, generate_issues
+from .changelog_aggregator import RepositoryRange, collect_multi_repo_changelog
+
+
+def create_repo(issue_numbers) -> str:
+    """
+    Создает изменяемый репозиторий с релизной веткой, в которую слиты фича-ветки указанных задач.
+    """
+    return create_release_builder(f"TMOB-{number}" for number in issue_numbers).build(cache_root=None)
+
+
+def test_collect_multi_repo_changelog_fetches_shared_issues_once():
+    """
+    Проверяем, что задачи нескольких репозиториев объединяются и запрашиваются одним запросом.
+    """
+    repo_dirs = [create_repo([1, 2]), create_repo([3, 2, 404]), create_repo([1])]
+    repositories = [
+        RepositoryRange("ios", GitClient(repo_dirs[0]), "v1.0.0", "release/v1.1.0"),
+        RepositoryRange("android", AsyncGitClient(repo_dirs[1]), "v1.0.0", "release/v1.1.0"),
+        # Индекс коммитов открыт в текущем потоке, а обход выполняется в пуле потоков
+        RepositoryRange("core", GitClient(repo_dirs[2], use_commit_index=True), "v1.0.0", "release/v1.1.0"),
+    ]
+
+    async def run():
+        async with FakeYouTrackServer(generate_issues(5)) as server:
+            async with YouTrackClient(server.url, "token") as youtrack_client:
+                entries = await collect_multi_repo_changelog(
+                    repositories, youtrack_client, ["TMOB"], sources=[IssueSource.MERGE_BRANCH]
+                )
+        return server, entries
+
+    try:
+        server, entries = asyncio.run(run())
+    finally:
+        for repo_dir in repo_dirs:
+            shutil.rmtree(repo_dir)
+
+    assert [(entry.issue_id, list(entry.occurrences)) for entry in entries] == [
+        ("TMOB-1", ["ios", "core"]),
+        ("TMOB-2", ["ios", "android"]),
+        ("TMOB-3", ["android"]),
+        ("TMOB-404", ["android"]),
+    ]
+    assert [entry.issue.title if entry.issue else None for entry in entries] == [
+        "Задача 1", "Задача 2", "Задача 3", None
+    ]
+    assert entries[1].occurrences["android"][0].source == IssueSource.MERGE_BRANCH
+    assert len(server.requests) == 1
+
+
+def test_collect_multi_repo_changelog_rejects_duplicate_names():
+    """
+    Проверяем, что повторяющиеся имена репозиториев отклоняются до сканирования.
+    """
+    client = AsyncGitClient("/nonexistent")  # Сканирование не должно начаться
+    repositories = [
+        RepositoryRange("ios", client, "v1.0.0", "release/v1.1.0"),
+        RepositoryRange("ios", client, "v1.0.0", "release/v1.1.0"),
+    ]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect_multi_repo_changelog(repositories, YouTrackClient("http://localhost", "token"), ["TMOB"]))
@@ -0,0 +1,141 @@
+import asyncio
+import pytest
+import shutil
+import threading
+import time
+from ..git import AsyncGitClient, GitClient, IssueOccurrence, IssueSource
+from ..git.git_repo_builder import create_release_builder
+from ..youtrack import YouTrackClient
+from ..youtrack.youtrack_fake_server import FakeYouTrackServer, generate_issues
+from .changelog_pipeline import collect_changelog
+
+
+@pytest.mark.parametrize("create_git_client", [
+    GitClient,
+    AsyncGitClient,
+    lambda repo_dir: GitClient(repo_dir, use_commit_index=True),  # Индекс открыт в другом потоке, чем обход
+], ids=["git_client", "async_git_client", "commit_index"])
+def test_collect_changelog_fetches_issues_while_walking_history(create_git_client):
+    """
+    Проверяем, что конвейер запрашивает каждую задачу один раз и сохраняет порядок обнаружения.
+    """
+    builder = create_release_builder(["TMOB-3", "TMOB-1", "TMOB-2"])
+    builder.commit("TMOB-404 message 1") # Задача, которой нет в YouTrack
+
+    # Создаем изменяемый тестовый репозиторий: индекс коммитов пишется в его каталог `.git`
+    repo_dir = builder.build(cache_root=None)
+    git_client = create_git_client(repo_dir)
+
+    async def run():
+        async with FakeYouTrackServer(generate_issues(5)) as server:
+            async with YouTrackClient(server.url, "token") as youtrack_client:
+                entries = await collect_changelog(
+                    git_client, youtrack_client, "v1.0.0", "release/v1.1.0", ["TMOB"], batch_size=2
+                )
+        return server, entries
+
+    try:
+        server, entries = asyncio.run(run())
+    finally:
+        shutil.rmtree(repo_dir)
+
+    assert [(entry.occurrence.issue_id, entry.occurrence.source) for entry in entries] == [
+        ("TMOB-3", IssueSource.COMMIT_MESSAGE),
+        ("TMOB-3", IssueSource.MERGE_BRANCH),
+        ("TMOB-1", IssueSource.COMMIT_MESSAGE),
+        ("TMOB-1", IssueSource.MERGE_BRANCH),
+        ("TMOB-2", IssueSource.COMMIT_MESSAGE),
+        ("TMOB-2", IssueSource.MERGE_BRANCH),
+        ("TMOB-404", IssueSource.COMMIT_MESSAGE),
+    ]
+    assert [entry.issue.title if entry.issue else None for entry in entries[::2]] == [
+        "Задача 3", "Задача 1", "Задача 2", None
+    ]
+    requested = [issue_id for request in server.requests for issue_id in request["query"].split(" OR ")]
+    assert sorted(requested) == sorted(f"issue id: TMOB-{number}" for number in [3, 1, 2, 404])
+
+
+class SlowGitClient:
+    """
+    Клиент, который находит задачи TMOB-1..TMOB-<count> по одной с интервалом `interval` секунд.
+    """
+
+    def __init__(self, count: int, interval: float):
+        self.count = count
+        self.interval = interval
+        self.finished = threading.Event()
+        self.closed = threading.Event()
+
+    def iter_issue_occurrences(self, *args):
+        return SlowOccurrences(self)
+
+
+class SlowOccurrences:
+    def __init__(self, client: SlowGitClient):
+        self.client = client
+        self.number = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> IssueOccurrence:
+        if self.number == self.client.count:
+            self.client.finished.set()
+            raise StopIteration
+        time.sleep(self.client.interval)
+        self.number += 1
+        return IssueOccurrence(f"TMOB-{self.number}", "TMOB", IssueSource.COMMIT_MESSAGE, "0" * 40)
+
+    def close(self):
+        self.client.closed.set()
+
+
+class RecordingYouTrackClient:
+    """
+    Клиент YouTrack, запоминающий запрошенные пачки и то, завершился ли к этому моменту обход.
+    """
+
+    def __init__(self, git_client: SlowGitClient):
+        self.git_client = git_client
+        self.calls = []
+
+    async def get_issues(self, issue_ids):
+        self.calls.append((list(issue_ids), self.git_client.finished.is_set()))
+        return []
+
+
+def test_collect_changelog_flushes_steady_trickle():
+    """
+    Проверяем, что неполная пачка отправляется по истечении `batch_delay` с появления первой задачи,
+    даже если новые задачи приходят чаще `batch_delay`.
+    """
+    git_client = SlowGitClient(count=10, interval=0.02)
+    youtrack_client = RecordingYouTrackClient(git_client)
+
+    asyncio.run(collect_changelog(git_client, youtrack_client, "a", "b", ["TMOB"], batch_size=100, batch_delay=0.05))
+
+    assert len(youtrack_client.calls) > 1
+    assert youtrack_client.calls[0][1] is False  # Первая пачка отправлена до завершения обхода
+    assert [issue_id for issue_ids, _ in youtrack_client.calls for issue_id in issue_ids] == [
+        f"TMOB-{number}" for number in range(1, 11)
+    ]
+
+
+def test_collect_changelog_closes_walk_when_cancelled():
+    """
+    Проверяем, что при отмене сборки обход истории останавливается и закрывается.
+    """
+    git_client = SlowGitClient(count=1000, interval=0.005)
+    youtrack_client = RecordingYouTrackClient(git_client)
+
+    async def run():
+        collecting = asyncio.create_task(collect_changelog(git_client, youtrack_client, "a", "b", ["TMOB"]))
+        await asyncio.sleep(0.05)
+        collecting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await collecting
+
+    asyncio.run(run())
+
+    assert git_client.closed.wait(1.0)
+    assert not git_client.finished.is_set()
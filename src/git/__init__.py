@@ -1,6 +1,23 @@
+from .git_async_client import AsyncGitClient
+from .git_batch import ChangelogJob
+from .git_checkpoint import Checkpoint, CheckpointStore
 from .git_client import GitClient
+from .git_commit_index import CommitIndex
+from .git_refs import RefResolver
+from .git_release_index import ReleaseGraphIndex
+from .git_scan import IssueOccurrence, IssueScanResult, IssueSource
 
 
 __all__ = [
+  "AsyncGitClient",
+  "ChangelogJob",
+  "Checkpoint",
+  "CheckpointStore",
+  "CommitIndex",
   "GitClient",
+  "IssueOccurrence",
+  "IssueScanResult",
+  "IssueSource",
+  "RefResolver",
+  "ReleaseGraphIndex",
 ]
@@ -0,0 +1,223 @@
+import asyncio
+from contextlib import aclosing
+from git.exc import GitCommandError
+from .git_helpers import get_issue_id_matcher, parse_commit
+from .git_log_walker import CHUNK_SIZE, CommitRecord, CommitRecordParser, WalkOptions, build_log_args
+from .git_scan import IssueOccurrence, IssueScanner, IssueScanResult, IssueSource
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
+
+class AsyncGitClient:
+    """
+    Асинхронный клиент для работы с локальным Git-репозиторием.
+
+    История обходится процессом `git log`, запущенным через `asyncio.create_subprocess_exec`, а его вывод
+    разбирается по мере чтения. Обход не блокирует цикл событий, поэтому на одном цикле можно
+    одновременно сканировать несколько репозиториев и выполнять HTTP-запросы.
+    """
+
+    def __init__(self, repo_path: str, git_executable: str = "git"):
+        """
+        Инициализирует AsyncGitClient для указанного пути репозитория.
+
+        Args:
+            repo_path (str): Путь к локальному Git-репозиторию.
+            git_executable (str, optional): Путь к исполняемому файлу git.
+        """
+        self.repo_path = repo_path
+        self.git_executable = git_executable
+
+    async def iter_commit_records(self, *revs: str, options: Iterable[str] = ()) -> AsyncIterator[CommitRecord]:
+        """
+        Обходит диапазон коммитов одним процессом `git log`, разбирая его вывод потоково.
+
+        Args:
+            *revs (str): Диапазоны или ревизии (например, 'v1.0.0..release/v1.1.0').
+            options (Iterable[str], optional): Дополнительные параметры `git log` (например, '--merges').
+
+        Yields:
+            CommitRecord: Коммиты в порядке от старого к новому.
+
+        Raises:
+            git.exc.GitCommandError: Если `git log` завершился с ошибкой.
+        """
+        command = [self.git_executable, "log", *build_log_args(*revs, options=options)]
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=self.repo_path,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # stderr читается параллельно, чтобы переполненный канал не остановил git
+        stderr = asyncio.ensure_future(process.stderr.read())
+        try:
+            parser = CommitRecordParser()
+            while chunk := await process.stdout.read(CHUNK_SIZE):
+                for record in parser.feed(chunk):
+                    yield record
+            for record in parser.close():
+                yield record
+
+            if await process.wait() != 0:
+                raise GitCommandError(command, process.returncode, await stderr)
+        finally:
+            if process.returncode is None:  # Обход прерван потребителем
+                process.kill()
+                await process.wait()
+            if not stderr.done():
+                stderr.cancel()
+
+    async def iter_issue_occurrences(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_ids: Iterable[str],
+        target_branch: Optional[str] = None,
+        sources: Iterable[IssueSource] = tuple(IssueSource),
+        first_parent: bool = False,
+    ) -> AsyncIterator[IssueOccurrence]:
+        """
+        Потоково сканирует диапазон коммитов, выдавая задачи сразу по мере их обнаружения.
+
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_ids (Iterable[str]): Префиксы проектов (например, ['TMOB', 'TAND', 'TIOS']).
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+            sources (Iterable[IssueSource], optional): Источники задач. По умолчанию все.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`.
+
+        Yields:
+            IssueOccurrence: Первые появления задач в порядке от старых коммитов к новым.
+        """
+        scanner = IssueScanner(get_issue_id_matcher(tuple(project_ids)), target_branch, sources)
+        async with aclosing(self.__scan_range(scanner, commit_from, commit_to, first_parent)) as occurrences:
+            async for occurrence in occurrences:
+                yield occurrence
+
+    async def scan_issue_ids_by_project(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_ids: Iterable[str],
+        target_branch: Optional[str] = None,
+        sources: Iterable[IssueSource] = tuple(IssueSource),
+        first_parent: bool = False,
+    ) -> Dict[str, IssueScanResult]:
+        """
+        Сканирует диапазон коммитов за один проход сразу для нескольких проектов (см. `GitClient`).
+
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_ids (Iterable[str]): Префиксы проектов (например, ['TMOB', 'TAND', 'TIOS']).
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+            sources (Iterable[IssueSource], optional): Источники задач. По умолчанию все.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`.
+
+        Returns:
+            Dict[str, IssueScanResult]: Результат сканирования для каждого проекта.
+        """
+        scanner = IssueScanner(get_issue_id_matcher(tuple(project_ids)), target_branch, sources)
+        async for _ in self.__scan_range(scanner, commit_from, commit_to, first_parent):
+            pass
+
+        return scanner.results
+
+    async def scan_issue_ids(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_id: str,
+        target_branch: Optional[str] = None,
+        sources: Iterable[IssueSource] = tuple(IssueSource),
+        first_parent: bool = False,
+    ) -> IssueScanResult:
+        """
+        Сканирует диапазон коммитов за один проход для одного проекта (см. `GitClient`).
+
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_id (str): Префикс проекта для идентификации задач (например, 'PROJECT').
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+            sources (Iterable[IssueSource], optional): Источники задач. По умолчанию все.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`.
+
+        Returns:
+            IssueScanResult: Задачи из выбранных источников с коммитом, в котором каждая встретилась впервые.
+        """
+        results = await self.scan_issue_ids_by_project(
+            commit_from, commit_to, [project_id], target_branch, sources, first_parent
+        )
+        return results[project_id]
+
+    async def get_issue_id_list_from_merge_commits(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_id: str,
+        target_branch: Optional[str] = None,
+        first_parent: bool = False,
+    ) -> List[str]:
+        """
+        Возвращает список идентификаторов задач (issue ID) из мерж-коммитов в указанном диапазоне.
+
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_id (str): Префикс проекта для идентификации задач (например, 'PROJECT').
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`.
+
+        Returns:
+            List[str]: Список идентификаторов задач, связанных с мерж-коммитами в указанном диапазоне.
+        """
+        sources = [IssueSource.MERGE_BRANCH]
+        result = await self.scan_issue_ids(commit_from, commit_to, project_id, target_branch, sources, first_parent)
+        return result.merge_issue_ids
+
+    async def get_issue_id_list_from_commit_messages(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_id: str,
+        target_branch: Optional[str] = None,
+        first_parent: bool = False,
+    ) -> List[str]:
+        """
+        Возвращает список идентификаторов задач (issue ID) из сообщений коммитов в указанном диапазоне.
+
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_id (str): Префикс проекта для идентификации задач (например, 'PROJECT').
+            target_branch (Optional[str], optional): Принимается для совместимости с `GitClient`:
+                сообщения обычных коммитов по целевой ветке не фильтруются.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`.
+
+        Returns:
+            List[str]: Список идентификаторов задач, найденных в сообщениях коммитов в указанном диапазоне.
+        """
+        sources = [IssueSource.COMMIT_MESSAGE]
+        result = await self.scan_issue_ids(commit_from, commit_to, project_id, sources=sources, first_parent=first_parent)
+        return result.commit_message_issue_ids
+
+    async def __scan_range(
+        self, scanner: IssueScanner, commit_from: str, commit_to: str, first_parent: bool
+    ) -> AsyncIterator[IssueOccurrence]:
+        """
+        Передает сканеру коммиты диапазона, отбираемые самим git по настройкам сканера.
+
+        Yields:
+            IssueOccurrence: Новые задачи, найденные сканером.
+        """
+        options: WalkOptions = scanner.walk_options()._replace(first_parent=first_parent)
+        records = self.iter_commit_records(f"{commit_from}..{commit_to}", options=options.to_args())
+        async with aclosing(records):
+            async for record in records:
+                for occurrence in scanner.feed_parsed(parse_commit(record)):
+                    yield occurrence
@@ -0,0 +1,112 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from git import Repo
+from .git_scan import IssueScanResult
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence
+
+if TYPE_CHECKING:
+    from .git_client import GitClient
+
+
+class ChangelogJob(NamedTuple):
+    """
+    Задание на формирование списка задач для одного диапазона коммитов.
+    """
+
+    commit_from: str
+    commit_to: str
+    project_id: str
+    target_branch: Optional[str] = None
+
+
+# Клиент процесса-воркера: создается один раз на процесс и переиспользуется для всех его заданий.
+_worker_client: Optional["GitClient"] = None
+
+
+def _init_worker(repo_path: str, options: Dict[str, Any]):
+    from .git_client import GitClient
+
+    global _worker_client
+    _worker_client = GitClient(repo_path, **options)
+
+
+def _run_job(job: ChangelogJob) -> IssueScanResult:
+    return _worker_client.scan_issue_ids(*job)
+
+
+def get_repo_path(repo: Repo) -> str:
+    """
+    Возвращает путь, по которому репозиторий можно открыть в другом процессе.
+
+    Args:
+        repo (Repo): Репозиторий.
+
+    Returns:
+        str: Путь к рабочему каталогу или, для bare-репозитория, к каталогу `.git`.
+    """
+    return repo.working_tree_dir or repo.git_dir
+
+
+def get_client_options(client: "GitClient") -> Dict[str, Any]:
+    """
+    Возвращает настройки клиента, с которыми воркер создает собственный `GitClient`.
+
+    Args:
+        client (GitClient): Клиент.
+
+    Returns:
+        Dict[str, Any]: Именованные аргументы конструктора `GitClient`, кроме пути к репозиторию.
+    """
+    return {"use_git_log": client.use_git_log, "use_commit_index": client.commit_index is not None}
+
+
+def run_changelog_jobs(
+    client: "GitClient", jobs: Sequence[ChangelogJob], max_workers: Optional[int] = None
+) -> List[IssueScanResult]:
+    """
+    Выполняет задания на пуле процессов, по одному экземпляру `Repo` на процесс.
+
+    Если доступен только один воркер, заданий меньше двух, пул процессов не удалось запустить
+    или его процесс аварийно завершился, задания выполняются последовательно в текущем процессе.
+    Ошибки самих заданий передаются вызывающему.
+
+    Args:
+        client (GitClient): Клиент, репозиторий и настройки которого используются воркерами.
+        jobs (Sequence[ChangelogJob]): Задания.
+        max_workers (Optional[int], optional): Число процессов. Если None, используется число процессоров.
+
+    Returns:
+        List[IssueScanResult]: Результаты в порядке заданий.
+
+    Raises:
+        git.exc.GitCommandError: Если задание завершилось ошибкой git.
+    """
+    jobs = [ChangelogJob(*job) for job in jobs]
+
+    def scan_serially() -> List[IssueScanResult]:
+        return [client.scan_issue_ids(*job) for job in jobs]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return scan_serially()
+
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(get_repo_path(client.repo), get_client_options(client)),
+        )
+    except (NotImplementedError, OSError):  # Платформа не поддерживает пул процессов
+        return scan_serially()
+
+    with executor:
+        try:
+            # Процессы запускаются при отправке заданий, а ошибки заданий — только при чтении результатов
+            results = executor.map(_run_job, jobs)
+        except (BrokenProcessPool, OSError):
+            return scan_serially()
+        try:
+            return list(results)
+        except BrokenProcessPool:
+            return scan_serially()
@@ -0,0 +1,160 @@
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from git import Repo
+from .git_scan import IssueOccurrence, IssueScanResult, IssueSource
+from typing import NamedTuple, Optional
+
+
+# Имя файла контрольных точек внутри каталога `.git` репозитория.
+CHECKPOINTS_FILE_NAME = "auto-changelog-checkpoints.sqlite"
+
+
+class Checkpoint(NamedTuple):
+    """
+    Результат сканирования диапазона `base..head`, сохраненный для продолжения на следующем запуске.
+    """
+
+    base: str  # Хеш начального коммита диапазона
+    head: str  # Хеш последнего обработанного коммита
+    result: IssueScanResult
+
+
+def dump_scan_result(result: IssueScanResult) -> str:
+    """
+    Сериализует результат сканирования одного проекта в JSON, сохраняя порядок задач.
+
+    Args:
+        result (IssueScanResult): Результат сканирования.
+
+    Returns:
+        str: JSON вида `{"merge_commits": [[issue_id, commit], ...], "commit_messages": [...]}`.
+    """
+    return json.dumps({
+        "merge_commits": [[o.issue_id, o.commit] for o in result.merge_commits.values()],
+        "commit_messages": [[o.issue_id, o.commit] for o in result.commit_messages.values()],
+    })
+
+
+def load_scan_result(data: str, project_id: str) -> IssueScanResult:
+    """
+    Восстанавливает результат сканирования, сериализованный `dump_scan_result`.
+
+    Args:
+        data (str): JSON результата.
+        project_id (str): Префикс проекта, к которому относится результат.
+
+    Returns:
+        IssueScanResult: Результат сканирования.
+    """
+    parsed = json.loads(data)
+
+    def load(key: str, source: IssueSource) -> "OrderedDict[str, IssueOccurrence]":
+        return OrderedDict(
+            (issue_id, IssueOccurrence(issue_id, project_id, source, commit)) for issue_id, commit in parsed[key]
+        )
+
+    return IssueScanResult(
+        merge_commits=load("merge_commits", IssueSource.MERGE_BRANCH),
+        commit_messages=load("commit_messages", IssueSource.COMMIT_MESSAGE),
+    )
+
+
+class CheckpointStore:
+    """
+    Постоянное хранилище контрольных точек по ключу `(branch, project_id, target_branch)`.
+
+    Хранилище можно использовать из нескольких потоков: обращения к соединению выполняются под блокировкой.
+    """
+
+    def __init__(self, path: str):
+        """
+        Открывает (или создает) хранилище по указанному пути.
+
+        Args:
+            path (str): Путь к файлу SQLite.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                branch TEXT NOT NULL,
+                project_id TEXT NOT NULL,
+                target_branch TEXT NOT NULL,
+                base TEXT NOT NULL,
+                head TEXT NOT NULL,
+                result TEXT NOT NULL,
+                PRIMARY KEY (branch, project_id, target_branch)
+            ) WITHOUT ROWID
+            """
+        )
+
+    @classmethod
+    def for_repo(cls, repo: Repo) -> "CheckpointStore":
+        """
+        Открывает хранилище, расположенное в каталоге `.git` репозитория.
+
+        Args:
+            repo (Repo): Репозиторий.
+
+        Returns:
+            CheckpointStore: Хранилище репозитория.
+        """
+        return cls(os.path.join(repo.common_dir, CHECKPOINTS_FILE_NAME))
+
+    def get(self, branch: str, project_id: str, target_branch: Optional[str]) -> Optional[Checkpoint]:
+        """
+        Возвращает контрольную точку, если она сохранена.
+
+        Args:
+            branch (str): Имя сканируемой ветки.
+            project_id (str): Префикс проекта.
+            target_branch (Optional[str]): Имя целевой ветки для фильтрации merge-коммитов.
+
+        Returns:
+            Optional[Checkpoint]: Контрольная точка или None.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT base, head, result FROM checkpoints WHERE branch = ? AND project_id = ? AND target_branch = ?",
+                (branch, project_id, target_branch or ""),
+            ).fetchone()
+        if row is None:
+            return None
+
+        base, head, result = row
+        return Checkpoint(base, head, load_scan_result(result, project_id))
+
+    def put(self, branch: str, project_id: str, target_branch: Optional[str], checkpoint: Checkpoint):
+        """
+        Сохраняет контрольную точку, заменяя предыдущую.
+
+        Args:
+            branch (str): Имя сканируемой ветки.
+            project_id (str): Префикс проекта.
+            target_branch (Optional[str]): Имя целевой ветки для фильтрации merge-коммитов.
+            checkpoint (Checkpoint): Контрольная точка.
+        """
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    branch,
+                    project_id,
+                    target_branch or "",
+                    checkpoint.base,
+                    checkpoint.head,
+                    dump_scan_result(checkpoint.result),
+                ),
+            )
+
+    def close(self):
+        """
+        Закрывает соединение с хранилищем.
+        """
+        with self.lock:
+            self.connection.close()
@@ -1,13 +1,14 @@
-from collections import OrderedDict
 from git import Repo, Commit
-from .git_helpers import (
-    is_merge_commit,
-    extract_target_branch_name,
-    extract_source_branch_name,
-    extract_issue_id_from_branch_name,
-    extract_issue_id_from_commit_message,
-)
-from typing import List, Optional
+from git.exc import GitCommandError
+from .git_batch import ChangelogJob, run_changelog_jobs
+from .git_checkpoint import Checkpoint, CheckpointStore
+from .git_commit_index import CommitIndex
+from .git_log_walker import CommitRecord, WalkOptions, iter_commit_records
+from .git_helpers import ParsedCommit, get_issue_id_matcher, parse_commit
+from .git_refs import RefResolver
+from .git_release_index import ReleaseGraphIndex
+from .git_scan import IssueOccurrence, IssueScanner, IssueScanResult, IssueSource
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
 
 class GitClient:
@@ -15,34 +16,99 @@ class GitClient:
     Клиент для работы с локальным Git-репозиторием.
     """
 
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, use_git_log: bool = True, use_commit_index: bool = False):
         """
         Инициализирует GitClient для указанного пути репозитория.
 
         Args:
             repo_path (str): Путь к локальному Git-репозиторию.
+            use_git_log (bool, optional): Обходить историю одним процессом `git log` с потоковым разбором вывода.
+                Если False, используются объекты Commit из GitPython.
+            use_commit_index (bool, optional): Хранить разобранные коммиты в постоянном индексе в каталоге `.git`
+                и разбирать только новые коммиты.
         """
         self.repo = Repo(repo_path)
+        self.refs = RefResolver(self.repo)
+        self.use_git_log = use_git_log
+        self.commit_index = CommitIndex.for_repo(self.repo) if use_commit_index else None
+        self.release_index: Optional[ReleaseGraphIndex] = None
+        self.checkpoints: Optional[CheckpointStore] = None  # Открывается при первом инкрементальном сканировании
 
-    def __get_commits_from_range(self, commit_from: str, commit_to: str) -> List[Commit]:
+    def build_release_index(
+        self, project_id: str, target_branch: Optional[str] = None, tags: Optional[Iterable[str]] = None
+    ) -> ReleaseGraphIndex:
         """
-        Возвращает список коммитов в указанном диапазоне.
+        Строит индекс релизного графа за один обход истории и сохраняет его в `release_index`.
+
+        Индекс отвечает на запросы между тегами без обращения к git через собственные методы
+        (`release_index.get_merge_issue_ids` и т.п.). Методы `get_issue_id_list_*` его не используют:
+        разность множеств не включает задачи, повторно встретившиеся в новых коммитах, и упорядочивает
+        задачи по общему топологическому обходу, а не по обходу диапазона.
+
+        Args:
+            project_id (str): Префикс проекта для идентификации задач (например, 'PROJECT').
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+            tags (Optional[Iterable[str]], optional): Имена индексируемых тегов. Если None, индексируются все теги.
+
+        Returns:
+            ReleaseGraphIndex: Построенный индекс.
+        """
+        self.release_index = ReleaseGraphIndex.build(self.repo, project_id, target_branch, tags, self.refs)
+        return self.release_index
+
+    def __get_commits_from_range(
+        self, commit_from: str, commit_to: str, options: WalkOptions = WalkOptions()
+    ) -> Iterator[Union[Commit, CommitRecord]]:
+        """
+        Возвращает коммиты в указанном диапазоне.
 
         Args:
             commit_from (str): Хеш или имя начального коммита.
             commit_to (str): Хеш или имя конечного коммита.
+            options (WalkOptions, optional): Фильтры, применяемые самим git.
 
         Returns:
-            List[Commit]: Список коммитов в порядке от старого к новому.
+            Iterator[Union[Commit, CommitRecord]]: Коммиты в порядке от старого к новому.
         """
-        commits = list(self.repo.iter_commits(f"{commit_from}..{commit_to}"))
-        return list(reversed(commits))  # Возвращает коммиты в порядке возрастания по дате.
+        rev_range = f"{commit_from}..{commit_to}"
+        if self.use_git_log:
+            return iter_commit_records(self.repo, rev_range, options=options.to_args())
 
-    def get_issue_id_list_from_merge_commits(
-        self, commit_from: str, commit_to: str, project_id: str, target_branch: Optional[str] = None
-    ) -> List[str]:
+        commits = list(self.repo.iter_commits(rev_range, **options.to_kwargs()))
+        return reversed(commits)  # Возвращает коммиты в порядке возрастания по дате.
+
+    def __get_parsed_commits_from_range(
+        self, commit_from: str, commit_to: str, options: WalkOptions = WalkOptions()
+    ) -> Iterator[ParsedCommit]:
         """
-        Возвращает список идентификаторов задач (issue ID) из мерж-коммитов в указанном диапазоне.
+        Возвращает разобранные коммиты в указанном диапазоне, используя индекс коммитов, если он включен.
+
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            options (WalkOptions, optional): Фильтры, применяемые самим git.
+
+        Returns:
+            Iterator[ParsedCommit]: Разобранные коммиты в порядке от старого к новому.
+        """
+        if self.commit_index is not None:
+            return self.commit_index.iter_range(self.repo, f"{commit_from}..{commit_to}", options.to_args())
+
+        return map(parse_commit, self.__get_commits_from_range(commit_from, commit_to, options))
+
+    def scan_issue_ids(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_id: str,
+        target_branch: Optional[str] = None,
+        sources: Iterable[IssueSource] = tuple(IssueSource),
+        first_parent: bool = False,
+    ) -> IssueScanResult:
+        """
+        Сканирует диапазон коммитов за один проход и извлекает идентификаторы задач (issue ID)
+        как из мерж-коммитов, так и из сообщений обычных коммитов.
 
         Args:
             commit_from (str): Хеш или имя начального коммита.
@@ -50,33 +116,211 @@ class GitClient:
             project_id (str): Префикс проекта для идентификации задач (например, 'PROJECT').
             target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
                 Если None, фильтрация по ветке не выполняется.
+            sources (Iterable[IssueSource], optional): Источники задач. По умолчанию все; если выбран один
+                источник, git отдает только подходящие для него коммиты.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`, то есть
+                только коммиты, попавшие непосредственно в эту ветку.
 
         Returns:
-            List[str]: Список идентификаторов задач, связанных с мерж-коммитами в указанном диапазоне.
+            IssueScanResult: Задачи из выбранных источников с коммитом, в котором каждая встретилась впервые.
+        """
+        results = self.scan_issue_ids_by_project(commit_from, commit_to, [project_id], target_branch, sources, first_parent)
+        return results[project_id]
+
+    def scan_issue_ids_by_project(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_ids: Iterable[str],
+        target_branch: Optional[str] = None,
+        sources: Iterable[IssueSource] = tuple(IssueSource),
+        first_parent: bool = False,
+    ) -> Dict[str, IssueScanResult]:
+        """
+        Сканирует диапазон коммитов за один проход сразу для нескольких проектов.
+
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_ids (Iterable[str]): Префиксы проектов (например, ['TMOB', 'TAND', 'TIOS']).
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+            sources (Iterable[IssueSource], optional): Источники задач. По умолчанию все; если выбран один
+                источник, git отдает только подходящие для него коммиты.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`, то есть
+                только коммиты, попавшие непосредственно в эту ветку.
+
+        Returns:
+            Dict[str, IssueScanResult]: Результат сканирования для каждого проекта.
+        """
+        scanner = IssueScanner(get_issue_id_matcher(tuple(project_ids)), target_branch, sources)
+        for _ in self.__scan_range(scanner, commit_from, commit_to, first_parent):
+            pass
+
+        return scanner.results
+
+    def scan_issue_ids_since_checkpoint(
+        self, commit_from: str, branch: str, project_id: str, target_branch: Optional[str] = None
+    ) -> IssueScanResult:
+        """
+        Сканирует диапазон `commit_from..branch`, продолжая с контрольной точки предыдущего запуска.
+
+        Контрольная точка (последний обработанный коммит и найденные задачи) хранится в каталоге `.git`
+        отдельно для каждой тройки `(branch, project_id, target_branch)`. Если начальный коммит не изменился,
+        а коммит контрольной точки остается предком `branch`, обходятся только новые коммиты, и найденные
+        в них задачи дописываются к сохраненным. Иначе (например, после force-push) диапазон сканируется заново.
+
+        Args:
+            commit_from (str): Хеш или имя начального коммита (например, базового тега).
+            branch (str): Имя сканируемой ветки.
+            project_id (str): Префикс проекта для идентификации задач (например, 'PROJECT').
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+
+        Returns:
+            IssueScanResult: Задачи диапазона в порядке первого появления с учетом предыдущих запусков.
+        """
+        if self.checkpoints is None:
+            self.checkpoints = CheckpointStore.for_repo(self.repo)
+
+        base, head = self.__resolve(commit_from, branch)
+        checkpoint = self.checkpoints.get(branch, project_id, target_branch)
+        if checkpoint and checkpoint.base == base and checkpoint.head == head:
+            return checkpoint.result
+
+        scanner = IssueScanner(get_issue_id_matcher((project_id,)), target_branch)
+        walk_from = base
+        if (
+            checkpoint
+            and checkpoint.base == base
+            and self.__is_ancestor(base, checkpoint.head)
+            and self.__is_ancestor(checkpoint.head, head)
+        ):
+            scanner.results[project_id] = checkpoint.result
+            walk_from = checkpoint.head
+
+        for _ in self.__scan_range(scanner, walk_from, head, first_parent=False):
+            pass
+
+        result = scanner.results[project_id]
+        self.checkpoints.put(branch, project_id, target_branch, Checkpoint(base, head, result))
+        return result
+
+    def __is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """
+        Проверяет, достижим ли коммит `ancestor` из `descendant`.
+
+        Returns:
+            bool: False, в том числе если коммит `ancestor` уже удален из репозитория.
         """
-        commits = self.__get_commits_from_range(commit_from, commit_to)
-        issue_ids = OrderedDict()
+        try:
+            return self.repo.is_ancestor(ancestor, descendant)
+        except GitCommandError:
+            return False
 
-        for commit in commits:
-            if not is_merge_commit(commit):
-                continue
+    def iter_issue_occurrences(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_ids: Iterable[str],
+        target_branch: Optional[str] = None,
+        sources: Iterable[IssueSource] = tuple(IssueSource),
+        first_parent: bool = False,
+    ) -> Iterator[IssueOccurrence]:
+        """
+        Потоково сканирует диапазон коммитов, выдавая задачи сразу по мере их обнаружения.
 
-            merge_commit_target_branch = extract_target_branch_name(commit.message)
-            if target_branch is not None and target_branch != merge_commit_target_branch:
-                continue
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_ids (Iterable[str]): Префиксы проектов (например, ['TMOB', 'TAND', 'TIOS']).
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+            sources (Iterable[IssueSource], optional): Источники задач. По умолчанию все.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`.
 
-            merge_commit_source_branch = extract_source_branch_name(commit.message)
-            if not merge_commit_source_branch:
-                continue
+        Returns:
+            Iterator[IssueOccurrence]: Первые появления задач (отдельно для каждого источника) в порядке
+                от старых коммитов к новым.
+        """
+        scanner = IssueScanner(get_issue_id_matcher(tuple(project_ids)), target_branch, sources)
+        return self.__scan_range(scanner, commit_from, commit_to, first_parent)
+
+    def __scan_range(
+        self, scanner: IssueScanner, commit_from: str, commit_to: str, first_parent: bool
+    ) -> Iterator[IssueOccurrence]:
+        """
+        Передает сканеру коммиты диапазона, отбираемые самим git по настройкам сканера.
+
+        Returns:
+            Iterator[IssueOccurrence]: Новые задачи, найденные сканером.
+        """
+        options = scanner.walk_options()._replace(first_parent=first_parent)
+        commit_from, commit_to = self.__resolve(commit_from, commit_to)
+        for commit in self.__get_parsed_commits_from_range(commit_from, commit_to, options):
+            yield from scanner.feed_parsed(commit)
+
+    def __resolve(self, *names: str) -> List[str]:
+        """
+        Заменяет имена ссылок хешами коммитов из кеша ссылок.
+
+        Args:
+            *names (str): Имена тегов и веток или хеши.
+
+        Returns:
+            List[str]: Хеши коммитов; неразрешенные имена возвращаются как есть, чтобы ошибку сообщил git.
+        """
+        resolved = self.refs.resolve_many(names)
+        return [resolved[name] or name for name in names]
+
+    def scan_issue_ids_batch(self, jobs: Sequence[ChangelogJob], max_workers: Optional[int] = None) -> List[IssueScanResult]:
+        """
+        Сканирует много диапазонов коммитов параллельно на пуле процессов.
+
+        Args:
+            jobs (Sequence[ChangelogJob]): Задания `(commit_from, commit_to, project_id, target_branch)`.
+            max_workers (Optional[int], optional): Число процессов. Если None, используется число процессоров;
+                при значении 1 задания выполняются последовательно в текущем процессе.
+
+        Returns:
+            List[IssueScanResult]: Результаты сканирования в порядке заданий.
+        """
+        return run_changelog_jobs(self, jobs, max_workers)
+
+    def get_issue_id_list_from_merge_commits(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_id: str,
+        target_branch: Optional[str] = None,
+        first_parent: bool = False,
+    ) -> List[str]:
+        """
+        Возвращает список идентификаторов задач (issue ID) из мерж-коммитов в указанном диапазоне.
 
-            issue_id = extract_issue_id_from_branch_name(merge_commit_source_branch, project_id)
-            if issue_id:
-                issue_ids[issue_id] = None
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_id (str): Префикс проекта для идентификации задач (например, 'PROJECT').
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`, то есть
+                только коммиты, попавшие непосредственно в эту ветку.
 
-        return list(issue_ids.keys())
+        Returns:
+            List[str]: Список идентификаторов задач, связанных с мерж-коммитами в указанном диапазоне.
+        """
+        sources = [IssueSource.MERGE_BRANCH]
+        result = self.scan_issue_ids(commit_from, commit_to, project_id, target_branch, sources, first_parent)
+        return result.merge_issue_ids
 
     def get_issue_id_list_from_commit_messages(
-        self, commit_from: str, commit_to: str, project_id: str, target_branch: Optional[str] = None
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_id: str,
+        target_branch: Optional[str] = None,
+        first_parent: bool = False,
     ) -> List[str]:
         """
         Возвращает список идентификаторов задач (issue ID) из сообщений коммитов в указанном диапазоне.
@@ -85,19 +329,61 @@ class GitClient:
             commit_from (str): Хеш или имя начального коммита.
             commit_to (str): Хеш или имя конечного коммита.
             project_id (str): Префикс проекта для идентификации задач (например, 'PROJECT').
+            target_branch (Optional[str], optional): Не влияет на результат: сообщения обычных коммитов
+                по целевой ветке не фильтруются.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`, то есть
+                только коммиты, попавшие непосредственно в эту ветку.
 
         Returns:
             List[str]: Список идентификаторов задач, найденных в сообщениях коммитов в указанном диапазоне.
         """
-        commits = self.__get_commits_from_range(commit_from, commit_to)
-        issue_ids = OrderedDict()
+        sources = [IssueSource.COMMIT_MESSAGE]
+        result = self.scan_issue_ids(commit_from, commit_to, project_id, sources=sources, first_parent=first_parent)
+        return result.commit_message_issue_ids
 
-        for commit in commits:
-            if is_merge_commit(commit):
-                continue
+    def get_issue_id_lists_from_merge_commits(
+        self,
+        commit_from: str,
+        commit_to: str,
+        project_ids: Iterable[str],
+        target_branch: Optional[str] = None,
+        first_parent: bool = False,
+    ) -> Dict[str, List[str]]:
+        """
+        Возвращает списки идентификаторов задач из мерж-коммитов для каждого проекта за один обход истории.
 
-            issue_id = extract_issue_id_from_commit_message(commit.message, project_id)
-            if issue_id:
-                issue_ids[issue_id] = None
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_ids (Iterable[str]): Префиксы проектов (например, ['TMOB', 'TAND', 'TIOS']).
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`, то есть
+                только коммиты, попавшие непосредственно в эту ветку.
+
+        Returns:
+            Dict[str, List[str]]: Отображение префикса проекта в список идентификаторов задач.
+        """
+        sources = [IssueSource.MERGE_BRANCH]
+        results = self.scan_issue_ids_by_project(commit_from, commit_to, project_ids, target_branch, sources, first_parent)
+        return {project_id: result.merge_issue_ids for project_id, result in results.items()}
+
+    def get_issue_id_lists_from_commit_messages(
+        self, commit_from: str, commit_to: str, project_ids: Iterable[str], first_parent: bool = False
+    ) -> Dict[str, List[str]]:
+        """
+        Возвращает списки идентификаторов задач из сообщений коммитов для каждого проекта за один обход истории.
 
-        return list(issue_ids.keys())
+        Args:
+            commit_from (str): Хеш или имя начального коммита.
+            commit_to (str): Хеш или имя конечного коммита.
+            project_ids (Iterable[str]): Префиксы проектов (например, ['TMOB', 'TAND', 'TIOS']).
+            first_parent (bool, optional): Обходить только цепочку первых родителей `commit_to`, то есть
+                только коммиты, попавшие непосредственно в эту ветку.
+
+        Returns:
+            Dict[str, List[str]]: Отображение префикса проекта в список идентификаторов задач.
+        """
+        sources = [IssueSource.COMMIT_MESSAGE]
+        results = self.scan_issue_ids_by_project(commit_from, commit_to, project_ids, sources=sources, first_parent=first_parent)
+        return {project_id: result.commit_message_issue_ids for project_id, result in results.items()}
@@ -0,0 +1,133 @@
+import os
+import sqlite3
+import threading
+from git import Repo
+from itertools import islice
+from ..sqlite_helpers import SQLITE_MAX_PARAMS
+from .git_helpers import ParsedCommit, parse_commit
+from .git_log_walker import iter_commit_records_for, iter_rev_list
+from typing import Dict, Iterable, Iterator, List
+
+
+# Имя файла индекса внутри каталога `.git` репозитория.
+INDEX_FILE_NAME = "auto-changelog-index.sqlite"
+
+# Сколько хешей обрабатывается за один запрос к индексу и один запуск `git log`.
+BATCH_SIZE = 5000
+
+
+class CommitIndex:
+    """
+    Постоянный индекс разобранных коммитов, хранящийся рядом с репозиторием.
+
+    Коммиты неизменяемы, поэтому однажды разобранный коммит больше никогда не разбирается повторно.
+    Индекс можно использовать из нескольких потоков: обращения к соединению выполняются под блокировкой.
+    """
+
+    def __init__(self, path: str):
+        """
+        Открывает (или создает) индекс по указанному пути.
+
+        Args:
+            path (str): Путь к файлу SQLite.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS commits (
+                hexsha TEXT PRIMARY KEY,
+                is_merge INTEGER NOT NULL,
+                source_branch TEXT,
+                target_branch TEXT,
+                issue_keys TEXT NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+
+    @classmethod
+    def for_repo(cls, repo: Repo) -> "CommitIndex":
+        """
+        Открывает индекс, расположенный в общем каталоге `.git` репозитория.
+
+        Индекс лежит в `common_dir`, поэтому связанные рабочие деревья (`git worktree`) используют его совместно.
+
+        Args:
+            repo (Repo): Репозиторий.
+
+        Returns:
+            CommitIndex: Индекс репозитория.
+        """
+        return cls(os.path.join(repo.common_dir, INDEX_FILE_NAME))
+
+    def get_many(self, hexshas: List[str]) -> Dict[str, ParsedCommit]:
+        """
+        Возвращает разобранные коммиты, уже присутствующие в индексе.
+
+        Args:
+            hexshas (List[str]): Хеши коммитов.
+
+        Returns:
+            Dict[str, ParsedCommit]: Найденные коммиты по хешу.
+        """
+        found = {}
+        for i in range(0, len(hexshas), SQLITE_MAX_PARAMS):
+            chunk = hexshas[i:i + SQLITE_MAX_PARAMS]
+            with self.lock:
+                rows = self.connection.execute(
+                    "SELECT hexsha, is_merge, source_branch, target_branch, issue_keys FROM commits "
+                    f"WHERE hexsha IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+            for hexsha, is_merge, source_branch, target_branch, issue_keys in rows:
+                found[hexsha] = ParsedCommit(hexsha, bool(is_merge), source_branch, target_branch, issue_keys)
+
+        return found
+
+    def put_many(self, commits: Iterable[ParsedCommit]):
+        """
+        Сохраняет разобранные коммиты в индекс.
+
+        Args:
+            commits (Iterable[ParsedCommit]): Разобранные коммиты.
+        """
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?)",
+                ((c.hexsha, int(c.is_merge), c.source_branch, c.target_branch, c.issue_keys) for c in commits),
+            )
+
+    def close(self):
+        """
+        Закрывает соединение с индексом.
+        """
+        with self.lock:
+            self.connection.close()
+
+    def iter_range(self, repo: Repo, rev_range: str, options: Iterable[str] = ()) -> Iterator[ParsedCommit]:
+        """
+        Обходит диапазон коммитов, разбирая только те коммиты, которых еще нет в индексе.
+
+        Хеши диапазона берутся из `git rev-list`, сообщения читаются только для отсутствующих
+        в индексе коммитов, после чего они дописываются в индекс.
+
+        Args:
+            repo (Repo): Репозиторий, в котором выполняется обход.
+            rev_range (str): Диапазон ревизий (например, 'v1.0.0..release/v1.1.0').
+            options (Iterable[str], optional): Дополнительные параметры `git rev-list` (например, '--merges').
+
+        Yields:
+            ParsedCommit: Разобранные коммиты в порядке от старого к новому.
+        """
+        hexshas = iter_rev_list(repo, rev_range, options)
+        while batch := list(islice(hexshas, BATCH_SIZE)):
+            known = self.get_many(batch)
+            missing = [hexsha for hexsha in batch if hexsha not in known]
+            if missing:
+                parsed = [parse_commit(record) for record in iter_commit_records_for(repo, missing)]
+                self.put_many(parsed)
+                known.update((commit.hexsha, commit) for commit in parsed)
+
+            for hexsha in batch:
+                yield known[hexsha]
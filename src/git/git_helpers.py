@@ -1,14 +1,34 @@
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple, Union
 from git import Commit
+from .git_log_walker import CommitRecord
 
 
-def is_merge_commit(commit: Commit) -> bool:
+# Все подстроки вида '<слово>-<число>': кандидаты в идентификаторы задач любого проекта.
+ISSUE_KEY_PATTERN = re.compile(r"\w+-\d+")
+
+
+class ParsedCommit(NamedTuple):
+    """
+    Результат разбора коммита, не зависящий от проекта и целевой ветки.
+    """
+
+    hexsha: str
+    is_merge: bool
+    source_branch: Optional[str]
+    target_branch: Optional[str]
+    # Кандидаты в идентификаторы задач через пробел: из имени исходной ветки для merge-коммита,
+    # из сообщения для обычного коммита.
+    issue_keys: str
+
+
+def is_merge_commit(commit: Union[Commit, CommitRecord]) -> bool:
     """
     Проверяет, является ли указанный коммит merge-коммитом.
 
     Args:
-        commit (Commit): Объект коммита из библиотеки `git`.
+        commit (Union[Commit, CommitRecord]): Объект коммита из библиотеки `git` или запись из `git log`.
 
     Returns:
         bool: True, если коммит является merge-коммитом (имеет более одного родителя), иначе False.
@@ -46,6 +66,68 @@ def extract_source_branch_name(merge_commit_message: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
+class IssueIdMatcher:
+    """
+    Поиск идентификаторов задач сразу для нескольких проектов одним скомпилированным шаблоном.
+    """
+
+    def __init__(self, project_ids: Iterable[str]):
+        """
+        Args:
+            project_ids (Iterable[str]): Префиксы проектов (например, ['TMOB', 'TAND', 'TIOS']).
+        """
+        self.project_ids: Tuple[str, ...] = tuple(dict.fromkeys(project_ids))
+        alternatives = "|".join(re.escape(project_id) for project_id in self.project_ids)
+        # Опережающая проверка находит и перекрывающиеся совпадения, поэтому для каждого проекта
+        # результат совпадает с отдельным поиском по шаблону '{project_id}-<число>'.
+        self.pattern = re.compile(rf"(?=(?P<issue_id>(?P<project_id>{alternatives})-\d+))")
+
+    def search(self, text: str) -> Optional[str]:
+        """
+        Ищет первый идентификатор задачи любого из проектов.
+
+        Args:
+            text (str): Имя ветки или сообщение коммита.
+
+        Returns:
+            Optional[str]: Первый найденный идентификатор задачи, иначе None.
+        """
+        match = self.pattern.search(text)
+        return match.group("issue_id") if match else None
+
+    def search_by_project(self, text: str) -> Dict[str, str]:
+        """
+        Ищет первый идентификатор задачи для каждого из проектов за один проход по тексту.
+
+        Args:
+            text (str): Имя ветки или сообщение коммита.
+
+        Returns:
+            Dict[str, str]: Отображение префикса проекта в первый найденный идентификатор задачи.
+        """
+        issue_ids: Dict[str, str] = {}
+        for match in self.pattern.finditer(text):
+            issue_ids.setdefault(match.group("project_id"), match.group("issue_id"))
+            if len(issue_ids) == len(self.project_ids):
+                break
+
+        return issue_ids
+
+
+@lru_cache(maxsize=None)
+def get_issue_id_matcher(project_ids: Tuple[str, ...]) -> IssueIdMatcher:
+    """
+    Возвращает скомпилированный поисковик задач для набора проектов, переиспользуя ранее созданные.
+
+    Args:
+        project_ids (Tuple[str, ...]): Префиксы проектов.
+
+    Returns:
+        IssueIdMatcher: Поисковик идентификаторов задач.
+    """
+    return IssueIdMatcher(project_ids)
+
+
 def extract_issue_id_from_branch_name(branch_name: str, project_id: str) -> Optional[str]:
     """
     Извлекает идентификатор задачи из имени ветки.
@@ -57,9 +139,7 @@ def extract_issue_id_from_branch_name(branch_name: str, project_id: str) -> Opti
     Returns:
         Optional[str]: Идентификатор задачи в формате '{project_id}-<число>', если он найден, иначе None.
     """
-    pattern = rf"{project_id}-\d+"
-    match = re.search(pattern, branch_name)
-    return match.group(0) if match else None
+    return get_issue_id_matcher((project_id,)).search(branch_name)
 
 def extract_issue_id_from_commit_message(commit_message: str, project_id: str) -> Optional[str]:
     """
@@ -72,6 +152,48 @@ def extract_issue_id_from_commit_message(commit_message: str, project_id: str) -
     Returns:
         Optional[str]: Идентификатор задачи в формате '{project_id}-<число>', если он найден, иначе None.
     """
-    pattern = rf"{project_id}-\d+"
-    match = re.search(pattern, commit_message)
-    return match.group(0) if match else None
+    return get_issue_id_matcher((project_id,)).search(commit_message)
+
+
+def extract_issue_keys(text: str) -> str:
+    """
+    Извлекает из текста все кандидаты в идентификаторы задач, не привязываясь к проекту.
+
+    Поиск `IssueIdMatcher` по результату дает те же идентификаторы, что и по исходному тексту.
+
+    Args:
+        text (str): Имя ветки или сообщение коммита.
+
+    Returns:
+        str: Уникальные кандидаты в порядке появления, разделенные пробелом.
+    """
+    return " ".join(dict.fromkeys(ISSUE_KEY_PATTERN.findall(text)))
+
+
+def parse_commit(commit: Union[Commit, CommitRecord]) -> ParsedCommit:
+    """
+    Разбирает коммит: определяет, является ли он merge-коммитом, извлекает ветки и кандидаты в задачи.
+
+    Args:
+        commit (Union[Commit, CommitRecord]): Объект коммита из библиотеки `git` или запись из `git log`.
+
+    Returns:
+        ParsedCommit: Результат разбора.
+    """
+    if not is_merge_commit(commit):
+        return ParsedCommit(
+            hexsha=commit.hexsha,
+            is_merge=False,
+            source_branch=None,
+            target_branch=None,
+            issue_keys=extract_issue_keys(commit.message),
+        )
+
+    source_branch = extract_source_branch_name(commit.message)
+    return ParsedCommit(
+        hexsha=commit.hexsha,
+        is_merge=True,
+        source_branch=source_branch,
+        target_branch=extract_target_branch_name(commit.message),
+        issue_keys=extract_issue_keys(source_branch) if source_branch else "",
+    )
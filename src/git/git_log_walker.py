@@ -0,0 +1,207 @@
+import subprocess
+from git import Repo
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+# Поля записи разделяются символом US (0x1f), записи — NUL-байтом (флаг `-z`).
+FIELD_SEPARATOR = "\x1f"
+RECORD_SEPARATOR = b"\x00"
+LOG_FORMAT = "%H%x1f%P%x1f%B"
+
+# Размер блока, которым читается stdout процесса `git log`.
+CHUNK_SIZE = 64 * 1024
+
+
+class CommitRecord(NamedTuple):
+    """
+    Легковесное представление коммита, совместимое с функциями из `git_helpers`.
+    """
+
+    hexsha: str
+    parents: Tuple[str, ...]
+    message: str
+
+
+class WalkOptions(NamedTuple):
+    """
+    Фильтры обхода истории, которые выполняет сам git, чтобы лишние коммиты не попадали в Python.
+    """
+
+    merges: Optional[bool] = None  # True — только merge-коммиты, False — без них, None — все коммиты
+    grep: Optional[str] = None  # Фиксированная строка, которая должна встречаться в сообщении коммита
+    first_parent: bool = False  # Обходить только цепочку первых родителей
+
+    def to_args(self) -> List[str]:
+        """
+        Возвращает параметры командной строки `git log` / `git rev-list`.
+
+        Returns:
+            List[str]: Параметры командной строки.
+        """
+        args = []
+        if self.merges is not None:
+            args.append("--merges" if self.merges else "--no-merges")
+        if self.grep is not None:
+            args += ["--fixed-strings", f"--grep={self.grep}"]
+        if self.first_parent:
+            args.append("--first-parent")
+
+        return args
+
+    def to_kwargs(self) -> Dict[str, Any]:
+        """
+        Возвращает те же параметры в виде именованных аргументов GitPython (например, для `Repo.iter_commits`).
+
+        Returns:
+            Dict[str, Any]: Именованные аргументы.
+        """
+        kwargs: Dict[str, Any] = {}
+        if self.merges is not None:
+            kwargs["merges" if self.merges else "no_merges"] = True
+        if self.grep is not None:
+            kwargs["fixed_strings"] = True
+            kwargs["grep"] = self.grep
+        if self.first_parent:
+            kwargs["first_parent"] = True
+
+        return kwargs
+
+
+def parse_commit_record(raw_record: bytes) -> CommitRecord:
+    """
+    Разбирает одну запись вывода `git log` в формате `LOG_FORMAT`.
+
+    Args:
+        raw_record (bytes): Запись без завершающего разделителя.
+
+    Returns:
+        CommitRecord: Разобранный коммит.
+    """
+    hexsha, parents, message = raw_record.decode("utf-8", errors="replace").split(FIELD_SEPARATOR, 2)
+    return CommitRecord(hexsha=hexsha, parents=tuple(parents.split()), message=message)
+
+
+class CommitRecordParser:
+    """
+    Потоковый разборщик вывода `git log -z`: принимает произвольные блоки байтов
+    и возвращает записи по мере того, как они становятся полными.
+    """
+
+    def __init__(self):
+        self.__buffer = b""
+
+    def feed(self, chunk: bytes) -> List[CommitRecord]:
+        """
+        Добавляет очередной блок вывода.
+
+        Args:
+            chunk (bytes): Блок байтов из stdout процесса.
+
+        Returns:
+            List[CommitRecord]: Записи, завершившиеся в этом блоке.
+        """
+        *raw_records, self.__buffer = (self.__buffer + chunk).split(RECORD_SEPARATOR)
+        return [parse_commit_record(raw_record) for raw_record in raw_records if raw_record]
+
+    def close(self) -> List[CommitRecord]:
+        """
+        Завершает разбор и возвращает последнюю запись, если она не была завершена разделителем.
+
+        Returns:
+            List[CommitRecord]: Оставшиеся записи.
+        """
+        raw_record, self.__buffer = self.__buffer.strip(b"\n"), b""
+        return [parse_commit_record(raw_record)] if raw_record else []
+
+
+def build_log_args(*revs: str, options: Iterable[str] = ()) -> List[str]:
+    """
+    Формирует аргументы `git log` для обхода ревизий от старых коммитов к новым.
+
+    Args:
+        *revs (str): Диапазоны или ревизии (например, 'v1.0.0..release/v1.1.0').
+        options (Iterable[str], optional): Дополнительные параметры `git log` (например, '--topo-order').
+
+    Returns:
+        List[str]: Аргументы командной строки без имени команды.
+    """
+    return ["-z", "--reverse", f"--format={LOG_FORMAT}", *options, *revs, "--"]
+
+
+def iter_commit_records(repo: Repo, *revs: str, options: Iterable[str] = ()) -> Iterator[CommitRecord]:
+    """
+    Обходит диапазон коммитов одним процессом `git log`, разбирая его вывод потоково.
+
+    Args:
+        repo (Repo): Репозиторий, в котором выполняется обход.
+        *revs (str): Диапазоны или ревизии (например, 'v1.0.0..release/v1.1.0').
+        options (Iterable[str], optional): Дополнительные параметры `git log` (например, '--topo-order').
+
+    Yields:
+        CommitRecord: Коммиты в порядке от старого к новому.
+
+    Raises:
+        git.exc.GitCommandError: Если `git log` завершился с ошибкой.
+    """
+    parser = CommitRecordParser()
+    process = repo.git.log(*build_log_args(*revs, options=options), as_process=True)
+
+    while chunk := process.stdout.read(CHUNK_SIZE):
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+    process.wait()
+
+
+def iter_commit_records_for(repo: Repo, hexshas: Iterable[str]) -> Iterator[CommitRecord]:
+    """
+    Читает указанные коммиты одним процессом `git log --no-walk --stdin`, сохраняя порядок хешей.
+
+    Args:
+        repo (Repo): Репозиторий, в котором находятся коммиты.
+        hexshas (Iterable[str]): Хеши коммитов.
+
+    Yields:
+        CommitRecord: Коммиты в порядке переданных хешей.
+
+    Raises:
+        git.exc.GitCommandError: Если `git log` завершился с ошибкой.
+    """
+    parser = CommitRecordParser()
+    process = repo.git.log(
+        "-z", "--no-walk=unsorted", "--stdin", f"--format={LOG_FORMAT}", as_process=True, istream=subprocess.PIPE
+    )
+
+    # `git log --stdin` дочитывает ревизии до конца ввода прежде, чем начать вывод,
+    # поэтому запись и последующее чтение не блокируют друг друга.
+    process.stdin.write("".join(f"{hexsha}\n" for hexsha in hexshas).encode())
+    process.stdin.close()
+
+    while chunk := process.stdout.read(CHUNK_SIZE):
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+    process.wait()
+
+
+def iter_rev_list(repo: Repo, rev_range: str, options: Iterable[str] = ()) -> Iterator[str]:
+    """
+    Возвращает хеши коммитов диапазона.
+
+    Args:
+        repo (Repo): Репозиторий, в котором выполняется обход.
+        rev_range (str): Диапазон ревизий (например, 'v1.0.0..release/v1.1.0').
+        options (Iterable[str], optional): Дополнительные параметры `git rev-list` (например, '--merges').
+
+    Yields:
+        str: Хеши коммитов в порядке от старого к новому.
+
+    Raises:
+        git.exc.GitCommandError: Если `git rev-list` завершился с ошибкой.
+    """
+    process = repo.git.rev_list("--reverse", *options, rev_range, "--", as_process=True)
+
+    for line in process.stdout:
+        yield line.decode().strip()
+
+    process.wait()
@@ -0,0 +1,167 @@
+import os
+from git import Repo
+from typing import Dict, Iterable, Optional, Tuple
+
+
+# Формат `git for-each-ref`: имя ссылки, объект и, для аннотированного тега, коммит, на который он указывает.
+FOR_EACH_REF_FORMAT = "%(refname) %(objectname) %(*objectname)"
+
+# Пространства имен, в которых git ищет короткое имя ссылки, в порядке приоритета (см. `git help revisions`).
+SHORT_NAME_PREFIXES = ("refs/", "refs/tags/", "refs/heads/", "refs/remotes/")
+
+
+def get_refs_signature(repo: Repo) -> Tuple:
+    """
+    Возвращает отпечаток хранилища ссылок репозитория: `packed-refs`, `HEAD`, каталогов `refs`
+    и списка таблиц reftable.
+
+    Git обновляет ссылку атомарным переименованием файла `.lock`, поэтому любое создание, изменение
+    или удаление свободной ссылки меняет время изменения ее каталога, а упаковка ссылок — `packed-refs`.
+    В репозиториях с `extensions.refStorage=reftable` (git 2.45+) ссылки хранятся в таблицах,
+    и каждое изменение атомарно переписывает `reftable/tables.list`.
+
+    Стоимость вызова пропорциональна числу каталогов в `refs` (не числу ссылок): вложенные каталоги
+    обходятся целиком, так как ветка `feature/X` меняет время изменения только `refs/heads/feature`.
+    Обычно это десятки вызовов `stat`, что намного дешевле запуска `git for-each-ref`.
+
+    Args:
+        repo (Repo): Репозиторий.
+
+    Returns:
+        Tuple: Отпечаток, меняющийся при изменении любой ссылки.
+    """
+    def stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            result = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return result.st_mtime_ns, result.st_size
+
+    signature = [
+        stat(os.path.join(repo.common_dir, "packed-refs")),
+        stat(os.path.join(repo.git_dir, "HEAD")),
+        # Общие ссылки и ссылки рабочего дерева (HEAD, refs/bisect и т.п.) хранятся в разных таблицах
+        stat(os.path.join(repo.common_dir, "reftable", "tables.list")),
+        stat(os.path.join(repo.git_dir, "reftable", "tables.list")),
+    ]
+    for directory, _, _ in os.walk(os.path.join(repo.common_dir, "refs")):
+        signature.append((directory, stat(directory)))
+    return tuple(signature)
+
+
+def parse_for_each_ref(output: str) -> Dict[str, str]:
+    """
+    Разбирает вывод `git for-each-ref` в формате `FOR_EACH_REF_FORMAT`.
+
+    Args:
+        output (str): Вывод команды.
+
+    Returns:
+        Dict[str, str]: Отображение полного и коротких имен ссылок в хеш объекта (для аннотированных
+            тегов — в хеш коммита). Короткое имя получает ссылка с наибольшим приоритетом.
+    """
+    full_names: Dict[str, str] = {}
+    for line in output.splitlines():
+        refname, objectname, *peeled = line.split(" ")
+        full_names[refname] = peeled[0] if peeled and peeled[0] else objectname
+
+    refs = dict(full_names)
+    for prefix in reversed(SHORT_NAME_PREFIXES):
+        refs.update((name[len(prefix):], hexsha) for name, hexsha in full_names.items() if name.startswith(prefix))
+    return refs
+
+
+class RefResolver:
+    """
+    Кеш разрешения имен ссылок (тегов, веток) в хеши коммитов.
+
+    Все ссылки читаются одним вызовом `git for-each-ref`; прочие ревизии (хеши, `HEAD~1` и т.п.)
+    разрешаются постоянным процессом `git cat-file --batch-check`. Кеш сбрасывается, как только
+    меняются файлы ссылок репозитория.
+    """
+
+    def __init__(self, repo: Repo):
+        """
+        Создает кеш для репозитория. Ссылки читаются при первом обращении.
+
+        Args:
+            repo (Repo): Репозиторий.
+        """
+        self.repo = repo
+        self.loads = 0
+        self.__refs: Dict[str, str] = {}
+        self.__revisions: Dict[str, Optional[str]] = {}
+        self.__signature: Optional[Tuple] = None
+
+    def refs(self) -> Dict[str, str]:
+        """
+        Возвращает актуальное отображение имен ссылок в хеши, перечитывая ссылки только после их изменения.
+
+        Returns:
+            Dict[str, str]: Полные и короткие имена ссылок с хешами объектов.
+        """
+        signature = get_refs_signature(self.repo)
+        if signature != self.__signature:
+            self.__refs = parse_for_each_ref(self.repo.git.for_each_ref(f"--format={FOR_EACH_REF_FORMAT}"))
+            self.__revisions.clear()
+            self.__signature = signature
+            self.loads += 1
+        return self.__refs
+
+    def tags(self) -> Dict[str, str]:
+        """
+        Возвращает хеши коммитов всех тегов.
+
+        Returns:
+            Dict[str, str]: Отображение имени тега в хеш коммита.
+        """
+        prefix = "refs/tags/"
+        return {name[len(prefix):]: hexsha for name, hexsha in self.refs().items() if name.startswith(prefix)}
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Возвращает хеш коммита для имени ссылки или произвольной ревизии.
+
+        Args:
+            name (str): Имя тега или ветки, хеш или выражение ревизии.
+
+        Returns:
+            Optional[str]: Хеш коммита или None, если ревизия не найдена.
+        """
+        return self.resolve_many([name])[name]
+
+    def resolve_many(self, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Разрешает несколько имен, обращаясь к git только за теми, которых нет среди ссылок и в кеше.
+
+        Args:
+            names (Iterable[str]): Имена тегов и веток, хеши или выражения ревизий.
+
+        Returns:
+            Dict[str, Optional[str]]: Хеш коммита для каждого имени (None, если ревизия не найдена).
+        """
+        refs = self.refs()
+        resolved: Dict[str, Optional[str]] = {}
+        for name in names:
+            if name not in refs and name not in self.__revisions:
+                self.__revisions[name] = self.__peel(name)
+            resolved[name] = self.__revisions.get(name, refs.get(name))
+        return resolved
+
+    def __peel(self, name: str) -> Optional[str]:
+        """
+        Разрешает ревизию до коммита через постоянный процесс `git cat-file --batch-check`.
+
+        Args:
+            name (str): Ревизия.
+
+        Returns:
+            Optional[str]: Хеш коммита или None, если ревизия не найдена или не указывает на коммит.
+        """
+        if "\n" in name:  # Перевод строки разделяет запросы процесса
+            return None
+        try:
+            hexsha, _, _ = self.repo.git.get_object_header(f"{name}^{{commit}}")
+        except ValueError:
+            return None
+        return hexsha.decode() if isinstance(hexsha, bytes) else hexsha
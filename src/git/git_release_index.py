@@ -0,0 +1,234 @@
+import json
+from git import Repo
+from .git_helpers import get_issue_id_matcher, parse_commit
+from .git_log_walker import iter_commit_records
+from .git_refs import RefResolver
+from typing import Dict, Iterable, List, Optional
+
+
+class ReleaseGraphIndex:
+    """
+    Индекс релизного графа: для каждого тега хранит множества задач, достижимых из него.
+
+    Множества хранятся битовыми масками (int) над общим словарем идентификаторов задач,
+    поэтому список задач для любой пары тегов вычисляется разностью множеств без обращения к git.
+
+    Разность множеств отличается от обхода диапазона `tagA..tagB` в одном случае: задача, которая
+    встречается и в истории `tagA`, и в новых коммитах, в результат не попадает. Задачи
+    возвращаются в порядке первого появления при топологическом обходе истории.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        target_branch: Optional[str],
+        issue_ids: List[str],
+        refs: Dict[str, str],
+        merge_bitmaps: Dict[str, int],
+        message_bitmaps: Dict[str, int],
+    ):
+        """
+        Args:
+            project_id (str): Префикс проекта, для которого построен индекс.
+            target_branch (Optional[str]): Целевая ветка, по которой фильтровались merge-коммиты.
+            issue_ids (List[str]): Словарь задач: позиция в списке соответствует биту в масках.
+            refs (Dict[str, str]): Отображение имени тега в хеш коммита.
+            merge_bitmaps (Dict[str, int]): Маски задач из merge-коммитов по хешу коммита тега.
+            message_bitmaps (Dict[str, int]): Маски задач из сообщений коммитов по хешу коммита тега.
+        """
+        self.project_id = project_id
+        self.target_branch = target_branch
+        self.issue_ids = issue_ids
+        self.refs = refs
+        self.merge_bitmaps = merge_bitmaps
+        self.message_bitmaps = message_bitmaps
+
+    @classmethod
+    def build(
+        cls,
+        repo: Repo,
+        project_id: str,
+        target_branch: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        resolver: Optional[RefResolver] = None,
+    ) -> "ReleaseGraphIndex":
+        """
+        Строит индекс за один обход истории, достижимой из тегов.
+
+        Args:
+            repo (Repo): Репозиторий.
+            project_id (str): Префикс проекта для идентификации задач (например, 'PROJECT').
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+            tags (Optional[Iterable[str]], optional): Имена индексируемых тегов. Если None, индексируются все теги.
+            resolver (Optional[RefResolver], optional): Кеш ссылок репозитория. Если None, теги читаются заново.
+
+        Returns:
+            ReleaseGraphIndex: Построенный индекс.
+        """
+        tag_names = set(tags) if tags is not None else None
+        resolver = resolver or RefResolver(repo)
+        refs = {
+            name: hexsha for name, hexsha in resolver.tags().items() if tag_names is None or name in tag_names
+        }
+        if not refs:
+            return cls(project_id, target_branch, [], refs, {}, {})
+
+        matcher = get_issue_id_matcher((project_id,))
+        issue_bits: Dict[str, int] = {}
+        commits = []  # (хеш, родители, собственная маска merge-задач, собственная маска задач из сообщений)
+
+        # Топологический порядок с --reverse гарантирует, что родители обрабатываются раньше потомков.
+        for record in iter_commit_records(repo, *set(refs.values()), options=["--topo-order"]):
+            commit = parse_commit(record)
+            own_bits = 0
+            skip = commit.is_merge and target_branch is not None and target_branch != commit.target_branch
+            issue_id = None if skip else matcher.search(commit.issue_keys)
+            if issue_id:
+                own_bits = 1 << issue_bits.setdefault(issue_id, len(issue_bits))
+
+            if commit.is_merge:
+                commits.append((record.hexsha, record.parents, own_bits, 0))
+            else:
+                commits.append((record.hexsha, record.parents, 0, own_bits))
+
+        merge_bitmaps, message_bitmaps = cls.__propagate(commits, set(refs.values()))
+        return cls(project_id, target_branch, list(issue_bits), refs, merge_bitmaps, message_bitmaps)
+
+    @staticmethod
+    def __propagate(commits: list, keep: set):
+        # Считаем потомков, чтобы освобождать маски коммитов, которые больше не понадобятся.
+        children: Dict[str, int] = {}
+        for _, parents, _, _ in commits:
+            for parent in parents:
+                children[parent] = children.get(parent, 0) + 1
+
+        merge_masks: Dict[str, int] = {}
+        message_masks: Dict[str, int] = {}
+        for hexsha, parents, own_merge_bits, own_message_bits in commits:
+            merge_bits, message_bits = own_merge_bits, own_message_bits
+            for parent in parents:
+                merge_bits |= merge_masks.get(parent, 0)
+                message_bits |= message_masks.get(parent, 0)
+                children[parent] -= 1
+                if children[parent] == 0 and parent not in keep:
+                    merge_masks.pop(parent, None)
+                    message_masks.pop(parent, None)
+
+            merge_masks[hexsha] = merge_bits
+            message_masks[hexsha] = message_bits
+
+        return (
+            {hexsha: merge_masks[hexsha] for hexsha in keep},
+            {hexsha: message_masks[hexsha] for hexsha in keep},
+        )
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Возвращает хеш проиндексированного коммита по имени тега или хешу.
+
+        Args:
+            name (str): Имя тега или хеш коммита.
+
+        Returns:
+            Optional[str]: Хеш коммита, если он есть в индексе, иначе None.
+        """
+        hexsha = self.refs.get(name, name)
+        return hexsha if hexsha in self.merge_bitmaps else None
+
+    def covers(self, commit_from: str, commit_to: str, project_id: str, target_branch: Optional[str]) -> bool:
+        """
+        Проверяет, можно ли ответить на запрос по индексу.
+
+        Args:
+            commit_from (str): Имя тега или хеш начального коммита.
+            commit_to (str): Имя тега или хеш конечного коммита.
+            project_id (str): Префикс проекта.
+            target_branch (Optional[str]): Имя целевой ветки.
+
+        Returns:
+            bool: True, если оба коммита проиндексированы с теми же проектом и целевой веткой.
+        """
+        return (
+            project_id == self.project_id
+            and target_branch == self.target_branch
+            and self.resolve(commit_from) is not None
+            and self.resolve(commit_to) is not None
+        )
+
+    def get_merge_issue_ids(self, commit_from: str, commit_to: str) -> List[str]:
+        """
+        Возвращает задачи из merge-коммитов, достижимые из `commit_to`, но не из `commit_from`.
+
+        Args:
+            commit_from (str): Имя тега или хеш начального коммита.
+            commit_to (str): Имя тега или хеш конечного коммита.
+
+        Returns:
+            List[str]: Список идентификаторов задач.
+        """
+        return self.__difference(self.merge_bitmaps, commit_from, commit_to)
+
+    def get_commit_message_issue_ids(self, commit_from: str, commit_to: str) -> List[str]:
+        """
+        Возвращает задачи из сообщений коммитов, достижимые из `commit_to`, но не из `commit_from`.
+
+        Args:
+            commit_from (str): Имя тега или хеш начального коммита.
+            commit_to (str): Имя тега или хеш конечного коммита.
+
+        Returns:
+            List[str]: Список идентификаторов задач.
+        """
+        return self.__difference(self.message_bitmaps, commit_from, commit_to)
+
+    def __difference(self, bitmaps: Dict[str, int], commit_from: str, commit_to: str) -> List[str]:
+        bits = bitmaps[self.resolve(commit_to)] & ~bitmaps[self.resolve(commit_from)]
+        issue_ids = []
+        while bits:
+            lowest = bits & -bits
+            issue_ids.append(self.issue_ids[lowest.bit_length() - 1])
+            bits ^= lowest
+
+        return issue_ids
+
+    def save(self, path: str):
+        """
+        Сохраняет индекс в JSON-файл. Маски записываются в шестнадцатеричном виде.
+
+        Args:
+            path (str): Путь к файлу.
+        """
+        data = {
+            "project_id": self.project_id,
+            "target_branch": self.target_branch,
+            "issue_ids": self.issue_ids,
+            "refs": self.refs,
+            "merge_bitmaps": {hexsha: format(bits, "x") for hexsha, bits in self.merge_bitmaps.items()},
+            "message_bitmaps": {hexsha: format(bits, "x") for hexsha, bits in self.message_bitmaps.items()},
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, path: str) -> "ReleaseGraphIndex":
+        """
+        Загружает индекс, сохраненный методом `save`.
+
+        Args:
+            path (str): Путь к файлу.
+
+        Returns:
+            ReleaseGraphIndex: Загруженный индекс.
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+
+        return cls(
+            project_id=data["project_id"],
+            target_branch=data["target_branch"],
+            issue_ids=data["issue_ids"],
+            refs=data["refs"],
+            merge_bitmaps={hexsha: int(bits, 16) for hexsha, bits in data["merge_bitmaps"].items()},
+            message_bitmaps={hexsha: int(bits, 16) for hexsha, bits in data["message_bitmaps"].items()},
+        )
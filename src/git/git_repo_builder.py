@@ -0,0 +1,304 @@
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+# Версия формата описания: меняется вместе с генерируемым потоком, чтобы не использовать устаревший кеш.
+FORMAT_VERSION = 1
+
+# Время первого коммита; каждый следующий коммит создается на секунду позже.
+START_TIMESTAMP = 1_600_000_000
+
+DEFAULT_CACHE_ROOT = os.path.join(tempfile.gettempdir(), "auto-changelog-repos")
+
+# Операция описания графа — кортеж, повторяющий команды git:
+#   ("commit", message)          — коммит в текущую ветку;
+#   ("branch", name)             — `git checkout -B name`: ветка от текущего коммита;
+#   ("checkout", name)           — переключение на существующую ветку;
+#   ("merge", name[, message])   — `git merge --no-ff name`;
+#   ("ff", name)                 — `git merge --ff-only name`;
+#   ("tag", name)                — легковесный тег на текущем коммите.
+Operation = Tuple[str, ...]
+
+
+def default_merge_message(source_branch: str, target_branch: str) -> str:
+    """
+    Формирует сообщение merge-коммита так же, как `git merge` с настройками по умолчанию.
+
+    Args:
+        source_branch (str): Имя сливаемой ветки.
+        target_branch (str): Имя ветки, в которую выполняется слияние.
+
+    Returns:
+        str: Сообщение merge-коммита.
+    """
+    if target_branch == "master":  # git по умолчанию не дописывает ' into master'
+        return f"Merge branch '{source_branch}'"
+
+    return f"Merge branch '{source_branch}' into {target_branch}"
+
+
+class FastImportStream:
+    """
+    Поток `git fast-import`, построенный по описанию графа.
+
+    После полного обхода в `head` остается ветка, на которую должен указывать HEAD.
+    """
+
+    def __init__(self, operations: Iterable[Operation], initial_branch: str = "master"):
+        """
+        Args:
+            operations (Iterable[Operation]): Операции описания графа (может быть генератором).
+            initial_branch (str, optional): Ветка, в которую выполняются первые коммиты.
+        """
+        self.operations = operations
+        self.head = initial_branch
+        self.tips: Dict[str, int] = {}
+        self.mark = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Yields:
+            bytes: Фрагменты потока.
+
+        Raises:
+            ValueError: Если операция неизвестна или ссылается на несуществующую ветку.
+        """
+        for operation in self.operations:
+            kind, name, *rest = operation
+            if kind == "commit":
+                yield self.__commit(name, [self.tips[self.head]] if self.head in self.tips else [])
+            elif kind == "branch":
+                self.tips[name] = self.__tip(self.head)
+                self.head = name
+            elif kind == "checkout":
+                self.__tip(name)
+                self.head = name
+            elif kind == "merge":
+                message = rest[0] if rest else default_merge_message(name, self.head)
+                yield self.__commit(message, [self.__tip(self.head), self.__tip(name)])
+            elif kind == "ff":
+                self.tips[self.head] = self.__tip(name)
+            elif kind == "tag":
+                yield f"reset refs/tags/{name}\nfrom :{self.__tip(self.head)}\n\n".encode()
+            else:
+                raise ValueError(f"Неизвестная операция '{kind}'")
+
+        for branch, tip in self.tips.items():
+            yield f"reset refs/heads/{branch}\nfrom :{tip}\n\n".encode()
+
+    def __commit(self, message: str, parents: List[int]) -> bytes:
+        self.mark += 1
+        self.tips[self.head] = self.mark
+        data = message.encode()
+        links = "".join(f"{'from' if i == 0 else 'merge'} :{parent}\n" for i, parent in enumerate(parents))
+        return (
+            f"commit refs/heads/{self.head}\nmark :{self.mark}\n"
+            f"committer Auto Changelog <auto-changelog@example.com> {START_TIMESTAMP + self.mark} +0000\n"
+            f"data {len(data)}\n"
+        ).encode() + data + f"\n{links}\n".encode()
+
+    def __tip(self, branch: str) -> int:
+        if branch not in self.tips:
+            raise ValueError(f"Ветка '{branch}' не существует или не содержит коммитов")
+        return self.tips[branch]
+
+
+def get_description_key(operations: Sequence[Operation], initial_branch: str = "master") -> str:
+    """
+    Вычисляет ключ кеша по описанию графа.
+
+    Args:
+        operations (Sequence[Operation]): Операции описания графа.
+        initial_branch (str, optional): Начальная ветка.
+
+    Returns:
+        str: Хеш описания.
+    """
+    description = json.dumps([FORMAT_VERSION, initial_branch, [list(operation) for operation in operations]])
+    return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+
+def import_repo(repo_dir: str, operations: Iterable[Operation], initial_branch: str = "master"):
+    """
+    Создает репозиторий в пустом каталоге одним потоком `git fast-import`.
+
+    Args:
+        repo_dir (str): Каталог нового репозитория.
+        operations (Iterable[Operation]): Операции описания графа.
+        initial_branch (str, optional): Начальная ветка.
+
+    Raises:
+        subprocess.CalledProcessError: Если команда git завершилась с ошибкой.
+    """
+    subprocess.run(["git", "init", "-q", f"--initial-branch={initial_branch}", repo_dir], check=True)
+    stream = FastImportStream(operations, initial_branch)
+    process = subprocess.Popen(["git", "fast-import", "--quiet"], cwd=repo_dir, stdin=subprocess.PIPE)
+    try:
+        for chunk in stream:
+            process.stdin.write(chunk)
+    finally:
+        process.stdin.close()
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, "git fast-import")
+
+    subprocess.run(["git", "symbolic-ref", "HEAD", f"refs/heads/{stream.head}"], cwd=repo_dir, check=True)
+
+
+def build_repo(
+    operations: Iterable[Operation],
+    initial_branch: str = "master",
+    cache_key: Optional[str] = None,
+    cache_root: Optional[str] = DEFAULT_CACHE_ROOT,
+) -> str:
+    """
+    Возвращает репозиторий по описанию графа, собирая его только при отсутствии в кеше.
+
+    Репозитории из кеша общие для всех вызовов, поэтому изменять их нельзя. Для изменяемого
+    репозитория передайте `cache_root=None`: он будет собран в новом временном каталоге,
+    который удаляет вызывающий код.
+
+    Args:
+        operations (Iterable[Operation]): Операции описания графа.
+        initial_branch (str, optional): Начальная ветка.
+        cache_key (Optional[str], optional): Ключ кеша. Если None, вычисляется по описанию
+            (для генераторов операций ключ нужно передать явно).
+        cache_root (Optional[str], optional): Каталог кеша. Если None, кеш не используется.
+
+    Returns:
+        str: Путь к репозиторию.
+    """
+    if cache_root is None:
+        repo_dir = tempfile.mkdtemp(prefix="auto-changelog-repo-")
+        import_repo(repo_dir, operations, initial_branch)
+        return repo_dir
+
+    if cache_key is None:
+        operations = list(operations)
+        cache_key = get_description_key(operations, initial_branch)
+
+    repo_dir = os.path.join(cache_root, cache_key)
+    if os.path.exists(repo_dir):
+        return repo_dir
+
+    # Собираем во временном каталоге и переименовываем: в кеше не бывает недособранных репозиториев.
+    os.makedirs(cache_root, exist_ok=True)
+    build_dir = tempfile.mkdtemp(prefix=f"{cache_key}-", dir=cache_root)
+    try:
+        import_repo(build_dir, operations, initial_branch)
+        os.rename(build_dir, repo_dir)
+    except OSError:
+        if not os.path.exists(repo_dir):  # Иначе тот же репозиторий параллельно собрал другой процесс
+            raise
+    finally:
+        if os.path.exists(build_dir):
+            shutil.rmtree(build_dir)
+
+    return repo_dir
+
+
+class RepoBuilder:
+    """
+    Построитель описания графа с интерфейсом, повторяющим команды git.
+
+    Пример:
+        repo_dir = (
+            RepoBuilder()
+            .commit("Initial commit").tag("v1.0.0")
+            .branch("feature/TEST-1").commit("TEST-1 message 1")
+            .checkout("master").merge("feature/TEST-1")
+            .build()
+        )
+    """
+
+    def __init__(self, initial_branch: str = "master"):
+        """
+        Args:
+            initial_branch (str, optional): Ветка, в которую выполняются первые коммиты.
+        """
+        self.initial_branch = initial_branch
+        self.head = initial_branch
+        self.operations: List[Operation] = []
+
+    def commit(self, message: str) -> "RepoBuilder":
+        self.operations.append(("commit", message))
+        return self
+
+    def branch(self, name: str) -> "RepoBuilder":
+        self.operations.append(("branch", name))
+        self.head = name
+        return self
+
+    def checkout(self, name: str) -> "RepoBuilder":
+        self.operations.append(("checkout", name))
+        self.head = name
+        return self
+
+    def merge(self, name: str, message: Optional[str] = None) -> "RepoBuilder":
+        self.operations.append(("merge", name) if message is None else ("merge", name, message))
+        return self
+
+    def fast_forward(self, name: str) -> "RepoBuilder":
+        self.operations.append(("ff", name))
+        return self
+
+    def tag(self, name: str) -> "RepoBuilder":
+        self.operations.append(("tag", name))
+        return self
+
+    def feature(self, issue_id: str, *messages: str) -> "RepoBuilder":
+        """
+        Создает фича-ветку `feature/<issue_id>` от текущей ветки, коммитит в нее и сливает ее обратно.
+
+        Args:
+            issue_id (str): Идентификатор задачи (например, 'TEST-1').
+            *messages (str): Сообщения коммитов. По умолчанию один коммит '<issue_id> message 1'.
+        """
+        target = self.head
+        self.branch(f"feature/{issue_id}")
+        for message in messages or (f"{issue_id} message 1",):
+            self.commit(message)
+        return self.checkout(target).merge(f"feature/{issue_id}")
+
+    @property
+    def key(self) -> str:
+        """
+        Ключ кеша, вычисленный по описанию графа.
+        """
+        return get_description_key(self.operations, self.initial_branch)
+
+    def build(self, cache_root: Optional[str] = DEFAULT_CACHE_ROOT) -> str:
+        """
+        Возвращает путь к репозиторию с описанным графом (см. `build_repo`).
+
+        Args:
+            cache_root (Optional[str], optional): Каталог кеша. Если None, собирается новый изменяемый репозиторий.
+
+        Returns:
+            str: Путь к репозиторию.
+        """
+        return build_repo(self.operations, self.initial_branch, cache_root=cache_root)
+
+
+def create_release_builder(feature_issue_ids: Iterable[str] = ()) -> RepoBuilder:
+    """
+    Создает описание репозитория с начальным коммитом, тегом 'v1.0.0' и релизной веткой 'release/v1.1.0',
+    в которую слиты фича-ветки указанных задач.
+
+    Args:
+        feature_issue_ids (Iterable[str], optional): Идентификаторы задач фича-веток в порядке слияния.
+
+    Returns:
+        RepoBuilder: Построитель, текущая ветка которого — 'release/v1.1.0'.
+    """
+    builder = RepoBuilder()
+    builder.commit("Initial commit") # Создаем коммит 'Initial commit'
+    builder.tag("v1.0.0") # Создаем тег 'v1.0.0'
+    builder.branch("release/v1.1.0") # Создаем релизную ветку
+    for issue_id in feature_issue_ids:
+        builder.feature(issue_id)
+    return builder
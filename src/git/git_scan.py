@@ -0,0 +1,136 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from git import Commit
+from .git_log_walker import CommitRecord, WalkOptions
+from .git_helpers import IssueIdMatcher, ParsedCommit, parse_commit
+from typing import Dict, Iterable, List, Optional, Union
+
+
+class IssueSource(str, Enum):
+    """
+    Источник, из которого извлечен идентификатор задачи.
+    """
+
+    MERGE_BRANCH = "merge_branch"  # Имя исходной ветки merge-коммита
+    COMMIT_MESSAGE = "commit_message"  # Сообщение обычного коммита
+
+
+@dataclass(frozen=True)
+class IssueOccurrence:
+    """
+    Первое появление идентификатора задачи в диапазоне коммитов.
+    """
+
+    issue_id: str
+    project_id: str
+    source: IssueSource
+    commit: str  # Хеш коммита, в котором задача встретилась впервые
+
+
+@dataclass
+class IssueScanResult:
+    """
+    Результат однопроходного сканирования диапазона коммитов.
+
+    Задачи хранятся в порядке первого появления отдельно для каждого источника.
+    """
+
+    merge_commits: "OrderedDict[str, IssueOccurrence]" = field(default_factory=OrderedDict)
+    commit_messages: "OrderedDict[str, IssueOccurrence]" = field(default_factory=OrderedDict)
+
+    @property
+    def merge_issue_ids(self) -> List[str]:
+        """
+        Идентификаторы задач из имен исходных веток merge-коммитов.
+        """
+        return list(self.merge_commits.keys())
+
+    @property
+    def commit_message_issue_ids(self) -> List[str]:
+        """
+        Идентификаторы задач из сообщений обычных коммитов.
+        """
+        return list(self.commit_messages.keys())
+
+
+class IssueScanner:
+    """
+    Извлекает идентификаторы задач нескольких проектов из последовательности коммитов за один проход.
+    """
+
+    def __init__(
+        self,
+        matcher: IssueIdMatcher,
+        target_branch: Optional[str] = None,
+        sources: Iterable[IssueSource] = tuple(IssueSource),
+    ):
+        """
+        Args:
+            matcher (IssueIdMatcher): Поисковик идентификаторов задач для всех нужных проектов.
+            target_branch (Optional[str], optional): Имя целевой ветки для фильтрации merge-коммитов.
+                Если None, фильтрация по ветке не выполняется.
+            sources (Iterable[IssueSource], optional): Источники, из которых извлекаются задачи. По умолчанию все.
+        """
+        self.matcher = matcher
+        self.target_branch = target_branch
+        self.sources = frozenset(sources)
+        self.results: Dict[str, IssueScanResult] = {
+            project_id: IssueScanResult() for project_id in matcher.project_ids
+        }
+
+    def walk_options(self) -> WalkOptions:
+        """
+        Возвращает фильтры обхода, которые git может применить сам, не передавая лишние коммиты в Python.
+
+        Returns:
+            WalkOptions: Фильтры обхода для выбранных источников и целевой ветки.
+        """
+        if self.sources == {IssueSource.MERGE_BRANCH}:
+            # Строка лишь отсекает заведомо неподходящие коммиты: точное сравнение ветки выполняется при разборе.
+            return WalkOptions(merges=True, grep=f"into {self.target_branch}" if self.target_branch else None)
+        if self.sources == {IssueSource.COMMIT_MESSAGE}:
+            return WalkOptions(merges=False)
+
+        return WalkOptions()
+
+    def feed(self, commit: Union[Commit, CommitRecord]) -> List[IssueOccurrence]:
+        """
+        Обрабатывает очередной коммит (в порядке от старого к новому).
+
+        Args:
+            commit (Union[Commit, CommitRecord]): Коммит из сканируемого диапазона.
+
+        Returns:
+            List[IssueOccurrence]: Новые появления задач, добавленные этим коммитом в результат.
+        """
+        return self.feed_parsed(parse_commit(commit))
+
+    def feed_parsed(self, commit: ParsedCommit) -> List[IssueOccurrence]:
+        """
+        Обрабатывает очередной уже разобранный коммит (в порядке от старого к новому).
+
+        Args:
+            commit (ParsedCommit): Разобранный коммит из сканируемого диапазона.
+
+        Returns:
+            List[IssueOccurrence]: Новые появления задач, добавленные этим коммитом в результат.
+        """
+        source = IssueSource.MERGE_BRANCH if commit.is_merge else IssueSource.COMMIT_MESSAGE
+        if source not in self.sources:
+            return []
+        if commit.is_merge and self.target_branch is not None and self.target_branch != commit.target_branch:
+            return []
+
+        occurrences = []
+        for project_id, issue_id in self.matcher.search_by_project(commit.issue_keys).items():
+            result = self.results[project_id]
+            issues = result.merge_commits if commit.is_merge else result.commit_messages
+            if issue_id in issues:
+                continue
+
+            occurrence = IssueOccurrence(issue_id=issue_id, project_id=project_id, source=source, commit=commit.hexsha)
+            issues[issue_id] = occurrence
+            occurrences.append(occurrence)
+
+        return occurrences
@@ -0,0 +1,107 @@
+import asyncio
+import inspect
+import pytest
+from git.exc import GitCommandError
+from .git_async_client import AsyncGitClient
+from .git_client import GitClient
+from .git_repo_builder import create_release_builder
+from .git_scan import IssueSource
+
+
+def create_release_repo() -> str:
+    """
+    Создает репозиторий с релизной веткой 'release/v1.1.0', в которую слиты три фича-ветки.
+    """
+    builder = create_release_builder()
+    for number in [3, 1, 2]:
+        builder.feature(f"TMOB-{number}", f"TMOB-{number} message 1", f"TAND-{number} message 2")
+
+    builder.commit("TIOS-7 message 1")
+    return builder.build()
+
+
+def test_async_client_matches_sync_client():
+    """
+    Проверяем, что асинхронный клиент находит те же задачи, что и синхронный.
+    """
+    repo_dir = create_release_repo()
+    sync_client = GitClient(repo_dir)
+    async_client = AsyncGitClient(repo_dir)
+    projects = ["TMOB", "TAND", "TIOS"]
+
+    results = asyncio.run(async_client.scan_issue_ids_by_project("v1.0.0", "release/v1.1.0", projects))
+
+    assert results == sync_client.scan_issue_ids_by_project("v1.0.0", "release/v1.1.0", projects)
+    assert asyncio.run(
+        async_client.get_issue_id_list_from_merge_commits("v1.0.0", "release/v1.1.0", "TMOB")
+    ) == ["TMOB-3", "TMOB-1", "TMOB-2"]
+    assert asyncio.run(
+        async_client.get_issue_id_list_from_commit_messages("v1.0.0", "release/v1.1.0", "TIOS")
+    ) == ["TIOS-7"]
+
+
+@pytest.mark.parametrize("method", [
+    "scan_issue_ids",
+    "scan_issue_ids_by_project",
+    "iter_issue_occurrences",
+    "get_issue_id_list_from_merge_commits",
+    "get_issue_id_list_from_commit_messages",
+])
+def test_async_client_methods_mirror_sync_signatures(method):
+    """
+    Проверяем, что позиционные вызовы, перенесенные с GitClient, передают аргументы в те же параметры.
+    """
+    def parameters(client_class):
+        return list(inspect.signature(getattr(client_class, method)).parameters.values())
+
+    assert parameters(AsyncGitClient) == parameters(GitClient)
+
+
+def test_concurrent_scans_share_event_loop():
+    """
+    Проверяем, что несколько обходов истории выполняются одновременно на одном цикле событий.
+    """
+    repo_dir = create_release_repo()
+    client = AsyncGitClient(repo_dir)
+
+    async def run():
+        return await asyncio.gather(
+            client.get_issue_id_list_from_merge_commits("v1.0.0", "release/v1.1.0", "TMOB"),
+            client.get_issue_id_list_from_commit_messages("v1.0.0", "release/v1.1.0", "TAND"),
+            client.get_issue_id_list_from_merge_commits("v1.0.0", "release/v1.1.0", "TMOB", first_parent=True),
+        )
+
+    assert asyncio.run(run()) == [
+        ["TMOB-3", "TMOB-1", "TMOB-2"],
+        ["TAND-3", "TAND-1", "TAND-2"],
+        ["TMOB-3", "TMOB-1", "TMOB-2"],
+    ]
+
+
+def test_iter_issue_occurrences_can_stop_early():
+    """
+    Проверяем, что обход можно прервать после первой задачи, не дожидаясь конца вывода git.
+    """
+    client = AsyncGitClient(create_release_repo())
+
+    async def run():
+        occurrences = client.iter_issue_occurrences(
+            "v1.0.0", "release/v1.1.0", ["TMOB"], sources=[IssueSource.COMMIT_MESSAGE]
+        )
+        async for occurrence in occurrences:
+            await occurrences.aclose()
+            return occurrence
+
+    occurrence = asyncio.run(run())
+
+    assert (occurrence.issue_id, occurrence.source) == ("TMOB-3", IssueSource.COMMIT_MESSAGE)
+
+
+def test_unknown_revision_raises_git_error():
+    """
+    Проверяем, что ошибка `git log` пробрасывается как GitCommandError.
+    """
+    client = AsyncGitClient(create_release_repo())
+
+    with pytest.raises(GitCommandError):
+        asyncio.run(client.scan_issue_ids("v1.0.0", "release/unknown", "TMOB"))
@@ -0,0 +1,98 @@
+import multiprocessing
+import shutil
+import pytest
+from .git_batch import ChangelogJob
+from .git_client import GitClient
+from .git_repo_builder import RepoBuilder, create_release_builder
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_scan_issue_ids_batch_keeps_job_order(max_workers):
+    """
+    Проверяем, что пакетное сканирование возвращает результаты в порядке заданий как последовательно, так и на пуле процессов.
+    """
+    builder = RepoBuilder()
+    builder.commit("Initial commit") # Создаем коммит 'Initial commit'
+    builder.tag("v1.0.0") # Создаем тег 'v1.0.0'
+    builder.branch("release/v1.1.0") # Создаем релизную ветку
+
+    # Работаем с первой фича-веткой
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
+
+    # Создаем тег 'v1.1.0-last-build'
+    builder.tag("v1.1.0-last-build")
+
+    # Работаем со второй фича-веткой
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-2")
+
+    # Визуализация графа репозитория:
+    #
+    # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-2' into release/v1.1.0
+    # |\
+    # | * (feature/TEST-2) TEST-2 message 1
+    # |/
+    # * (tag: v1.1.0-last-build) Merge branch 'feature/TEST-1' into release/v1.1.0
+    # |\
+    # | * (feature/TEST-1) TEST-1 message 1
+    # |/
+    # * (tag: v1.0.0, master) Initial commit
+
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    client = GitClient(repo_dir)
+
+    jobs = [
+        ChangelogJob("v1.0.0", "release/v1.1.0", "TEST"),
+        ChangelogJob("v1.1.0-last-build", "release/v1.1.0", "TEST", "release/v1.1.0"),
+        ChangelogJob("v1.0.0", "v1.1.0-last-build", "TEST"),
+        ("release/v1.1.0", "v1.0.0", "TEST", None),
+    ]
+    results = client.scan_issue_ids_batch(jobs, max_workers=max_workers)
+
+    assert [result.merge_issue_ids for result in results] == [["TEST-1", "TEST-2"], ["TEST-2"], ["TEST-1"], []]
+
+
+def test_scan_issue_ids_batch_workers_use_commit_index():
+    """
+    Проверяем, что воркеры создают клиент с настройками исходного клиента, включая индекс коммитов.
+    """
+    # Создаем изменяемый тестовый репозиторий: в него записывается индекс
+    repo_dir = create_release_builder(["TEST-1", "TEST-2"]).build(cache_root=None)
+    try:
+        client = GitClient(repo_dir, use_commit_index=True)
+        jobs = [ChangelogJob("v1.0.0", "release/v1.1.0", "TEST"), ChangelogJob("v1.0.0", "feature/TEST-1", "TEST")]
+        results = client.scan_issue_ids_batch(jobs, max_workers=2)
+
+        assert [result.commit_message_issue_ids for result in results] == [["TEST-1", "TEST-2"], ["TEST-1"]]
+        head = client.repo.commit("release/v1.1.0").hexsha
+        assert head in client.commit_index.get_many([head])
+        client.commit_index.close()
+    finally:
+        shutil.rmtree(repo_dir)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="Подмена метода нужна в воркерах")
+def test_scan_issue_ids_batch_propagates_job_errors(monkeypatch):
+    """
+    Проверяем, что ошибка задания в воркере передается вызывающему, а не запускает последовательный повтор.
+    """
+    calls = []
+
+    def scan_issue_ids(self, *job):
+        calls.append(job)
+        raise OSError("Ошибка задания")
+
+    repo_dir = create_release_builder(["TEST-1"]).build()
+    client = GitClient(repo_dir)
+    # Воркеры создаются fork-ом и наследуют подмену; вызовы в текущем процессе попадают в `calls`
+    monkeypatch.setattr(GitClient, "scan_issue_ids", scan_issue_ids)
+
+    with pytest.raises(OSError, match="Ошибка задания"):
+        client.scan_issue_ids_batch([ChangelogJob("v1.0.0", "release/v1.1.0", "TEST")] * 2, max_workers=2)
+    assert calls == []
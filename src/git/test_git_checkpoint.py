@@ -0,0 +1,110 @@
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from git import Repo
+from .git_checkpoint import Checkpoint, CheckpointStore
+from .git_client import GitClient
+from .git_repo_builder import create_release_builder
+from .git_scan import IssueOccurrence, IssueSource
+
+
+def create_repo() -> str:
+    """
+    Создает изменяемый репозиторий с тегом 'v1.0.0' и релизной веткой со слитой задачей TEST-1.
+    """
+    return create_release_builder(["TEST-1"]).build(cache_root=None)
+
+
+def test_scan_since_checkpoint_walks_only_new_commits():
+    """
+    Проверяем, что повторный запуск обходит только новые коммиты и дописывает задачи к сохраненным.
+    """
+    repo_dir = create_repo()
+    try:
+        repo = Repo(repo_dir)
+        repo.git.checkout("release/v1.1.0")
+        client = GitClient(repo_dir)
+
+        result = client.scan_issue_ids_since_checkpoint("v1.0.0", "release/v1.1.0", "TEST")
+        assert result.merge_issue_ids == ["TEST-1"]
+        assert result.commit_message_issue_ids == ["TEST-1"]
+
+        # Подменяем сохраненный результат: задача TEST-99 останется, только если старые коммиты не обходятся заново
+        store = CheckpointStore.for_repo(repo)
+        checkpoint = store.get("release/v1.1.0", "TEST", None)
+        checkpoint.result.commit_messages["TEST-99"] = IssueOccurrence(
+            "TEST-99", "TEST", IssueSource.COMMIT_MESSAGE, checkpoint.head
+        )
+        store.put("release/v1.1.0", "TEST", None, checkpoint)
+        store.close()
+
+        repo.index.commit("TEST-2 message 1")
+        repo.index.commit("TEST-1 message 2")
+        result = GitClient(repo_dir).scan_issue_ids_since_checkpoint("v1.0.0", "release/v1.1.0", "TEST")
+
+        assert result.commit_message_issue_ids == ["TEST-1", "TEST-99", "TEST-2"]
+        assert result.commit_messages["TEST-2"].commit == repo.commit("HEAD~1").hexsha
+    finally:
+        shutil.rmtree(repo_dir)
+
+
+def test_scan_since_checkpoint_rescans_after_force_push():
+    """
+    Проверяем, что после переписывания истории ветки диапазон сканируется заново.
+    """
+    repo_dir = create_repo()
+    try:
+        repo = Repo(repo_dir)
+        repo.git.checkout("release/v1.1.0")
+        client = GitClient(repo_dir)
+
+        repo.index.commit("TEST-2 message 1")
+        result = client.scan_issue_ids_since_checkpoint("v1.0.0", "release/v1.1.0", "TEST")
+        assert result.commit_message_issue_ids == ["TEST-1", "TEST-2"]
+
+        # Эмулируем force-push: коммит TEST-2 заменяется коммитом TEST-3
+        repo.git.reset("--hard", "HEAD~1")
+        repo.index.commit("TEST-3 message 1")
+        result = client.scan_issue_ids_since_checkpoint("v1.0.0", "release/v1.1.0", "TEST")
+
+        assert result.commit_message_issue_ids == ["TEST-1", "TEST-3"]
+        assert CheckpointStore.for_repo(repo).get("release/v1.1.0", "TEST", None).head == repo.head.commit.hexsha
+    finally:
+        shutil.rmtree(repo_dir)
+
+
+def test_checkpoint_store_keeps_separate_target_branches():
+    """
+    Проверяем, что контрольные точки различаются по целевой ветке и сохраняют порядок задач.
+    """
+    repo_dir = create_repo()
+    try:
+        client = GitClient(repo_dir)
+        filtered = client.scan_issue_ids_since_checkpoint("v1.0.0", "release/v1.1.0", "TEST", target_branch="master")
+        unfiltered = client.scan_issue_ids_since_checkpoint("v1.0.0", "release/v1.1.0", "TEST")
+
+        store = CheckpointStore.for_repo(Repo(repo_dir))
+        assert filtered.merge_issue_ids == []
+        assert unfiltered.merge_issue_ids == ["TEST-1"]
+        assert store.get("release/v1.1.0", "TEST", "master").result == filtered
+        assert isinstance(store.get("release/v1.1.0", "TEST", None), Checkpoint)
+    finally:
+        shutil.rmtree(repo_dir)
+
+
+def test_scan_since_checkpoint_from_another_thread():
+    """
+    Проверяем, что хранилище, открытое в одном потоке, используется при сканировании в другом.
+    """
+    repo_dir = create_repo()
+    try:
+        client = GitClient(repo_dir)
+        client.scan_issue_ids_since_checkpoint("v1.0.0", "release/v1.1.0", "TEST")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(
+                client.scan_issue_ids_since_checkpoint, "v1.0.0", "release/v1.1.0", "TEST"
+            ).result()
+
+        assert result.merge_issue_ids == ["TEST-1"]
+    finally:
+        shutil.rmtree(repo_dir)
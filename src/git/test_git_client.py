@@ -1,34 +1,23 @@
-import os
-import shutil
+import pytest
 from git import Repo
 from .git_client import GitClient
+from .git_repo_builder import RepoBuilder, create_release_builder
+from .git_scan import IssueSource
 
 
 def test_get_issue_id_list_between_parent_and_child_branches():
     """
     Проверяем формирование списка задач между родительской и дочерней ветками.
     """
+    builder = create_release_builder()
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    # Работаем с фича-веткой
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
 
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
-
-        # Работаем с фича-веткой
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
-
-        # Сливаем фича-ветку в релиз
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
-
-        return repo
+    # Сливаем фича-ветку в релиз
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
 
     # Визуализация графа репозитория:
     #
@@ -38,180 +27,129 @@ def test_get_issue_id_list_between_parent_and_child_branches():
     # |/
     # * (master, tag: v1.0.0) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        commit_from = repo.commit("master").hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
-        expected_issues = ["TEST-1"]
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
+    expected_issues = ["TEST-1"]
+    assert issues == expected_issues
 
 
 def test_get_issue_id_list_between_ahead_parent_and_child_branches():
     """
     Проверяем формирование списка задач между ушедшей вперед родительской и дочерней ветками.
     """
+    builder = create_release_builder()
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
-
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
-
-        # Работаем с фича-веткой
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
+    # Работаем с фича-веткой
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
 
-        # Сливаем фича-ветку в релиз
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
+    # Сливаем фича-ветку в релиз
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
 
-        # Сливаем другую фича-ветку напрямую в мастер
-        repo.git.checkout("master")
-        repo.git.checkout("-b", "feature/TEST-2")
-        repo.index.commit("TEST-2 message 1")
-        repo.git.checkout("master")
-        repo.git.merge("feature/TEST-2", "--no-ff")
-
-        return repo
+    # Сливаем другую фича-ветку напрямую в мастер
+    builder.checkout("master")
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.checkout("master")
+    builder.merge("feature/TEST-2")
 
     # Визуализация графа репозитория:
     #
     # * (HEAD -> master) Merge branch 'feature/TEST-2'
-    # |\  
+    # |\
     # | | * (release/v1.1.0) Merge branch 'feature/TEST-1' into release/v1.1.0
-    # | |/| 
-    # |/| | 
+    # | |/|
+    # |/| |
     # | * | (feature/TEST-2) TEST-2 message 1
-    # |/ /  
+    # |/ /
     # | * (feature/TEST-1) TEST-1 message 1
-    # |/  
+    # |/
     # * (tag: v1.0.0) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        commit_from = repo.commit("master").hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
-        expected_issues = ["TEST-1"]
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
+    expected_issues = ["TEST-1"]
+    assert issues == expected_issues
 
 
 def test_get_issue_id_list_after_merging_two_branches():
     """
     Проверяем формирование списка задач после слияния двух дочерних веток в родительскую.
     """
-
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
-
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
-
-        # Создаем и работаем с фича-ветками
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.checkout("-b", "feature/TEST-2")
-        repo.index.commit("TEST-2 message 1")
-        repo.git.checkout("feature/TEST-1")
-        repo.index.commit("TEST-1 message 2")
-        repo.git.checkout("feature/TEST-2")
-        repo.index.commit("TEST-2 message 2")
-
-        # Сливаем фича-ветки в релиз
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
-        repo.git.merge("feature/TEST-2", "--no-ff")
-
-        return repo
+    builder = create_release_builder()
+
+    # Создаем и работаем с фича-ветками
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.checkout("feature/TEST-1")
+    builder.commit("TEST-1 message 2")
+    builder.checkout("feature/TEST-2")
+    builder.commit("TEST-2 message 2")
+
+    # Сливаем фича-ветки в релиз
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
+    builder.merge("feature/TEST-2")
 
     # Визуализация графа репозитория:
     #
     # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-2' into release/v1.1.0
-    # |\  
+    # |\
     # * \ Merge branch 'feature/TEST-1' into release/v1.1.0
-    # |\ \  
+    # |\ \
     # | | * (feature/TEST-2) TEST-2 message 2
     # | * | (feature/TEST-1) TEST-1 message 2
     # | | * TEST-2 message 1
-    # | |/  
-    # |/|   
+    # | |/
+    # |/|
     # | * TEST-1 message 1
-    # |/  
+    # |/
     # * (tag: v1.0.0, master) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        commit_from = repo.commit("master").hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
-        expected_issues = ["TEST-1", "TEST-2"]
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
+    expected_issues = ["TEST-1", "TEST-2"]
+    assert issues == expected_issues
 
 
 def test_get_issue_id_list_in_same_commit():
     """
     Проверяем формирование списка задач между одним и тем же коммитом.
     """
+    builder = create_release_builder()
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
-
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
-
-        # Работаем с фича-веткой
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
+    # Работаем с фича-веткой
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
 
-        # Сливаем фича-ветку в релиз
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
-
-        return repo
+    # Сливаем фича-ветку в релиз
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
 
     # Визуализация графа репозитория:
     #
@@ -221,476 +159,489 @@ def test_get_issue_id_list_in_same_commit():
     # |/
     # * (master, tag: v1.0.0) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        commit_from = repo.commit("release/v1.1.0").hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
+    commit_from = repo.commit("release/v1.1.0").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
-        expected_issues = []
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
+    expected_issues = []
+    assert issues == expected_issues
 
 
 def test_get_issue_id_list_between_merge_commits_in_same_branch():
     """
     Проверяем формирование списка задач на ветке между двумя мерж-коммитами.
     """
+    builder = create_release_builder()
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
-
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
-
-        # Работаем с первой фича-веткой
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
+    # Работаем с первой фича-веткой
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
 
-        # Создаем тег 'v1.1.0-last-build'
-        repo.create_tag("v1.1.0-last-build")
+    # Создаем тег 'v1.1.0-last-build'
+    builder.tag("v1.1.0-last-build")
 
-        # Работаем со второй фича-веткой
-        repo.git.checkout("-b", "feature/TEST-2")
-        repo.index.commit("TEST-2 message 1")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-2", "--no-ff")
-
-        return repo
+    # Работаем со второй фича-веткой
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-2")
 
     # Визуализация графа репозитория:
     #
     # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-2' into release/v1.1.0
-    # |\  
+    # |\
     # | * (feature/TEST-2) TEST-2 message 1
-    # |/  
+    # |/
     # * (tag: v1.1.0-last-build) Merge branch 'feature/TEST-1' into release/v1.1.0
-    # |\  
+    # |\
     # | * (feature/TEST-1) TEST-1 message 1
-    # |/  
+    # |/
     # * (tag: v1.0.0, master) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        commit_from = repo.tag("v1.1.0-last-build").commit.hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
+    commit_from = repo.tag("v1.1.0-last-build").commit.hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
-        expected_issues = ["TEST-2"]
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
+    expected_issues = ["TEST-2"]
+    assert issues == expected_issues
 
 
 def test_get_issue_id_list_between_merge_commits_in_same_branch_reversed():
     """
     Проверяем формирование списка задач на ветке между двумя мерж-коммитами в обратном порядке.
     """
+    builder = create_release_builder()
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
-
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
+    # Работаем с первой фича-веткой
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
 
-        # Работаем с первой фича-веткой
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
+    # Создаем тег 'outdated-commit'
+    builder.tag("outdated-commit")
 
-        # Создаем тег 'outdated-commit'
-        repo.create_tag("outdated-commit")
+    # Работаем со второй фича-веткой
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-2")
 
-        # Работаем со второй фича-веткой
-        repo.git.checkout("-b", "feature/TEST-2")
-        repo.index.commit("TEST-2 message 1")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-2", "--no-ff")
-
-        # Создаем тег 'v1.1.0-last-build'
-        repo.create_tag("v1.1.0-last-build")
-
-        return repo
+    # Создаем тег 'v1.1.0-last-build'
+    builder.tag("v1.1.0-last-build")
 
     # Визуализация графа репозитория:
     #
     # * (HEAD -> release/v1.1.0, tag: v1.1.0-last-build) Merge branch 'feature/TEST-2' into release/v1.1.0
-    # |\  
+    # |\
     # | * (feature/TEST-2) TEST-2 message 1
-    # |/  
+    # |/
     # * (tag: outdated-commit) Merge branch 'feature/TEST-1' into release/v1.1.0
-    # |\  
+    # |\
     # | * (feature/TEST-1) TEST-1 message 1
-    # |/  
+    # |/
     # * (tag: v1.0.0, master) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        commit_from = repo.tag("v1.1.0-last-build").commit.hexsha
-        commit_to = repo.tag("outdated-commit").commit.hexsha
+    commit_from = repo.tag("v1.1.0-last-build").commit.hexsha
+    commit_to = repo.tag("outdated-commit").commit.hexsha
 
-        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
-        expected_issues = []
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
+    expected_issues = []
+    assert issues == expected_issues
 
 
-def test_get_issue_id_list_with_nested_merge_commits():
+def create_nested_merge_commits_builder() -> RepoBuilder:
     """
-    Проверяем формирование списка задач с вложенными мерж-коммитами.
+    Создает описание репозитория с фича-веткой, в которую влита другая фича-ветка.
     """
+    builder = create_release_builder()
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    # Создаем и работаем с фича-ветками
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.checkout("feature/TEST-1")
+    builder.merge("feature/TEST-2")
+    builder.commit("TEST-1 message 2")
 
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
-
-        # Создаем и работаем с фича-ветками
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
-        repo.git.checkout("-b", "feature/TEST-2")
-        repo.index.commit("TEST-2 message 1")
-        repo.git.checkout("feature/TEST-1")
-        repo.git.merge("feature/TEST-2", "--no-ff")
-        repo.index.commit("TEST-1 message 2")
-
-        # Сливаем фича-ветку в релиз
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
-
-        return repo
+    # Сливаем фича-ветку в релиз
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
 
     # Визуализация графа репозитория:
     #
     # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-1' into release/v1.1.0
-    # |\  
+    # |\
     # | * (feature/TEST-1) TEST-1 message 2
     # | * Merge branch 'feature/TEST-2' into feature/TEST-1
-    # | |\  
+    # | |\
     # | | * (feature/TEST-2) TEST-2 message 1
-    # | |/  
+    # | |/
     # | * TEST-1 message 1
-    # |/  
+    # |/
     # * (tag: v1.0.0, master) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    return builder
 
-        commit_from = repo.commit("master").hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
 
-        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
-        expected_issues = ["TEST-2", "TEST-1"]
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
-
-
-def test_get_issue_id_list_after_merge_external_branch():
+def test_get_issue_id_list_with_nested_merge_commits():
     """
-    Проверяем формирование списка задач после влития внешней ветки.
+    Проверяем формирование списка задач с вложенными мерж-коммитами.
     """
+    # Создаем тестовый репозиторий
+    repo_dir = create_nested_merge_commits_builder().build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
-
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
-
-        # Сливаем feature/TEST-1 в релизную ветку
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
-
-        # Создаем тег 'v1.1.0-last-build'
-        repo.create_tag("v1.1.0-last-build")
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        # Вносим изменения в мастер
-        repo.git.checkout("master")
-        repo.git.checkout("-b", "feature/TEST-3")
-        repo.index.commit("TEST-3 message 1")
-        repo.git.checkout("master")
-        repo.git.merge("feature/TEST-3", "--no-ff")
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
+    expected_issues = ["TEST-2", "TEST-1"]
+    assert issues == expected_issues
 
-        # Подливаем мастер в релизную ветку
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("master", "--no-ff")
 
-        # Сливаем feature/TEST-2 в релизную ветку
-        repo.git.checkout("-b", "feature/TEST-2")
-        repo.index.commit("TEST-2 message 1")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-2", "--no-ff")
-
-        return repo
+@pytest.mark.parametrize("use_git_log", [True, False])
+def test_get_issue_id_list_after_merge_external_branch(use_git_log):
+    """
+    Проверяем формирование списка задач после влития внешней ветки.
+    """
+    builder = create_release_builder()
+
+    # Сливаем feature/TEST-1 в релизную ветку
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
+
+    # Создаем тег 'v1.1.0-last-build'
+    builder.tag("v1.1.0-last-build")
+
+    # Вносим изменения в мастер
+    builder.checkout("master")
+    builder.branch("feature/TEST-3")
+    builder.commit("TEST-3 message 1")
+    builder.checkout("master")
+    builder.merge("feature/TEST-3")
+
+    # Подливаем мастер в релизную ветку
+    builder.checkout("release/v1.1.0")
+    builder.merge("master")
+
+    # Сливаем feature/TEST-2 в релизную ветку
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-2")
 
     # Визуализация графа репозитория:
     #
     # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-2' into release/v1.1.0
-    # |\  
+    # |\
     # | * (feature/TEST-2) TEST-2 message 1
-    # |/  
+    # |/
     # * Merge branch 'master' into release/v1.1.0
-    # |\  
+    # |\
     # * \ (tag: v1.1.0-last-build) Merge branch 'feature/TEST-1' into release/v1.1.0
-    # |\ \  
+    # |\ \
     # | | * (master) Merge branch 'feature/TEST-3'
-    # | |/| 
-    # |/| | 
+    # | |/|
+    # |/| |
     # | * | (feature/TEST-1) TEST-1 message 1
-    # |/ /  
+    # |/ /
     # | * (feature/TEST-3) TEST-3 message 1
-    # |/  
+    # |/
     # * (tag: v1.0.0) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir, use_git_log=use_git_log)
 
-        commit_from = repo.tag("v1.1.0-last-build").commit.hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
+    commit_from = repo.tag("v1.1.0-last-build").commit.hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST", target_branch="release/v1.1.0")
-        expected_issues = ["TEST-2"]
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST", target_branch="release/v1.1.0")
+    expected_issues = ["TEST-2"]
+    assert issues == expected_issues
 
 
 def test_get_issue_id_list_with_nested_merge_commits_and_specified_target_branch():
     """
     Проверяем формирование списка задач с вложенными мерж-коммитами и указанной целевой веткой.
     """
+    # Создаем тестовый репозиторий
+    repo_dir = create_nested_merge_commits_builder().build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST", target_branch="release/v1.1.0")
+    expected_issues = ["TEST-1"]
+    assert issues == expected_issues
 
-        # Создаем и работаем с фича-ветками
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
-        repo.git.checkout("-b", "feature/TEST-2")
-        repo.index.commit("TEST-2 message 1")
-        repo.git.checkout("feature/TEST-1")
-        repo.git.merge("feature/TEST-2", "--no-ff")
-        repo.index.commit("TEST-1 message 2")
 
-        # Сливаем фича-ветку в релиз
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
-
-        return repo
+def test_get_issue_id_list_from_commit_messages_after_merging_two_branches():
+    """
+    Проверяем формирование списка задач после слияния двух дочерних веток в родительскую.
+    """
+    builder = create_release_builder()
+
+    # Создаем и работаем с фича-ветками
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.checkout("feature/TEST-1")
+    builder.commit("TEST-1 message 2")
+    builder.checkout("feature/TEST-2")
+    builder.commit("TEST-2 message 2")
+
+    # Сливаем фича-ветки в релиз
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
+    builder.merge("feature/TEST-2")
 
     # Визуализация графа репозитория:
     #
-    # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-1' into release/v1.1.0
-    # |\  
-    # | * (feature/TEST-1) TEST-1 message 2
-    # | * Merge branch 'feature/TEST-2' into feature/TEST-1
-    # | |\  
-    # | | * (feature/TEST-2) TEST-2 message 1
-    # | |/  
+    # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-2' into release/v1.1.0
+    # |\
+    # * \ Merge branch 'feature/TEST-1' into release/v1.1.0
+    # |\ \
+    # | | * (feature/TEST-2) TEST-2 message 2
+    # | * | (feature/TEST-1) TEST-1 message 2
+    # | | * TEST-2 message 1
+    # | |/
+    # |/|
     # | * TEST-1 message 1
-    # |/  
+    # |/
     # * (tag: v1.0.0, master) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        commit_from = repo.commit("master").hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST", target_branch="release/v1.1.0")
-        expected_issues = ["TEST-1"]
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    issues = client.get_issue_id_list_from_commit_messages(commit_from, commit_to, project_id="TEST")
+    expected_issues = ["TEST-1", "TEST-2"]
+    assert issues == expected_issues
 
 
-def test_get_issue_id_list_from_commit_messages_after_merging_two_branches():
+def test_get_issue_id_list_from_commit_messages_after_fast_forward_merging_two_branches():
     """
     Проверяем формирование списка задач после слияния двух дочерних веток в родительскую.
     """
+    builder = create_release_builder()
+
+    # Создаем и работаем с фича-ветками
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.commit("TEST-1 message 2")
+    builder.checkout("release/v1.1.0")
+    builder.fast_forward("feature/TEST-1")
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.commit("TEST-2 message 2")
+    builder.checkout("release/v1.1.0")
+    builder.fast_forward("feature/TEST-2")
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    # Визуализация графа репозитория:
+    #
+    # *  (HEAD -> release/v1.1.0, feature/TEST-2) TEST-2 message 2
+    # *  TEST-2 message 1
+    # *  (feature/TEST-1) TEST-1 message 2
+    # *  TEST-1 message 1
+    # *  (tag: v1.0.0, master) Initial commit
 
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        # Создаем и работаем с фича-ветками
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.checkout("-b", "feature/TEST-2")
-        repo.index.commit("TEST-2 message 1")
-        repo.git.checkout("feature/TEST-1")
-        repo.index.commit("TEST-1 message 2")
-        repo.git.checkout("feature/TEST-2")
-        repo.index.commit("TEST-2 message 2")
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
+
+    issues = client.get_issue_id_list_from_commit_messages(commit_from, commit_to, project_id="TEST")
+    expected_issues = ["TEST-1", "TEST-2"]
+    assert issues == expected_issues
+
+
+def test_scan_issue_ids_collects_both_sources_in_single_pass():
+    """
+    Проверяем, что однопроходное сканирование возвращает задачи из обоих источников вместе с коммитом первого появления.
+    """
+    builder = create_release_builder()
 
-        # Сливаем фича-ветки в релиз
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--no-ff")
-        repo.git.merge("feature/TEST-2", "--no-ff")
+    # Работаем с фича-веткой
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.commit("TEST-1 message 2")
 
-        return repo
+    # Сливаем фича-ветку в релиз
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
 
     # Визуализация графа репозитория:
     #
-    # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-2' into release/v1.1.0
-    # |\  
-    # * \ Merge branch 'feature/TEST-1' into release/v1.1.0
-    # |\ \  
-    # | | * (feature/TEST-2) TEST-2 message 2
-    # | * | (feature/TEST-1) TEST-1 message 2
-    # | | * TEST-2 message 1
-    # | |/  
-    # |/|   
+    # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-1' into release/v1.1.0
+    # |\
+    # | * (feature/TEST-1) TEST-1 message 2
     # | * TEST-1 message 1
-    # |/  
-    # * (tag: v1.0.0, master) Initial commit
+    # |/
+    # * (master, tag: v1.0.0) Initial commit
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        commit_from = repo.commit("master").hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        issues = client.get_issue_id_list_from_commit_messages(commit_from, commit_to, project_id="TEST")
-        expected_issues = ["TEST-1", "TEST-2"]
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    result = client.scan_issue_ids(commit_from, commit_to, project_id="TEST")
+    assert result.merge_issue_ids == ["TEST-1"]
+    assert result.commit_message_issue_ids == ["TEST-1"]
 
+    merge_occurrence = result.merge_commits["TEST-1"]
+    assert merge_occurrence.source == IssueSource.MERGE_BRANCH
+    assert merge_occurrence.commit == commit_to
 
-def test_get_issue_id_list_from_commit_messages_after_fast_forward_merging_two_branches():
+    message_occurrence = result.commit_messages["TEST-1"]
+    assert message_occurrence.source == IssueSource.COMMIT_MESSAGE
+    assert message_occurrence.commit == repo.commit("feature/TEST-1~1").hexsha
+
+
+def test_get_issue_id_lists_for_several_projects():
     """
-    Проверяем формирование списка задач после слияния двух дочерних веток в родительскую.
+    Проверяем формирование списков задач сразу для нескольких проектов за один обход истории.
     """
+    builder = create_release_builder()
+
+    # Создаем и работаем с фича-ветками разных проектов
+    builder.branch("feature/TMOB-1")
+    builder.commit("TMOB-1 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TMOB-1")
+    builder.branch("feature/TAND-2")
+    builder.commit("TAND-2 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TAND-2")
 
-    def create_test_repo(repo_dir: str):
-        # Удаляем старый репозиторий, если он существует
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    # Визуализация графа репозитория:
+    #
+    # * (HEAD -> release/v1.1.0) Merge branch 'feature/TAND-2' into release/v1.1.0
+    # |\
+    # | * (feature/TAND-2) TAND-2 message 1
+    # |/
+    # * Merge branch 'feature/TMOB-1' into release/v1.1.0
+    # |\
+    # | * (feature/TMOB-1) TMOB-1 message 1
+    # |/
+    # * (master, tag: v1.0.0) Initial commit
+
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
 
-        repo = Repo.init(repo_dir)
-        repo.git.branch("-m", "main", "master") # Переименовываем ветку main в master
-        repo.index.commit("Initial commit") # Создаем коммит 'Initial commit'
-        repo.create_tag("v1.0.0") # Создаем тег 'v1.0.0'
-        repo.git.checkout("-b", "release/v1.1.0") # Создаем релизную ветку
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
 
-        # Создаем и работаем с фича-ветками
-        repo.git.checkout("-b", "feature/TEST-1")
-        repo.index.commit("TEST-1 message 1")
-        repo.index.commit("TEST-1 message 2")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-1", "--ff-only")
-        repo.git.checkout("-b", "feature/TEST-2")
-        repo.index.commit("TEST-2 message 1")
-        repo.index.commit("TEST-2 message 2")
-        repo.git.checkout("release/v1.1.0")
-        repo.git.merge("feature/TEST-2", "--ff-only")
+    issues = client.get_issue_id_lists_from_merge_commits(commit_from, commit_to, project_ids=["TMOB", "TAND", "TIOS"])
+    expected_issues = {"TMOB": ["TMOB-1"], "TAND": ["TAND-2"], "TIOS": []}
+    assert issues == expected_issues
 
-        return repo
+    issues = client.get_issue_id_lists_from_commit_messages(commit_from, commit_to, project_ids=["TMOB", "TAND"])
+    expected_issues = {"TMOB": ["TMOB-1"], "TAND": ["TAND-2"]}
+    assert issues == expected_issues
+
+
+def test_get_issue_id_list_with_nested_merge_commits_and_first_parent():
+    """
+    Проверяем формирование списка задач с вложенными мерж-коммитами при обходе только первых родителей.
+    """
+    # Создаем тестовый репозиторий
+    repo_dir = create_nested_merge_commits_builder().build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
+
+    commit_from = repo.commit("master").hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
+
+    issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST", first_parent=True)
+    expected_issues = ["TEST-1"]
+    assert issues == expected_issues
+
+    issues = client.get_issue_id_list_from_commit_messages(commit_from, commit_to, project_id="TEST", first_parent=True)
+    expected_issues = []
+    assert issues == expected_issues
+
+
+def test_get_issue_id_list_from_commit_messages_after_merge_external_branch_and_first_parent():
+    """
+    Проверяем, что при обходе только первых родителей коммиты подлитой внешней ветки не попадают в список задач.
+    """
+    builder = create_release_builder()
+
+    # Создаем тег 'v1.1.0-last-build'
+    builder.tag("v1.1.0-last-build")
+
+    # Вносим изменения в мастер
+    builder.checkout("master")
+    builder.commit("TEST-3 message 1")
+
+    # Подливаем мастер в релизную ветку
+    builder.checkout("release/v1.1.0")
+    builder.merge("master")
+
+    # Работаем прямо в релизной ветке
+    builder.commit("TEST-2 message 1")
 
     # Визуализация графа репозитория:
     #
-    # *  (HEAD -> release/v1.1.0, feature/TEST-2) TEST-2 message 2
-    # *  TEST-2 message 1
-    # *  (feature/TEST-1) TEST-1 message 2
-    # *  TEST-1 message 1
-    # *  (tag: v1.0.0, master) Initial commit
+    # * (HEAD -> release/v1.1.0) TEST-2 message 1
+    # * Merge branch 'master' into release/v1.1.0
+    # |\
+    # | * (master) TEST-3 message 1
+    # |/
+    # * (tag: v1.0.0, tag: v1.1.0-last-build) Initial commit
+
+    # Создаем тестовый репозиторий
+    repo_dir = builder.build()
+    repo = Repo(repo_dir)
+    client = GitClient(repo_dir)
+
+    commit_from = repo.tag("v1.1.0-last-build").commit.hexsha
+    commit_to = repo.commit("release/v1.1.0").hexsha
+
+    issues = client.get_issue_id_list_from_commit_messages(commit_from, commit_to, project_id="TEST")
+    expected_issues = ["TEST-3", "TEST-2"]
+    assert issues == expected_issues
 
-    try:
-        # Создаем тестовый репозиторий
-        repo_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_repo")
-        repo = create_test_repo(repo_dir)
-        client = GitClient(repo_dir)
-
-        commit_from = repo.commit("master").hexsha
-        commit_to = repo.commit("release/v1.1.0").hexsha
-
-        issues = client.get_issue_id_list_from_commit_messages(commit_from, commit_to, project_id="TEST")
-        expected_issues = ["TEST-1", "TEST-2"]
-        assert issues == expected_issues
-    finally:
-        # Удаляем репозиторий после теста
-        if os.path.exists(repo_dir):
-            shutil.rmtree(repo_dir)
+    issues = client.get_issue_id_list_from_commit_messages(commit_from, commit_to, project_id="TEST", first_parent=True)
+    expected_issues = ["TEST-2"]
+    assert issues == expected_issues
@@ -0,0 +1,93 @@
+import os
+import shutil
+from git import Repo
+from .git_client import GitClient
+from .git_commit_index import CommitIndex
+from .git_helpers import ParsedCommit
+from .git_repo_builder import RepoBuilder
+
+
+def test_commit_index_parses_only_new_commits():
+    """
+    Проверяем, что при включенном индексе повторно разбираются только новые коммиты.
+    """
+    builder = RepoBuilder()
+    builder.commit("Initial commit") # Создаем коммит 'Initial commit'
+    builder.tag("v1.0.0") # Создаем тег 'v1.0.0'
+    builder.branch("release/v1.1.0") # Создаем релизную ветку
+
+    # Работаем с фича-веткой
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+
+    # Сливаем фича-ветку в релиз
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
+
+    # Визуализация графа репозитория:
+    #
+    # * (HEAD -> release/v1.1.0) Merge branch 'feature/TEST-1' into release/v1.1.0
+    # |\
+    # | * (feature/TEST-1) TEST-1 message 1
+    # |/
+    # * (master, tag: v1.0.0) Initial commit
+
+    # Создаем изменяемый тестовый репозиторий: в него добавляются коммиты и индекс
+    repo_dir = builder.build(cache_root=None)
+    try:
+        repo = Repo(repo_dir)
+        client = GitClient(repo_dir, use_commit_index=True)
+
+        commit_from = repo.commit("master").hexsha
+        commit_to = repo.commit("release/v1.1.0").hexsha
+
+        issues = client.get_issue_id_list_from_merge_commits(commit_from, commit_to, project_id="TEST")
+        assert issues == ["TEST-1"]
+
+        # Подменяем запись в индексе: если коммит не разбирается повторно, результат возьмется из индекса
+        index = CommitIndex.for_repo(repo)
+        index.put_many([ParsedCommit(commit_to, True, "feature/TEST-9", "release/v1.1.0", "TEST-9")])
+        index.close()
+
+        # Добавляем новый коммит: он должен быть разобран и дописан в индекс
+        repo.index.commit("TEST-2 message 1")
+        commit_to = repo.commit("release/v1.1.0").hexsha
+
+        client = GitClient(repo_dir, use_commit_index=True)
+        result = client.scan_issue_ids(commit_from, commit_to, project_id="TEST")
+        assert result.merge_issue_ids == ["TEST-9"]
+        assert result.commit_message_issue_ids == ["TEST-1", "TEST-2"]
+        assert commit_to in client.commit_index.get_many([commit_to])
+    finally:
+        # Удаляем репозиторий после теста
+        if os.path.exists(repo_dir):
+            shutil.rmtree(repo_dir)
+
+
+def test_commit_index_is_shared_by_worktrees():
+    """
+    Проверяем, что связанное рабочее дерево открывает тот же индекс, что и основной репозиторий.
+    """
+    builder = RepoBuilder()
+    builder.commit("Initial commit") # Создаем коммит 'Initial commit'
+    builder.branch("release/v1.1.0") # Создаем релизную ветку
+    builder.commit("TEST-1 message 1")
+    builder.checkout("master")
+
+    repo_dir = builder.build(cache_root=None)
+    worktree_dir = repo_dir + "-worktree"
+    try:
+        repo = Repo(repo_dir)
+        repo.git.worktree("add", worktree_dir, "release/v1.1.0")
+
+        client = GitClient(worktree_dir, use_commit_index=True)
+        assert client.get_issue_id_list_from_commit_messages("master", "release/v1.1.0", "TEST") == ["TEST-1"]
+        client.commit_index.close()
+
+        index = CommitIndex.for_repo(repo)
+        assert index.path == os.path.join(repo.common_dir, "auto-changelog-index.sqlite")
+        assert repo.commit("release/v1.1.0").hexsha in index.get_many([repo.commit("release/v1.1.0").hexsha])
+        index.close()
+    finally:
+        shutil.rmtree(worktree_dir, ignore_errors=True)
+        shutil.rmtree(repo_dir)
@@ -1,10 +1,13 @@
 import pytest
 from .git_helpers import (
+    IssueIdMatcher,
+    get_issue_id_matcher,
     is_merge_commit,
     extract_target_branch_name,
     extract_source_branch_name,
     extract_issue_id_from_branch_name,
     extract_issue_id_from_commit_message,
+    extract_issue_keys,
 )
 
 
@@ -102,3 +105,51 @@ def test_extract_issue_id_from_branch_name(branch_name, project_id, expected_iss
 def test_extract_issue_id_from_commit_message(commit_message, project_id, expected_issue_id):
     """Проверяет, что извлечение ID задачи из сообщения коммита работает корректно."""
     assert extract_issue_id_from_commit_message(commit_message, project_id) == expected_issue_id
+
+
+@pytest.mark.parametrize(
+    "text, expected_issue_ids",
+    [
+        ("", {}),
+        ("message", {}),
+        ("TEST-1 message", {}),
+        ("TMOB-1 message", {"TMOB": "TMOB-1"}),
+        ("TMOB-1 TMOB-2", {"TMOB": "TMOB-1"}),
+        ("TAND-2 TMOB-1 message", {"TAND": "TAND-2", "TMOB": "TMOB-1"}),
+        ("release/v1.0.0/feature/TIOS-3-TMOB-4-some-feature", {"TIOS": "TIOS-3", "TMOB": "TMOB-4"}),
+        ("XTMOB-5", {"TMOB": "TMOB-5"}),
+    ]
+)
+def test_issue_id_matcher_search_by_project(text, expected_issue_ids):
+    """Проверяет, что поиск находит первый ID задачи для каждого проекта."""
+    matcher = IssueIdMatcher(["TMOB", "TAND", "TIOS"])
+    assert matcher.search_by_project(text) == expected_issue_ids
+
+
+def test_issue_id_matcher_overlapping_prefixes():
+    """Проверяет, что пересекающиеся префиксы проектов не скрывают друг друга."""
+    matcher = IssueIdMatcher(["TEST", "ATEST"])
+    assert matcher.search_by_project("ATEST-1") == {"ATEST": "ATEST-1", "TEST": "TEST-1"}
+    assert matcher.search("ATEST-1") == "ATEST-1"
+
+
+def test_get_issue_id_matcher_is_cached():
+    """Проверяет, что поисковик для одного набора проектов компилируется один раз."""
+    assert get_issue_id_matcher(("TMOB", "TAND")) is get_issue_id_matcher(("TMOB", "TAND"))
+
+
+@pytest.mark.parametrize(
+    "text, project_id",
+    [
+        ("PROJ-123 PROJ-1234", "PROJ"),
+        ("feat(auth) message #PROJ-123", "PROJ"),
+        ("release/v1.0.0/bugfix/PROJ-123-fix-something", "PROJ"),
+        ("XPROJ-5 and PROJ-6", "PROJ"),
+        ("A-1PROJ-2", "PROJ"),
+        ("message", "PROJ"),
+    ]
+)
+def test_extract_issue_keys_keeps_issue_ids(text, project_id):
+    """Проверяет, что поиск по кандидатам дает тот же ID задачи, что и поиск по исходному тексту."""
+    assert extract_issue_id_from_commit_message(extract_issue_keys(text), project_id) == \
+        extract_issue_id_from_commit_message(text, project_id)
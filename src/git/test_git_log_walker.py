@@ -0,0 +1,46 @@
+from .git_log_walker import CommitRecord, CommitRecordParser, parse_commit_record
+
+
+def test_parse_commit_record_regular_commit():
+    """Проверяет разбор записи обычного коммита."""
+    record = parse_commit_record(b"aaa\x1fbbb\x1fTEST-1 message 1\n")
+    assert record == CommitRecord(hexsha="aaa", parents=("bbb",), message="TEST-1 message 1\n")
+
+
+def test_parse_commit_record_merge_commit():
+    """Проверяет, что у merge-коммита сохраняются все родители."""
+    record = parse_commit_record(b"aaa\x1fbbb ccc\x1fMerge branch 'feature/TEST-1' into master\n")
+    assert record.parents == ("bbb", "ccc")
+
+
+def test_parse_commit_record_root_commit():
+    """Проверяет, что у корневого коммита нет родителей."""
+    record = parse_commit_record(b"aaa\x1f\x1fInitial commit\n")
+    assert record.parents == ()
+
+
+def test_parse_commit_record_keeps_separator_in_message():
+    """Проверяет, что сообщение коммита не обрезается по разделителю полей."""
+    record = parse_commit_record(b"aaa\x1fbbb\x1ffirst\x1fsecond")
+    assert record.message == "first\x1fsecond"
+
+
+def test_commit_record_parser_handles_split_chunks():
+    """Проверяет, что записи, разорванные между блоками, собираются корректно."""
+    stream = b"aaa\x1f\x1fInitial commit\n\x00bbb\x1faaa\x1fTEST-1 message\n\x00"
+    parser = CommitRecordParser()
+
+    records = []
+    for i in range(0, len(stream), 5):
+        records.extend(parser.feed(stream[i:i + 5]))
+    records.extend(parser.close())
+
+    assert [record.hexsha for record in records] == ["aaa", "bbb"]
+    assert records[1].message == "TEST-1 message\n"
+
+
+def test_commit_record_parser_flushes_unterminated_record():
+    """Проверяет, что последняя запись без разделителя возвращается при закрытии."""
+    parser = CommitRecordParser()
+    assert parser.feed(b"aaa\x1f\x1fInitial commit") == []
+    assert parser.close() == [CommitRecord(hexsha="aaa", parents=(), message="Initial commit")]
@@ -0,0 +1,101 @@
+import os
+import shutil
+from git import Repo
+from .git_client import GitClient
+from .git_refs import RefResolver, get_refs_signature, parse_for_each_ref
+from .git_repo_builder import create_release_builder
+
+
+# Автор аннотированных тегов: тесты не зависят от глобальной настройки `user.name`/`user.email`.
+GIT_IDENTITY = ["user.name=Auto Changelog", "user.email=auto-changelog@example.com"]
+
+
+def create_repo() -> str:
+    """
+    Создает изменяемый репозиторий с тегом 'v1.0.0' и веткой 'release/v1.1.0' с задачей TEST-1.
+    """
+    return create_release_builder().commit("TEST-1 message 1").build(cache_root=None)
+
+
+def test_parse_for_each_ref_prefers_tags_over_branches():
+    """
+    Проверяем, что короткое имя разрешается с приоритетом git, а аннотированный тег — в коммит.
+    """
+    refs = parse_for_each_ref(
+        "refs/heads/v1 aaa \n"
+        "refs/tags/v1 bbb ccc\n"
+        "refs/remotes/origin/main ddd \n"
+    )
+
+    assert refs["v1"] == "ccc"
+    assert refs["refs/heads/v1"] == refs["heads/v1"] == "aaa"
+    assert refs["origin/main"] == "ddd"
+
+
+def test_resolver_reads_refs_once_and_reloads_after_changes():
+    """
+    Проверяем, что ссылки читаются одним вызовом и перечитываются только после изменения файлов ссылок.
+    """
+    repo_dir = create_repo()
+    try:
+        repo = Repo(repo_dir)
+        resolver = RefResolver(repo)
+
+        resolved = resolver.resolve_many(["v1.0.0", "release/v1.1.0", "release/v1.1.0~1", "unknown"])
+        assert resolved == {
+            "v1.0.0": repo.commit("v1.0.0").hexsha,
+            "release/v1.1.0": repo.commit("release/v1.1.0").hexsha,
+            "release/v1.1.0~1": repo.commit("v1.0.0").hexsha,
+            "unknown": None,
+        }
+        resolver.resolve("release/v1.1.0")
+        assert resolver.loads == 1
+
+        # Новый аннотированный тег — свободная ссылка
+        repo.git(c=GIT_IDENTITY).tag("-a", "v1.1.0", "release/v1.1.0", "-m", "Release 1.1.0")
+        assert resolver.resolve("v1.1.0") == repo.commit("release/v1.1.0").hexsha
+        assert resolver.loads == 2
+
+        # Упаковка ссылок меняет `packed-refs`
+        repo.git.pack_refs("--all")
+        assert resolver.tags() == {"v1.0.0": repo.commit("v1.0.0").hexsha, "v1.1.0": repo.commit("v1.1.0").hexsha}
+        assert resolver.loads == 3
+    finally:
+        shutil.rmtree(repo_dir)
+
+
+def test_refs_signature_tracks_reftable():
+    """
+    Проверяем, что отпечаток меняется при обновлении списка таблиц reftable.
+    """
+    repo_dir = create_repo()
+    try:
+        repo = Repo(repo_dir)
+        signature = get_refs_signature(repo)
+
+        # Хранилище reftable переписывает `tables.list` при каждом изменении ссылок
+        os.makedirs(os.path.join(repo.common_dir, "reftable"))
+        with open(os.path.join(repo.common_dir, "reftable", "tables.list"), "w") as tables:
+            tables.write("0x000000000001-0x000000000001-00000000.ref\n")
+
+        assert get_refs_signature(repo) != signature
+    finally:
+        shutil.rmtree(repo_dir)
+
+
+def test_git_client_resolves_moved_branch():
+    """
+    Проверяем, что GitClient видит новое положение ветки после ее обновления.
+    """
+    repo_dir = create_repo()
+    try:
+        client = GitClient(repo_dir)
+        assert client.get_issue_id_list_from_commit_messages("v1.0.0", "release/v1.1.0", "TEST") == ["TEST-1"]
+
+        repo = Repo(repo_dir)
+        repo.git.checkout("release/v1.1.0")
+        repo.index.commit("TEST-2 message 1")
+
+        assert client.get_issue_id_list_from_commit_messages("v1.0.0", "release/v1.1.0", "TEST") == ["TEST-1", "TEST-2"]
+    finally:
+        shutil.rmtree(repo_dir)
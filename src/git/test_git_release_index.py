@@ -0,0 +1,101 @@
+import os
+import shutil
+from .git_client import GitClient
+from .git_release_index import ReleaseGraphIndex
+from .git_repo_builder import RepoBuilder, create_release_builder
+
+
+def test_release_index_answers_tag_pairs_without_walking_history():
+    """
+    Проверяем, что индекс релизного графа отвечает на запросы между тегами так же, как обход диапазона.
+    """
+    builder = RepoBuilder()
+    builder.commit("Initial commit") # Создаем коммит 'Initial commit'
+    builder.tag("v1.0.0") # Создаем тег 'v1.0.0'
+    builder.branch("release/v1.1.0") # Создаем релизную ветку
+
+    # Работаем с первой фича-веткой
+    builder.branch("feature/TEST-1")
+    builder.commit("TEST-1 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-1")
+
+    # Создаем тег 'v1.1.0-build-1'
+    builder.tag("v1.1.0-build-1")
+
+    # Работаем со второй фича-веткой
+    builder.branch("feature/TEST-2")
+    builder.commit("TEST-2 message 1")
+    builder.checkout("release/v1.1.0")
+    builder.merge("feature/TEST-2")
+
+    # Создаем тег 'v1.1.0-build-2'
+    builder.tag("v1.1.0-build-2")
+
+    # Визуализация графа репозитория:
+    #
+    # * (HEAD -> release/v1.1.0, tag: v1.1.0-build-2) Merge branch 'feature/TEST-2' into release/v1.1.0
+    # |\
+    # | * (feature/TEST-2) TEST-2 message 1
+    # |/
+    # * (tag: v1.1.0-build-1) Merge branch 'feature/TEST-1' into release/v1.1.0
+    # |\
+    # | * (feature/TEST-1) TEST-1 message 1
+    # |/
+    # * (tag: v1.0.0, master) Initial commit
+
+    # Создаем изменяемый тестовый репозиторий: он удаляется посреди теста
+    repo_dir = builder.build(cache_root=None)
+    try:
+        client = GitClient(repo_dir)
+        index = client.build_release_index(project_id="TEST", target_branch="release/v1.1.0")
+
+        pairs = [
+            ("v1.0.0", "v1.1.0-build-1", ["TEST-1"]),
+            ("v1.0.0", "v1.1.0-build-2", ["TEST-1", "TEST-2"]),
+            ("v1.1.0-build-1", "v1.1.0-build-2", ["TEST-2"]),
+            ("v1.1.0-build-2", "v1.1.0-build-1", []),
+        ]
+        for commit_from, commit_to, expected_issues in pairs:
+            assert index.get_merge_issue_ids(commit_from, commit_to) == expected_issues
+            assert index.get_commit_message_issue_ids(commit_from, commit_to) == expected_issues
+
+        # После удаления репозитория ответы по индексу остаются доступны
+        index_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "test_release_index.json")
+        index.save(index_path)
+        shutil.rmtree(repo_dir)
+        loaded = ReleaseGraphIndex.load(index_path)
+        os.remove(index_path)
+
+        assert loaded.covers("v1.1.0-build-1", "v1.1.0-build-2", "TEST", "release/v1.1.0")
+        assert loaded.get_merge_issue_ids("v1.1.0-build-1", "v1.1.0-build-2") == ["TEST-2"]
+    finally:
+        # Удаляем репозиторий после теста
+        if os.path.exists(repo_dir):
+            shutil.rmtree(repo_dir)
+
+
+def test_release_index_does_not_change_client_results():
+    """
+    Проверяем, что построенный индекс не меняет ответы методов клиента, если задача повторяется между тегами.
+    """
+    builder = create_release_builder(["TEST-1"])
+    builder.tag("v2.0.0") # Создаем тег 'v2.0.0'
+    builder.feature("TEST-3")
+    builder.commit("TEST-1 message 2") # Доработка задачи из предыдущего релиза
+    builder.feature("TEST-2")
+    builder.tag("v3.0.0") # Создаем тег 'v3.0.0'
+    repo_dir = builder.build()
+
+    walk = GitClient(repo_dir)
+    client = GitClient(repo_dir)
+    index = client.build_release_index(project_id="TEST")
+
+    expected_messages = walk.get_issue_id_list_from_commit_messages("v2.0.0", "v3.0.0", "TEST")
+    expected_merges = walk.get_issue_id_list_from_merge_commits("v2.0.0", "v3.0.0", "TEST")
+    assert expected_messages == ["TEST-3", "TEST-1", "TEST-2"]
+    assert client.get_issue_id_list_from_commit_messages("v2.0.0", "v3.0.0", "TEST") == expected_messages
+    assert client.get_issue_id_list_from_merge_commits("v2.0.0", "v3.0.0", "TEST") == expected_merges
+
+    # Собственный запрос индекса — разность множеств: повторная задача в нее не попадает
+    assert "TEST-1" not in index.get_commit_message_issue_ids("v2.0.0", "v3.0.0")
@@ -0,0 +1,61 @@
+import pytest
+from git import Repo
+from .git_repo_builder import RepoBuilder, create_release_builder
+
+
+def test_repo_builder_reproduces_git_merge_graph(tmp_path):
+    """
+    Проверяем, что построитель воспроизводит граф и сообщения `git merge --no-ff` и переиспользует кеш.
+    """
+    builder = RepoBuilder()
+    builder.commit("Initial commit").tag("v1.0.0").branch("release/v1.1.0")
+    builder.branch("feature/TEST-1").commit("TEST-1 message 1")
+    builder.checkout("release/v1.1.0").merge("feature/TEST-1")
+    builder.checkout("master").merge("release/v1.1.0")
+
+    repo_dir = builder.build(cache_root=str(tmp_path))
+    repo = Repo(repo_dir)
+
+    assert repo.active_branch.name == "master"
+    assert not repo.is_dirty(untracked_files=True)
+    assert repo.tag("v1.0.0").commit == repo.commit("master~1")
+
+    release = repo.commit("release/v1.1.0")
+    assert release.message == "Merge branch 'feature/TEST-1' into release/v1.1.0"
+    assert [parent.message for parent in release.parents] == ["Initial commit", "TEST-1 message 1"]
+    assert repo.commit("master").message == "Merge branch 'release/v1.1.0'"
+
+    # Повторная сборка того же описания возвращает репозиторий из кеша
+    builder_copy = RepoBuilder()
+    builder_copy.operations = list(builder.operations)
+    assert builder_copy.build(cache_root=str(tmp_path)) == repo_dir
+
+
+def test_repo_builder_rejects_unknown_branch(tmp_path):
+    """
+    Проверяем, что слияние несуществующей ветки приводит к ошибке.
+    """
+    builder = RepoBuilder().commit("Initial commit").merge("feature/TEST-1")
+
+    with pytest.raises(ValueError):
+        builder.build(cache_root=str(tmp_path))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_create_release_builder_merges_features_into_release(tmp_path):
+    """
+    Проверяем, что фича-ветки создаются от релизной ветки и сливаются обратно в нее.
+    """
+    builder = create_release_builder(["TEST-1"]).feature("TEST-2", "TEST-2 message 1", "TEST-2 message 2")
+
+    repo = Repo(builder.build(cache_root=str(tmp_path)))
+
+    assert repo.active_branch.name == "release/v1.1.0"
+    assert [commit.message for commit in repo.iter_commits("v1.0.0..release/v1.1.0", reverse=True)] == [
+        "TEST-1 message 1",
+        "Merge branch 'feature/TEST-1' into release/v1.1.0",
+        "TEST-2 message 1",
+        "TEST-2 message 2",
+        "Merge branch 'feature/TEST-2' into release/v1.1.0",
+    ]
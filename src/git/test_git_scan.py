@@ -0,0 +1,41 @@
+from .git_helpers import IssueIdMatcher, ParsedCommit
+from .git_log_walker import WalkOptions
+from .git_scan import IssueScanner, IssueSource
+
+
+MERGE_COMMIT = ParsedCommit("aaa", True, "feature/TEST-1", "release/v1.1.0", "TEST-1")
+REGULAR_COMMIT = ParsedCommit("bbb", False, None, None, "TEST-2")
+
+
+def test_walk_options_for_merge_source_with_target_branch():
+    """Проверяет, что для merge-коммитов git отбирает только слияния в целевую ветку."""
+    scanner = IssueScanner(IssueIdMatcher(["TEST"]), "release/v1.1.0", [IssueSource.MERGE_BRANCH])
+    assert scanner.walk_options() == WalkOptions(merges=True, grep="into release/v1.1.0")
+    assert scanner.walk_options().to_args() == ["--merges", "--fixed-strings", "--grep=into release/v1.1.0"]
+
+
+def test_walk_options_for_commit_message_source():
+    """Проверяет, что для сообщений коммитов git исключает merge-коммиты."""
+    scanner = IssueScanner(IssueIdMatcher(["TEST"]), sources=[IssueSource.COMMIT_MESSAGE])
+    assert scanner.walk_options().to_args() == ["--no-merges"]
+
+
+def test_walk_options_for_all_sources():
+    """Проверяет, что при сканировании всех источников git ничего не отфильтровывает."""
+    scanner = IssueScanner(IssueIdMatcher(["TEST"]), "release/v1.1.0")
+    assert scanner.walk_options().to_args() == []
+
+
+def test_feed_parsed_skips_unselected_sources():
+    """Проверяет, что коммиты невыбранного источника не попадают в результат."""
+    scanner = IssueScanner(IssueIdMatcher(["TEST"]), sources=[IssueSource.COMMIT_MESSAGE])
+    assert scanner.feed_parsed(MERGE_COMMIT) == []
+    assert [occurrence.issue_id for occurrence in scanner.feed_parsed(REGULAR_COMMIT)] == ["TEST-2"]
+    assert scanner.results["TEST"].merge_issue_ids == []
+
+
+def test_feed_parsed_filters_by_target_branch():
+    """Проверяет, что merge-коммит в другую ветку пропускается."""
+    scanner = IssueScanner(IssueIdMatcher(["TEST"]), "master")
+    assert scanner.feed_parsed(MERGE_COMMIT) == []
+    assert scanner.feed_parsed(REGULAR_COMMIT)[0].source == IssueSource.COMMIT_MESSAGE
@@ -0,0 +1,3 @@
+# Ограничение SQLite на число параметров в одном запросе (с запасом до SQLITE_MAX_VARIABLE_NUMBER=999
+# у старых сборок SQLite).
+SQLITE_MAX_PARAMS = 900
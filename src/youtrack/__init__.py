@@ -1,8 +1,16 @@
-from .youtrack_issue import Issue
+from .youtrack_issue import CompactIssue, Issue, IssueFields
+from .youtrack_cache import IssueCache
 from .youtrack_client import YouTrackClient
+from .youtrack_issue_table import IssueTable
+from .youtrack_scheduler import RequestScheduler
 
 
 __all__ = [
+  "CompactIssue",
   "Issue",
+  "IssueCache",
+  "IssueFields",
+  "IssueTable",
+  "RequestScheduler",
   "YouTrackClient",
 ]
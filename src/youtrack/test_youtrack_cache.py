@@ -0,0 +1,102 @@
+from .youtrack_cache import IssueCache
+from .youtrack_issue import Issue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_issue_cache_counts_hits_and_misses():
+    cache = IssueCache()
+    cache.put_many([Issue(id="TMOB-1", title="Задача 1", state="Open")])
+
+    found = cache.get_many(["TMOB-1", "TMOB-2"])
+
+    assert found == {"TMOB-1": Issue(id="TMOB-1", title="Задача 1", state="Open")}
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+
+def test_issue_cache_counts_revalidated_entries_as_hits():
+    clock = FakeClock()
+    cache = IssueCache(ttl=60, clock=clock)
+    cache.put_many([Issue(id="TMOB-1", title="Задача 1", state="Open"), Issue(id="TMOB-2", title="Задача 2", state="Open")])
+
+    clock.now += 120
+    assert cache.get_many(["TMOB-1", "TMOB-2", "TMOB-3"]) == {}
+    assert (cache.hits, cache.stale, cache.misses) == (0, 2, 1)
+
+    # Перепроверка подтвердила, что TMOB-1 не изменилась
+    cache.renew_many([cache.get_stale_many(["TMOB-1"])["TMOB-1"]])
+    assert cache.revalidated == 1
+    assert cache.hit_rate == 1 / 3
+    assert set(cache.get_many(["TMOB-1"])) == {"TMOB-1"}
+
+
+def test_issue_cache_returns_copies():
+    cache = IssueCache()
+    issue = Issue(id="TMOB-1", title="Задача 1", state="Open")
+    cache.put_many([issue])
+    issue.title = "Изменена после сохранения"
+
+    found = cache.get_many(["TMOB-1"])["TMOB-1"]
+    found.state = "Fixed"
+
+    assert cache.get_many(["TMOB-1"]) == {"TMOB-1": Issue(id="TMOB-1", title="Задача 1", state="Open")}
+
+
+def test_issue_cache_evicts_least_recently_used():
+    cache = IssueCache(max_size=2)
+    cache.put_many([Issue(id="TMOB-1", title="Задача 1", state=None), Issue(id="TMOB-2", title="Задача 2", state=None)])
+    cache.get_many(["TMOB-1"])  # TMOB-1 становится самой свежей записью
+    cache.put_many([Issue(id="TMOB-3", title="Задача 3", state=None)])
+
+    assert set(cache.get_many(["TMOB-1", "TMOB-2", "TMOB-3"])) == {"TMOB-1", "TMOB-3"}
+
+
+def test_issue_cache_keeps_issues_in_final_state_longer():
+    clock = FakeClock()
+    cache = IssueCache(ttl=60, final_state_ttl=3600, clock=clock)
+    cache.put_many([Issue(id="TMOB-1", title="Задача 1", state="Open"), Issue(id="TMOB-2", title="Задача 2", state="Fixed")])
+
+    clock.now += 120
+
+    assert set(cache.get_many(["TMOB-1", "TMOB-2"])) == {"TMOB-2"}
+
+
+def test_issue_cache_persists_between_instances(tmp_path):
+    path = str(tmp_path / "issues.sqlite")
+    clock = FakeClock()
+    cache = IssueCache(path, ttl=60, clock=clock)
+    cache.put_many([Issue(id="TMOB-1", title="Задача 1", state="Open")])
+    cache.close()
+
+    cache = IssueCache(path, ttl=60, clock=clock)
+    assert cache.get_many(["TMOB-1"]) == {"TMOB-1": Issue(id="TMOB-1", title="Задача 1", state="Open")}
+
+    # Просроченные записи из хранилища не возвращаются
+    clock.now += 120
+    cache = IssueCache(path, ttl=60, clock=clock)
+    assert cache.get_many(["TMOB-1"]) == {}
+    assert (cache.hits, cache.stale) == (0, 1)
+
+
+def test_issue_cache_keeps_stale_issues_for_revalidation(tmp_path):
+    clock = FakeClock()
+    cache = IssueCache(str(tmp_path / "issues.sqlite"), ttl=60, clock=clock)
+    cache.put_many([Issue(id="TMOB-1", title="Задача 1", state="Open", updated=1)])
+
+    clock.now += 120
+    cache = IssueCache(str(tmp_path / "issues.sqlite"), ttl=60, clock=clock)
+
+    assert cache.get_many(["TMOB-1"]) == {}
+    assert (cache.stale, cache.misses) == (1, 0)
+    assert cache.get_stale_many(["TMOB-1", "TMOB-2"]) == {"TMOB-1": Issue(id="TMOB-1", title="Задача 1", state="Open", updated=1)}
+
+    # Подтвержденная задача снова выдается как актуальная
+    cache.put_many(cache.get_stale_many(["TMOB-1"]).values())
+    assert set(cache.get_many(["TMOB-1"])) == {"TMOB-1"}
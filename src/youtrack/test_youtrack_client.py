@@ -0,0 +1,265 @@
+import asyncio
+import gc
+import aiohttp
+import pytest
+from contextlib import aclosing
+from .youtrack_cache import IssueCache
+from .youtrack_client import YouTrackClient
+from .youtrack_fake_server import FakeYouTrackServer, generate_issues
+from .youtrack_issue import Issue, IssueFields
+from .youtrack_scheduler import RequestScheduler
+
+
+ISSUES = generate_issues(10, seed=1)
+
+
+def get_state(issue_data) -> str:
+    return next(field["value"]["name"] for field in issue_data["customFields"] if field["name"] == "State")
+
+
+def test_get_issues_keeps_input_order_and_splits_into_chunks():
+    async def run():
+        async with FakeYouTrackServer(ISSUES) as server:
+            async with YouTrackClient(server.url, "token", chunk_size=2) as client:
+                issues = await client.get_issues(["TMOB-5", "TMOB-1", "TMOB-404", "TMOB-3", "TMOB-1", "TMOB-2"])
+        return server, issues
+
+    server, issues = asyncio.run(run())
+
+    assert [issue.id for issue in issues] == ["TMOB-5", "TMOB-1", "TMOB-3", "TMOB-2"]
+    assert issues[0] == Issue(id="TMOB-5", title="Задача 5", state=get_state(ISSUES[4]), updated=ISSUES[4]["updated"])
+    assert len(server.requests) == 3
+
+
+def test_iter_issues_pages_through_large_results():
+    async def run():
+        async with FakeYouTrackServer(ISSUES, max_page_size=3) as server:
+            async with YouTrackClient(server.url, "token", page_size=4, prefetch_pages=1) as client:
+                issues = [issue async for issue in client.iter_issues([issue["idReadable"] for issue in ISSUES])]
+        return server, issues
+
+    server, issues = asyncio.run(run())
+
+    assert [issue.id for issue in issues] == [issue["idReadable"] for issue in ISSUES]
+    assert len(server.requests) == 3
+
+
+def test_get_issues_retries_throttled_requests():
+    async def run():
+        async with FakeYouTrackServer(ISSUES, throttle_rate=0.5, retry_after=0, seed=3) as server:
+            scheduler = RequestScheduler(base_delay=0.001, max_retries=20)
+            async with YouTrackClient(server.url, "token", chunk_size=1, scheduler=scheduler) as client:
+                issues = await client.get_issues([issue["idReadable"] for issue in ISSUES])
+        return server, scheduler, issues
+
+    server, scheduler, issues = asyncio.run(run())
+
+    assert len(issues) == len(ISSUES)
+    assert scheduler.retries > 0
+    assert len(server.requests) == len(ISSUES) + scheduler.retries
+
+
+def test_concurrent_get_issues_calls_are_coalesced():
+    async def run():
+        async with FakeYouTrackServer(ISSUES, latency=0.01) as server:
+            async with YouTrackClient(server.url, "token") as client:
+                first, second = await asyncio.gather(
+                    client.get_issues(["TMOB-1", "TMOB-2"]),
+                    client.get_issues(["TMOB-2", "TMOB-3"]),
+                )
+        return server, first, second
+
+    server, first, second = asyncio.run(run())
+
+    assert [issue.id for issue in first] == ["TMOB-1", "TMOB-2"]
+    assert [issue.id for issue in second] == ["TMOB-2", "TMOB-3"]
+    assert len(server.requests) == 1
+
+
+def test_get_issues_revalidates_stale_cache_entries():
+    class Clock:
+        now = 0.0
+
+        def __call__(self) -> float:
+            return self.now
+
+    async def run():
+        clock = Clock()
+        issues = generate_issues(2, seed=1)
+        async with FakeYouTrackServer(issues) as server:
+            async with YouTrackClient(server.url, "token", cache=IssueCache(ttl=60, clock=clock)) as client:
+                await client.get_issues(["TMOB-1", "TMOB-2"])
+                await client.get_issues(["TMOB-1", "TMOB-2"])
+                assert len(server.requests) == 1
+
+                # Записи устарели, но изменилась только задача TMOB-2
+                clock.now += 120
+                issues[1]["updated"] += 1
+                result = await client.get_issues(["TMOB-1", "TMOB-2"])
+                assert client.cache.revalidated == 1
+        return server, issues, result
+
+    server, issues, result = asyncio.run(run())
+
+    assert [request["fields"] for request in server.requests[1:]] == [
+        "idReadable,updated",
+        "idReadable,summary,updated,customFields(name,value(name))",
+    ]
+    assert "TMOB-1" not in server.requests[2]["query"]
+    assert [issue.updated for issue in result] == [issues[0]["updated"], issues[1]["updated"]]
+
+
+def test_get_issues_requests_only_needed_custom_fields():
+    async def run():
+        async with FakeYouTrackServer(ISSUES) as server:
+            async with YouTrackClient(server.url, "token") as client:
+                default = await client.get_issues(["TMOB-1"])
+                priority = await client.get_issues(["TMOB-1"], IssueFields(state_field="Priority", updated=False))
+        return default, priority
+
+    default, priority = asyncio.run(run())
+
+    assert default[0].state == get_state(ISSUES[0])
+    assert priority[0].state in ("Normal", "Major", "Critical")
+    assert priority[0].updated is None
+
+
+def test_coalesced_batch_survives_cancelled_caller():
+    async def run():
+        async with FakeYouTrackServer(ISSUES, latency=0.05) as server:
+            async with YouTrackClient(server.url, "token") as client:
+                first = asyncio.create_task(client.get_issues(["TMOB-1", "TMOB-2"]))
+                second = asyncio.create_task(client.get_issues(["TMOB-2"]))
+
+                # Окно объединения истекло, общий пакет уже запрошен
+                await asyncio.sleep(0.03)
+                first.cancel()
+                issues = await second
+                await asyncio.gather(first, return_exceptions=True)
+        return server, first, issues
+
+    server, first, issues = asyncio.run(run())
+
+    assert first.cancelled()
+    assert [issue.id for issue in issues] == ["TMOB-2"]
+    assert len(server.requests) == 1
+
+
+def test_batch_error_reaches_every_waiter():
+    async def run():
+        async with FakeYouTrackServer(ISSUES, error_rate=1.0) as server:
+            scheduler = RequestScheduler(max_retries=0)
+            async with YouTrackClient(server.url, "token", scheduler=scheduler) as client:
+                results = await asyncio.gather(
+                    client.get_issues(["TMOB-1"]),
+                    client.get_issues(["TMOB-1", "TMOB-2"]),
+                    return_exceptions=True,
+                )
+                requests_after_error = len(server.requests)
+
+                # Пакет с ошибкой не остается в числе запрашиваемых: следующий вызов отправляет новый запрос
+                server.error_rate = 0.0
+                retried = await client.get_issues(["TMOB-1"])
+        return server, results, requests_after_error, retried
+
+    server, results, requests_after_error, retried = asyncio.run(run())
+
+    assert [type(result) for result in results] == [aiohttp.ClientResponseError] * 2
+    assert [result.status for result in results] == [500, 500]
+    assert requests_after_error == 1
+    assert [issue.id for issue in retried] == ["TMOB-1"]
+    assert len(server.requests) == 2
+
+
+def test_failed_batch_without_waiters_is_not_logged():
+    contexts = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: contexts.append(context))
+        async with FakeYouTrackServer(ISSUES, latency=0.05, error_rate=1.0) as server:
+            scheduler = RequestScheduler(max_retries=0)
+            async with YouTrackClient(server.url, "token", scheduler=scheduler) as client:
+                caller = asyncio.create_task(client.get_issues(["TMOB-1"]))
+                await asyncio.sleep(0.01)
+                caller.cancel()
+                await asyncio.gather(caller, return_exceptions=True)
+
+                # Пакет завершается ошибкой уже без ожидающих вызовов
+                await asyncio.sleep(0.1)
+        return server
+
+    server = asyncio.run(run())
+    gc.collect()  # Неполученная ошибка Future попадает в лог при его удалении
+
+    assert len(server.requests) == 1
+    assert [context["message"] for context in contexts] == []
+
+
+def test_get_issues_sends_each_id_in_exactly_one_chunk():
+    issue_ids = [issue["idReadable"] for issue in ISSUES]
+
+    async def run():
+        async with FakeYouTrackServer(ISSUES) as server:
+            async with YouTrackClient(server.url, "token", chunk_size=3) as client:
+                issues = await client.get_issues(issue_ids)
+        return server, issues
+
+    server, issues = asyncio.run(run())
+
+    chunks = [request["query"].split(" OR ") for request in server.requests]
+    assert sorted(len(chunk) for chunk in chunks) == [1, 3, 3, 3]
+    assert sorted(query for chunk in chunks for query in chunk) == sorted(f"issue id: {i}" for i in issue_ids)
+    assert [issue.id for issue in issues] == issue_ids
+
+
+def test_iter_issues_stops_prefetching_when_consumer_stops():
+    async def run():
+        async with FakeYouTrackServer(ISSUES, max_page_size=1) as server:
+            async with YouTrackClient(server.url, "token", page_size=1, prefetch_pages=1) as client:
+                async with aclosing(client.iter_issues([issue["idReadable"] for issue in ISSUES])) as issues:
+                    first = await anext(issues)
+                requests_after_close = len(server.requests)
+                await asyncio.sleep(0.05)
+        return server, first, requests_after_close
+
+    server, first, requests_after_close = asyncio.run(run())
+
+    assert first.id == "TMOB-1"
+    # Загружены только страницы впрок, после закрытия итератора запросов больше нет
+    assert requests_after_close <= 3
+    assert len(server.requests) == requests_after_close
+
+
+def test_iter_issues_raises_page_errors_to_consumer():
+    async def run():
+        async with FakeYouTrackServer(ISSUES, error_rate=1.0) as server:
+            scheduler = RequestScheduler(max_retries=0)
+            async with YouTrackClient(server.url, "token", scheduler=scheduler) as client:
+                return [issue async for issue in client.iter_issues(["TMOB-1"])]
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(run())
+
+
+def test_client_reuses_one_session_and_connection():
+    async def run():
+        async with FakeYouTrackServer(ISSUES) as server:
+            client = YouTrackClient(server.url, "token")
+            async with client:
+                session = client.session
+                for issue_id in ["TMOB-1", "TMOB-2", "TMOB-3"]:
+                    await client.get_issues([issue_id])
+                    assert client.session is session
+            assert client.session is None
+
+            # Вне контекстного менеджера каждый вызов открывает временную сессию
+            for issue_id in ["TMOB-4", "TMOB-5"]:
+                await client.get_issues([issue_id])
+            assert client.session is None
+        return server
+
+    server = asyncio.run(run())
+
+    peers = [request["peer"] for request in server.requests]
+    assert len(set(peers[:3])) == 1
+    assert len(set(peers[3:])) == 2
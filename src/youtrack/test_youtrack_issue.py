@@ -1,5 +1,5 @@
 import pytest
-from .youtrack_issue import Issue, convert_to_issue
+from .youtrack_issue import CompactIssue, Issue, IssueFields, convert_to_issue
 
 
 def test_convert_to_issue_full_data():
@@ -76,3 +76,62 @@ def test_convert_to_issue_missing_id():
 
     with pytest.raises(KeyError):
         convert_to_issue(data)
+
+
+def test_convert_to_issue_with_updated():
+    data = {
+        "idReadable": "TMOB-123",
+        "summary": "Исправить баг с модулем",
+        "updated": 1700000000000,
+        "customFields": []
+    }
+
+    expected = Issue(
+        id="TMOB-123",
+        title="Исправить баг с модулем",
+        state=None,
+        updated=1700000000000
+    )
+
+    result = convert_to_issue(data)
+    assert result == expected
+
+
+def test_convert_to_issue_custom_state_field_with_empty_value():
+    data = {
+        "idReadable": "TMOB-123",
+        "summary": "Исправить баг с модулем",
+        "customFields": [
+            {
+                "name": "Stage",
+                "value": None
+            },
+            {
+                "name": "State",
+                "value": {"name": "Open"}
+            }
+        ]
+    }
+
+    assert convert_to_issue(data, state_field="Stage").state is None
+    assert convert_to_issue(data, state_field="State").state == "Open"
+
+
+def test_issue_fields_to_params():
+    assert IssueFields().to_params() == [
+        ("fields", "idReadable,summary,updated,customFields(name,value(name))"),
+        ("customFields", "State"),
+    ]
+    assert IssueFields(state_field=None, updated=False).to_params() == [("fields", "idReadable,summary")]
+
+
+def test_compact_issue_shares_interned_state():
+    state = "".join(["Op", "en"]) # Строка, созданная во время выполнения, а не литерал
+    issue = CompactIssue.from_issue(Issue(id="TMOB-123", title="Исправить баг с модулем", state=state))
+
+    assert issue.state is convert_to_issue({"idReadable": "TMOB-1", "summary": "", "customFields": [{"name": "State", "value": {"name": state}}]}).state
+    assert issue.to_issue() == Issue(id="TMOB-123", title="Исправить баг с модулем", state="Open")
+    assert not hasattr(issue, "__dict__")
+
+    with pytest.raises(AttributeError):
+        issue.state = "Fixed"
@@ -0,0 +1,17 @@
+from .youtrack_issue import CompactIssue, Issue
+from .youtrack_issue_table import IssueTable
+
+
+def test_issue_table_round_trip():
+    issues = [
+        Issue(id="TMOB-1", title="Задача 1", state="Open", updated=1700000000000),
+        Issue(id="TMOB-2", title="Задача 2", state=None),
+        Issue(id="TMOB-3", title="Задача 3", state="Open"),
+    ]
+
+    table = IssueTable(issues)
+
+    assert len(table) == 3
+    assert list(table) == [CompactIssue.from_issue(issue) for issue in issues]
+    assert table[-1] == CompactIssue(id="TMOB-3", title="Задача 3", state="Open")
+    assert table.states == [None, "Open"]
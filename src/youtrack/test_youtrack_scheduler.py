@@ -0,0 +1,128 @@
+import asyncio
+import aiohttp
+import pytest
+from datetime import datetime, timezone
+from .youtrack_scheduler import RequestScheduler, parse_retry_after
+
+
+def create_response_error(status: int, headers=None) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(request_info=None, history=(), status=status, headers=headers)
+
+
+class FlakyRequest:
+    """Запрос, который первые несколько раз завершается ошибкой."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def create_scheduler(delays, **kwargs) -> RequestScheduler:
+    async def sleep(delay: float):
+        delays.append(delay)
+
+    return RequestScheduler(jitter=lambda: 1.0, sleep=sleep, **kwargs)
+
+
+def test_parse_retry_after():
+    now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    assert parse_retry_after({"Retry-After": "5"}) == 5.0
+    assert parse_retry_after({"Retry-After": "Mon, 01 Jan 2024 12:00:30 GMT"}, now) == 30.0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+
+
+def test_scheduler_retries_with_backoff_and_retry_after():
+    delays = []
+    scheduler = create_scheduler(delays, base_delay=1.0)
+    request = FlakyRequest([create_response_error(503), create_response_error(429, {"Retry-After": "10"})])
+
+    assert asyncio.run(scheduler.run(request)) == "ok"
+    assert request.calls == 3
+    assert delays == [1.0, 10.0]
+    assert scheduler.retries == 2
+
+
+def test_scheduler_does_not_retry_client_errors():
+    delays = []
+    scheduler = create_scheduler(delays)
+    request = FlakyRequest([create_response_error(404)])
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(scheduler.run(request))
+
+    assert request.calls == 1
+    assert delays == []
+
+
+def test_scheduler_gives_up_after_max_retries():
+    delays = []
+    scheduler = create_scheduler(delays, max_retries=2, base_delay=1.0)
+    request = FlakyRequest([create_response_error(502)] * 5)
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(scheduler.run(request))
+
+    assert request.calls == 3
+    assert delays == [1.0, 2.0]
+
+
+def test_scheduler_adapts_concurrency_limit():
+    scheduler = create_scheduler([], initial_concurrency=8, min_concurrency=1, max_concurrency=10)
+
+    asyncio.run(scheduler.run(FlakyRequest([create_response_error(429)])))
+    assert scheduler.limit == pytest.approx(4.25)  # 8 * 0.5, затем рост на 1 / 4 после успеха
+
+    for _ in range(100):
+        asyncio.run(scheduler.run(FlakyRequest([])))
+    assert scheduler.limit == 10
+
+
+def test_scheduler_limits_concurrent_requests():
+    scheduler = RequestScheduler(initial_concurrency=2, max_concurrency=2)
+    active = 0
+    peak = 0
+
+    async def request():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    async def run_all():
+        await asyncio.gather(*(scheduler.run(request) for _ in range(6)))
+
+    asyncio.run(run_all())
+    assert peak == 2
+
+
+def test_scheduler_cuts_limit_once_per_overload():
+    scheduler = create_scheduler([], initial_concurrency=8, max_concurrency=8, max_retries=0)
+    started = 0
+
+    async def request():
+        nonlocal started
+        started += 1
+        while started < 8:  # Все запросы в полете одновременно
+            await asyncio.sleep(0)
+        raise create_response_error(429)
+
+    async def run_all():
+        return await asyncio.gather(*(scheduler.run(request) for _ in range(8)), return_exceptions=True)
+
+    results = asyncio.run(run_all())
+    assert all(isinstance(result, aiohttp.ClientResponseError) for result in results)
+    assert scheduler.limit == 4
+    assert scheduler.cuts == 1
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(scheduler.run(FlakyRequest([create_response_error(429)])))
+    assert scheduler.cuts == 2  # Новый запрос после снижения сообщает о новой перегрузке
@@ -0,0 +1,207 @@
+import copy
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from ..sqlite_helpers import SQLITE_MAX_PARAMS
+from .youtrack_issue import Issue, intern_value
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+# Время жизни записи по умолчанию (в секундах).
+DEFAULT_TTL = 10 * 60
+
+# Время жизни записи о задаче в финальном состоянии: такие задачи меняются редко.
+DEFAULT_FINAL_STATE_TTL = 7 * 24 * 60 * 60
+
+# Максимальное число задач в памяти.
+DEFAULT_MAX_SIZE = 10_000
+
+# Состояния, после которых задача считается завершенной.
+DEFAULT_FINAL_STATES = frozenset({"Fixed", "Done", "Closed", "Verified", "Resolved", "Duplicate", "Won't fix"})
+
+
+class IssueCache:
+    """Кеш задач YouTrack: LRU в памяти и, опционально, постоянное хранилище SQLite.
+
+    Каждая запись живет `ttl` секунд, а задача в финальном состоянии — `final_state_ttl` секунд.
+    Хранилище SQLite переживает перезапуски, поэтому соседние релизы переиспользуют уже полученные задачи.
+    Устаревшие записи не удаляются: их можно перепроверить по времени изменения задачи (`get_stale_many`)
+    и продлить (`renew_many`).
+
+    Кеш хранит и выдает копии задач, поэтому изменение полученной или сохраненной задачи не меняет кеш.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        final_state_ttl: float = DEFAULT_FINAL_STATE_TTL,
+        final_states: FrozenSet[str] = DEFAULT_FINAL_STATES,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Инициализирует IssueCache.
+
+        Аргументы:
+            path (Optional[str], optional): Путь к файлу SQLite. Если None, кеш хранится только в памяти.
+            max_size (int, optional): Максимальное число задач в памяти.
+            ttl (float, optional): Время жизни записи в секундах.
+            final_state_ttl (float, optional): Время жизни записи о задаче в финальном состоянии.
+            final_states (FrozenSet[str], optional): Финальные состояния задач.
+            clock (Callable[[], float], optional): Источник текущего времени (в секундах от эпохи).
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.final_state_ttl = final_state_ttl
+        self.final_states = final_states
+        self.clock = clock
+        self.hits = 0  # Актуальные записи
+        self.stale = 0  # Устаревшие записи
+        self.revalidated = 0  # Устаревшие записи, подтвержденные `renew_many`
+        self.misses = 0  # Отсутствующие записи
+        self.entries: "OrderedDict[str, Tuple[Issue, float]]" = OrderedDict()
+        self.connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self.connection = sqlite3.connect(path)
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS issues (
+                    id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля запросов, обслуженных из кеша, включая устаревшие записи, подтвержденные перепроверкой."""
+        total = self.hits + self.stale + self.misses
+        return (self.hits + self.revalidated) / total if total else 0.0
+
+    def get_many(self, issue_ids: List[str]) -> Dict[str, Issue]:
+        """Возвращает задачи, актуальные записи о которых есть в кеше.
+
+        Аргументы:
+            issue_ids (List[str]): Список ID задач.
+
+        Возвращает:
+            Dict[str, Issue]: Найденные задачи по ID.
+        """
+        now = self.clock()
+        entries = self.__lookup(issue_ids)
+        found = {issue_id: copy.copy(issue) for issue_id, (issue, expires_at) in entries.items() if expires_at > now}
+        self.hits += len(found)
+        self.stale += len(entries) - len(found)
+        self.misses += len(issue_ids) - len(entries)
+        return found
+
+    def get_stale_many(self, issue_ids: List[str]) -> Dict[str, Issue]:
+        """Возвращает задачи, записи о которых есть в кеше, но устарели.
+
+        Такие записи не выдаются `get_many`, но по ним можно проверить, изменилась ли задача.
+
+        Аргументы:
+            issue_ids (List[str]): Список ID задач.
+
+        Возвращает:
+            Dict[str, Issue]: Устаревшие задачи по ID.
+        """
+        now = self.clock()
+        entries = self.__lookup(issue_ids).items()
+        return {issue_id: copy.copy(issue) for issue_id, (issue, expires_at) in entries if expires_at <= now}
+
+    def put_many(self, issues: Iterable[Issue]):
+        """Сохраняет задачи в кеш.
+
+        Аргументы:
+            issues (Iterable[Issue]): Задачи.
+        """
+        now = self.clock()
+        entries = [(copy.copy(issue), now + self.get_ttl(issue)) for issue in issues]
+        for issue, expires_at in entries:
+            self.__remember(issue.id, issue, expires_at)
+
+        if self.connection is not None:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO issues VALUES (?, ?, ?)",
+                    ((issue.id, json.dumps(asdict(issue)), expires_at) for issue, expires_at in entries),
+                )
+
+    def renew_many(self, issues: Iterable[Issue]):
+        """Продлевает устаревшие записи о задачах, которые не изменились с момента сохранения.
+
+        Продленные записи учитываются в `hit_rate` как попадания.
+
+        Аргументы:
+            issues (Iterable[Issue]): Неизменившиеся задачи, полученные из `get_stale_many`.
+        """
+        issues = list(issues)
+        self.put_many(issues)
+        self.revalidated += len(issues)
+
+    def get_ttl(self, issue: Issue) -> float:
+        """Возвращает время жизни записи о задаче.
+
+        Аргументы:
+            issue (Issue): Задача.
+
+        Возвращает:
+            float: Время жизни в секундах.
+        """
+        return self.final_state_ttl if issue.state in self.final_states else self.ttl
+
+    def clear(self):
+        """Удаляет все записи, включая постоянное хранилище."""
+        self.entries.clear()
+        if self.connection is not None:
+            with self.connection:
+                self.connection.execute("DELETE FROM issues")
+
+    def close(self):
+        """Закрывает соединение с постоянным хранилищем."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def __remember(self, issue_id: str, issue: Issue, expires_at: float):
+        self.entries[issue_id] = (issue, expires_at)
+        self.entries.move_to_end(issue_id)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def __lookup(self, issue_ids: List[str]) -> Dict[str, Tuple[Issue, float]]:
+        found = {}
+        missing = []
+        for issue_id in issue_ids:
+            entry = self.entries.get(issue_id)
+            if entry is not None:
+                self.entries.move_to_end(issue_id)
+                found[issue_id] = entry
+            else:
+                missing.append(issue_id)
+
+        if self.connection is not None and missing:
+            for issue_id, (issue, expires_at) in self.__load_many(missing).items():
+                self.__remember(issue_id, issue, expires_at)
+                found[issue_id] = (issue, expires_at)
+
+        return found
+
+    def __load_many(self, issue_ids: List[str]) -> Dict[str, Tuple[Issue, float]]:
+        found = {}
+        for i in range(0, len(issue_ids), SQLITE_MAX_PARAMS):
+            chunk = issue_ids[i:i + SQLITE_MAX_PARAMS]
+            rows = self.connection.execute(
+                f"SELECT id, data, expires_at FROM issues WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for issue_id, data, expires_at in rows:
+                issue = Issue(**json.loads(data))
+                issue.state = intern_value(issue.state)
+                found[issue_id] = (issue, expires_at)
+
+        return found
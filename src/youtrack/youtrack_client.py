@@ -1,43 +1,435 @@
+import asyncio
 import aiohttp
-from .youtrack_issue import Issue, convert_to_issue
-from typing import List
+from contextlib import asynccontextmanager
+from .youtrack_cache import IssueCache
+from .youtrack_issue import DEFAULT_ISSUE_FIELDS, Issue, IssueFields, convert_to_issue
+from .youtrack_scheduler import RequestScheduler
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+
+# Сколько ID задач передается в одном запросе: длинный query не помещается в URL.
+DEFAULT_CHUNK_SIZE = 50
+
+# Сколько запросов к YouTrack выполняется одновременно до того, как планировщик подстроит лимит.
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Размер страницы ($top): без явной пагинации YouTrack обрезает выдачу.
+DEFAULT_PAGE_SIZE = 100
+
+# Сколько страниц `iter_issues` загружает впрок, пока потребитель обрабатывает текущую.
+DEFAULT_PREFETCH_PAGES = 2
+
+# Параметры пула соединений: размер пула, время жизни простаивающего соединения и кеша DNS (в секундах).
+DEFAULT_CONNECTION_LIMIT = 16
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+DEFAULT_DNS_CACHE_TTL = 600
+
+# Сколько секунд копятся ID из одновременных вызовов `get_issues`, прежде чем уйти одним запросом.
+# При нуле объединяются только вызовы, сделанные на одной итерации цикла событий: одиночный вызов не ждет.
+DEFAULT_COALESCING_WINDOW = 0.0
+
+# Поля, достаточные для проверки, изменилась ли задача с момента сохранения в кеш.
+REVALIDATION_PARAMS = [("fields", "idReadable,updated")]
 
 
 class YouTrackClient:
-    def __init__(self, base_url: str, token: str):
+    """Клиент YouTrack.
+
+    Используйте клиент как асинхронный контекстный менеджер: тогда все запросы идут через одну
+    HTTP-сессию с пулом соединений и повторно используют TCP/TLS-соединения.
+
+    Пример:
+        async with YouTrackClient(base_url, token) as client:
+            issues = await client.get_issues(issue_ids)
+
+    Вне контекстного менеджера каждый вызов открывает и закрывает собственную сессию.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        cache: Optional[IssueCache] = None,
+        coalescing_window: float = DEFAULT_COALESCING_WINDOW,
+        scheduler: Optional[RequestScheduler] = None,
+        fields: IssueFields = DEFAULT_ISSUE_FIELDS,
+    ):
         """Инициализирует YouTrackClient.
 
         Аргументы:
             base_url (str): Базовый URL экземпляра YouTrack.
             token (str): Токен авторизации для доступа к API.
+            chunk_size (int, optional): Максимальное число ID задач в одном запросе.
+            max_concurrency (int, optional): Начальное число одновременных запросов. Далее лимит
+                подстраивается планировщиком по ответам сервера.
+            page_size (int, optional): Число задач на странице ответа ($top).
+            prefetch_pages (int, optional): Число страниц, загружаемых `iter_issues` впрок.
+            connection_limit (int, optional): Максимальное число открытых соединений в пуле.
+            cache (Optional[IssueCache], optional): Кеш задач. Если указан, из YouTrack полностью запрашиваются
+                только задачи, которых нет в кеше или которые изменились с момента сохранения.
+            coalescing_window (float, optional): Время (в секундах), в течение которого ID из одновременных
+                вызовов `get_issues` объединяются в один запрос. При нуле объединяются вызовы, сделанные
+                на одной итерации цикла событий.
+            scheduler (Optional[RequestScheduler], optional): Планировщик запросов с повторами и адаптивным
+                числом одновременных запросов. Если None, создается планировщик по умолчанию.
+            fields (IssueFields, optional): Поля задачи, запрашиваемые по умолчанию.
         """
         self.base_url = base_url.rstrip('/')
         self.token = token
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.page_size = page_size
+        self.prefetch_pages = prefetch_pages
+        self.connection_limit = connection_limit
+        self.cache = cache
+        self.coalescing_window = coalescing_window
+        self.scheduler = scheduler or RequestScheduler(initial_concurrency=max_concurrency)
+        self.fields = fields
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Запрашиваемые сейчас ID и пакеты, результат которых они ожидают
+        self.__in_flight: Dict[str, asyncio.Future] = {}
+        # Пакет, который еще копит ID и будет отправлен по истечении окна объединения
+        self.__pending_issue_ids: List[str] = []
+        self.__pending_batch: Optional[asyncio.Future] = None
+        self.__batch_tasks: Set[asyncio.Task] = set()
 
-    async def get_issues(self, issue_ids: List[str]) -> List[Issue]:
-        """Получает детали нескольких задач из YouTrack в одном запросе.
+    async def __aenter__(self) -> "YouTrackClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def open(self):
+        """Открывает долгоживущую HTTP-сессию, если она еще не открыта."""
+        if self.session is None or self.session.closed:
+            self.session = self.__create_session()
+
+    async def close(self):
+        """Закрывает долгоживущую HTTP-сессию и соединения ее пула."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def get_issues(self, issue_ids: List[str], fields: Optional[IssueFields] = None) -> List[Issue]:
+        """Получает детали нескольких задач из YouTrack.
+
+        Задачи, найденные в кеше, в YouTrack не запрашиваются, а устаревшие записи кеша перепроверяются
+        дешевым запросом времени изменения. Если задача уже запрашивается другим вызовом, повторный запрос
+        не отправляется: вызов дожидается уже идущего. Остальные ID из одновременных вызовов копятся
+        `coalescing_window` секунд и отправляются вместе, частями по `chunk_size`. Запросы проходят через
+        планировщик: при перегрузке сервера они повторяются, а число одновременных запросов снижается.
+
+        Кеш и объединение запросов используются только для полей клиента по умолчанию (`self.fields`).
 
         Аргументы:
             issue_ids (List[str]): Список ID задач для получения данных (например, ['TMOB-123', 'TMOB-1234']).
+            fields (Optional[IssueFields], optional): Запрашиваемые поля. Если None, используются `self.fields`.
 
         Возвращает:
-            List[Issue]: Список объектов Issue, содержащих ID задач, заголовки и состояния.
+            List[Issue]: Список объектов Issue в порядке переданных ID. Ненайденные задачи пропускаются,
+                задачи с ID, отличным от запрошенного, добавляются в конец.
 
         Исключения:
             aiohttp.ClientResponseError: Если HTTP-запрос завершился с ошибкой.
         """
-        url = f"{self.base_url}/api/issues"
+        issue_ids = list(dict.fromkeys(issue_ids))
+        if not issue_ids:
+            return []
+
+        if fields is None or fields == self.fields:
+            cached = await self.__get_cached_issues(issue_ids)
+            fetched = await self.__fetch_issues_coalesced([issue_id for issue_id in issue_ids if issue_id not in cached])
+        else:
+            cached = {}
+            fetched = await self.__fetch_issues(issue_ids, fields)
+
+        # Задачи, ID которых не совпал с запрошенным (например, после переноса в другой проект), идут в конце
+        issues = {**cached, **{issue.id: issue for issue in fetched}}
+        ordered = [issues.pop(issue_id) for issue_id in issue_ids if issue_id in issues]
+        return ordered + list(issues.values())
+
+    async def iter_issues(self, issue_ids: List[str], fields: Optional[IssueFields] = None) -> AsyncIterator[Issue]:
+        """Потоково получает задачи из YouTrack постранично.
+
+        Страницы запрашиваются через `$top`/`$skip` и загружаются впрок (не более `prefetch_pages`
+        страниц), поэтому память не зависит от числа задач. Сначала выдаются задачи из кеша, затем
+        остальные — по мере получения страниц, в порядке ответа сервера.
+
+        Пример:
+            async for issue in client.iter_issues(issue_ids):
+                print(issue.id)
+
+        Аргументы:
+            issue_ids (List[str]): Список ID задач для получения данных.
+            fields (Optional[IssueFields], optional): Запрашиваемые поля. Если None, используются `self.fields`;
+                для других полей кеш не используется.
+
+        Возвращает:
+            AsyncIterator[Issue]: Асинхронный итератор объектов Issue.
+
+        Исключения:
+            aiohttp.ClientResponseError: Если HTTP-запрос завершился с ошибкой.
+        """
+        issue_ids = list(dict.fromkeys(issue_ids))
+        fields = fields or self.fields
+        cache = self.cache if fields == self.fields else None
+        if cache is not None:
+            cached = await self.__get_cached_issues(issue_ids)
+            for issue in cached.values():
+                yield issue
+            issue_ids = [issue_id for issue_id in issue_ids if issue_id not in cached]
+
+        chunks = self.__split_into_chunks(issue_ids)
+        if not chunks:
+            return
+
+        pages: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch_pages)
+        async with self.__get_session() as session:
+            producer = asyncio.create_task(self.__produce_pages(session, chunks, fields.to_params(), pages))
+            try:
+                while (page := await pages.get()) is not None:
+                    if isinstance(page, Exception):
+                        raise page
+                    issues = [convert_to_issue(item, fields.state_field) for item in page]
+                    if cache is not None:
+                        cache.put_many(issues)
+                    for issue in issues:
+                        yield issue
+            finally:
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+
+    async def __get_cached_issues(self, issue_ids: List[str]) -> Dict[str, Issue]:
+        """Возвращает задачи из кеша, перепроверяя устаревшие записи по времени изменения задачи.
+
+        Для устаревших записей одним легким запросом (только `idReadable,updated`) выясняется,
+        изменились ли задачи. Неизменившиеся задачи продлеваются в кеше и возвращаются.
+
+        Аргументы:
+            issue_ids (List[str]): Список ID задач без повторов.
+
+        Возвращает:
+            Dict[str, Issue]: Актуальные задачи по ID.
+        """
+        if self.cache is None:
+            return {}
+
+        cached = self.cache.get_many(issue_ids)
+        stale = self.cache.get_stale_many([issue_id for issue_id in issue_ids if issue_id not in cached])
+        stale = {issue_id: issue for issue_id, issue in stale.items() if issue.updated is not None}
+        if not stale:
+            return cached
+
+        items = await self.__fetch_items(list(stale), REVALIDATION_PARAMS)
+        unchanged = [
+            stale[item["idReadable"]]
+            for item in items
+            if item["idReadable"] in stale and item.get("updated") == stale[item["idReadable"]].updated
+        ]
+        self.cache.renew_many(unchanged)
+        cached.update((issue.id, issue) for issue in unchanged)
+        return cached
+
+    async def __fetch_issues_coalesced(self, issue_ids: List[str]) -> List[Issue]:
+        """Запрашивает задачи, объединяя одновременные запросы и не запрашивая одну задачу дважды.
+
+        Аргументы:
+            issue_ids (List[str]): Список ID задач без повторов.
+
+        Возвращает:
+            List[Issue]: Список объектов Issue.
+        """
+        if not issue_ids:
+            return []
+
+        loop = asyncio.get_running_loop()
+        batches: Dict[asyncio.Future, List[str]] = {}
+        for issue_id in issue_ids:
+            batch = self.__in_flight.get(issue_id)
+            if batch is None:
+                if self.__pending_batch is None:
+                    self.__pending_batch = loop.create_future()
+                    if self.coalescing_window > 0:
+                        loop.call_later(self.coalescing_window, self.__send_pending_batch)
+                    else:
+                        loop.call_soon(self.__send_pending_batch)
+                batch = self.__pending_batch
+                self.__pending_issue_ids.append(issue_id)
+                self.__in_flight[issue_id] = batch
+            batches.setdefault(batch, []).append(issue_id)
+
+        # shield: отмена одного вызова не должна отменять пакет, которого ждут другие вызовы
+        results = await asyncio.gather(*(asyncio.shield(batch) for batch in batches))
+
+        issues = []
+        for batch_issue_ids, (found, unmatched) in zip(batches.values(), results):
+            issues.extend(found[issue_id] for issue_id in batch_issue_ids if issue_id in found)
+            if unmatched and any(issue_id not in found for issue_id in batch_issue_ids):
+                issues.extend(unmatched)
+
+        return issues
+
+    def __send_pending_batch(self):
+        """Отправляет накопленный пакет ID."""
+        issue_ids, batch = self.__pending_issue_ids, self.__pending_batch
+        self.__pending_issue_ids, self.__pending_batch = [], None
+        task = asyncio.ensure_future(self.__run_batch(issue_ids, batch))
+        self.__batch_tasks.add(task)
+        task.add_done_callback(self.__batch_tasks.discard)
+
+    async def __run_batch(self, issue_ids: List[str], batch: asyncio.Future):
+        """Запрашивает пакет задач и передает результат всем ожидающим его вызовам.
+
+        Результат пакета — задачи по запрошенным ID и задачи, ID которых не совпал с запрошенным
+        (например, после переноса в другой проект).
+
+        Аргументы:
+            issue_ids (List[str]): ID задач пакета.
+            batch (asyncio.Future): Future пакета.
+        """
+        try:
+            fetched = await self.__fetch_issues(issue_ids, self.fields)
+            if self.cache is not None:
+                self.cache.put_many(fetched)
+        except asyncio.CancelledError:
+            batch.cancel()
+            raise
+        except Exception as error:
+            batch.set_exception(error)
+            # Все ожидавшие вызовы могли быть отменены: ошибка считается полученной, чтобы не попасть в лог
+            batch.exception()
+        else:
+            requested = set(issue_ids)
+            found: Dict[str, Issue] = {issue.id: issue for issue in fetched if issue.id in requested}
+            unmatched = [issue for issue in fetched if issue.id not in requested]
+            batch.set_result((found, unmatched))
+        finally:
+            for issue_id in issue_ids:
+                if self.__in_flight.get(issue_id) is batch:
+                    del self.__in_flight[issue_id]
+
+    async def __fetch_issues(self, issue_ids: List[str], fields: IssueFields) -> List[Issue]:
+        """Запрашивает задачи из YouTrack.
+
+        Аргументы:
+            issue_ids (List[str]): Список ID задач без повторов.
+            fields (IssueFields): Запрашиваемые поля.
+
+        Возвращает:
+            List[Issue]: Список объектов Issue.
+        """
+        items = await self.__fetch_items(issue_ids, fields.to_params())
+        return [convert_to_issue(item, fields.state_field) for item in items]
+
+    async def __fetch_items(self, issue_ids: List[str], fields_params: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Запрашивает данные задач частями по `chunk_size`; одновременность ограничивает планировщик.
+
+        Аргументы:
+            issue_ids (List[str]): Список ID задач без повторов.
+            fields_params (List[Tuple[str, str]]): Параметры запроса, задающие поля ответа.
+
+        Возвращает:
+            List[Dict[str, Any]]: Данные задач в формате YouTrack.
+        """
+        if not issue_ids:
+            return []
+
+        async with self.__get_session() as session:
+
+            async def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+                return [item async for page in self.__iter_pages(session, chunk, fields_params) for item in page]
+
+            results = await asyncio.gather(*(fetch(chunk) for chunk in self.__split_into_chunks(issue_ids)))
+
+        return [item for chunk_items in results for item in chunk_items]
+
+    def __create_session(self) -> aiohttp.ClientSession:
+        """Создает HTTP-сессию с настроенным пулом соединений и заголовком авторизации."""
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DEFAULT_DNS_CACHE_TTL,
+        )
         headers = {
             "Authorization": f"Bearer {self.token}"
         }
-        params = {
-            "fields": "idReadable,summary,customFields(name,value(name))",
-            "query": " OR ".join([f"issue id: {issue_id}" for issue_id in issue_ids])
-        }
+        return aiohttp.ClientSession(connector=connector, headers=headers)
+
+    @asynccontextmanager
+    async def __get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Возвращает долгоживущую сессию или, если клиент не открыт, временную сессию на один вызов."""
+        if self.session is not None and not self.session.closed:
+            yield self.session
+            return
+
+        async with self.__create_session() as session:
+            yield session
+
+    def __split_into_chunks(self, issue_ids: List[str]) -> List[List[str]]:
+        """Разбивает список ID задач на части, каждая из которых отправляется отдельным запросом."""
+        return [issue_ids[i:i + self.chunk_size] for i in range(0, len(issue_ids), self.chunk_size)]
+
+    async def __produce_pages(
+        self,
+        session: aiohttp.ClientSession,
+        chunks: List[List[str]],
+        fields_params: List[Tuple[str, str]],
+        pages: asyncio.Queue,
+    ):
+        """Складывает страницы ответа в очередь; в конце кладет None, при ошибке — исключение.
+
+        Аргументы:
+            session (aiohttp.ClientSession): HTTP-сессия.
+            chunks (List[List[str]]): Части списка ID задач.
+            fields_params (List[Tuple[str, str]]): Параметры запроса, задающие поля ответа.
+            pages (asyncio.Queue): Очередь страниц.
+        """
+        try:
+            for chunk in chunks:
+                async for page in self.__iter_pages(session, chunk, fields_params):
+                    await pages.put(page)
+        except Exception as error:
+            await pages.put(error)
+        else:
+            await pages.put(None)
+
+    async def __iter_pages(
+        self, session: aiohttp.ClientSession, issue_ids: List[str], fields_params: List[Tuple[str, str]]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Запрашивает задачи постранично, пока сервер не вернет неполную страницу.
+
+        Аргументы:
+            session (aiohttp.ClientSession): HTTP-сессия.
+            issue_ids (List[str]): Список ID задач.
+            fields_params (List[Tuple[str, str]]): Параметры запроса, задающие поля ответа.
+
+        Возвращает:
+            AsyncIterator[List[Dict[str, Any]]]: Страницы с данными задач в формате YouTrack.
+        """
+        url = f"{self.base_url}/api/issues"
+        params = [
+            *fields_params,
+            ("query", " OR ".join([f"issue id: {issue_id}" for issue_id in issue_ids])),
+            ("$top", str(self.page_size)),
+        ]
+
+        skip = 0
+        while True:
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
+            async def get_page() -> List[Dict[str, Any]]:
+                async with session.get(url, params=[*params, ("$skip", str(skip))]) as response:
+                    response.raise_for_status()
+                    return await response.json()
 
-        return [convert_to_issue(item) for item in data]
+            page = await self.scheduler.run(get_page)
+            if page:
+                yield page
+            if len(page) < self.page_size:
+                return
+            skip += len(page)
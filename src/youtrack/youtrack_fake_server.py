@@ -0,0 +1,171 @@
+import asyncio
+import random
+from aiohttp import web
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+
+DEFAULT_STATES = ("Open", "In Progress", "Review", "Testing", "Fixed", "Won't fix")
+
+
+def generate_issues(
+    count: int,
+    project_ids: Sequence[str] = ("TMOB",),
+    states: Sequence[str] = DEFAULT_STATES,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """Генерирует задачи в формате ответа `/api/issues` YouTrack.
+
+    Аргументы:
+        count (int): Число задач.
+        project_ids (Sequence[str], optional): Проекты; задачи распределяются по ним по кругу.
+        states (Sequence[str], optional): Возможные состояния.
+        seed (int, optional): Начальное значение генератора случайных чисел.
+
+    Возвращает:
+        List[Dict[str, Any]]: Задачи с полями idReadable, summary, updated и customFields.
+    """
+    rng = random.Random(seed)
+    issues = []
+    for number in range(count):
+        issues.append({
+            "idReadable": f"{project_ids[number % len(project_ids)]}-{number + 1}",
+            "summary": f"Задача {number + 1}",
+            "updated": 1_700_000_000_000 + rng.randint(0, 10**9),
+            "customFields": [
+                {"name": "Priority", "value": {"name": rng.choice(["Normal", "Major", "Critical"])}},
+                {"name": "State", "value": {"name": rng.choice(states)}},
+            ],
+        })
+
+    return issues
+
+
+def split_fields(fields: str) -> List[str]:
+    """Разбивает значение параметра `fields` на поля верхнего уровня.
+
+    Аргументы:
+        fields (str): Значение параметра (например, 'idReadable,customFields(name,value(name))').
+
+    Возвращает:
+        List[str]: Имена полей верхнего уровня (например, ['idReadable', 'customFields']).
+    """
+    names = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(fields + ","):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            names.append(fields[start:i].split("(", 1)[0].strip())
+            start = i + 1
+
+    return [name for name in names if name]
+
+
+class FakeYouTrackServer:
+    """Локальная замена YouTrack для тестов и бенчмарков.
+
+    Поддерживает подмножество `/api/issues`: запрос вида 'issue id: X OR issue id: Y', параметры `fields`,
+    `customFields`, `$top` и `$skip`. Умеет добавлять задержку и отвечать ошибками 500 и 429.
+
+    Пример:
+        async with FakeYouTrackServer(generate_issues(1000)) as server:
+            async with YouTrackClient(server.url, "token") as client:
+                issues = await client.get_issues(["TMOB-1", "TMOB-2"])
+    """
+
+    def __init__(
+        self,
+        issues: Iterable[Dict[str, Any]],
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: Optional[float] = None,
+        max_page_size: Optional[int] = None,
+        seed: int = 0,
+    ):
+        """Инициализирует FakeYouTrackServer.
+
+        Аргументы:
+            issues (Iterable[Dict[str, Any]]): Задачи в формате YouTrack (см. `generate_issues`).
+            latency (float, optional): Задержка ответа в секундах.
+            error_rate (float, optional): Доля запросов, завершающихся ответом 500.
+            throttle_rate (float, optional): Доля запросов, завершающихся ответом 429.
+            retry_after (Optional[float], optional): Значение заголовка Retry-After для ответов 429.
+            max_page_size (Optional[int], optional): Сколько задач сервер отдает без `$top`.
+            seed (int, optional): Начальное значение генератора случайных чисел.
+        """
+        self.issues = {issue["idReadable"]: issue for issue in issues}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.max_page_size = max_page_size
+        self.random = random.Random(seed)
+        # Принятые запросы: query, fields и адрес клиента (по порту видно, переиспользовалось ли соединение)
+        self.requests: List[Dict[str, Any]] = []
+        self.url = ""
+        self.__runner: Optional[web.AppRunner] = None
+
+    async def __aenter__(self) -> "FakeYouTrackServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    async def start(self):
+        """Запускает сервер на свободном порту локального интерфейса и заполняет `url`."""
+        app = web.Application()
+        app.router.add_get("/api/issues", self.__handle_issues)
+        self.__runner = web.AppRunner(app)
+        await self.__runner.setup()
+        await web.TCPSite(self.__runner, "127.0.0.1", 0).start()
+        host, port = self.__runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+
+    async def stop(self):
+        """Останавливает сервер."""
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
+
+    async def __handle_issues(self, request: web.Request) -> web.Response:
+        self.requests.append({
+            "query": request.query.get("query", ""),
+            "fields": request.query.get("fields", ""),
+            "peer": request.transport.get_extra_info("peername") if request.transport else None,
+        })
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        roll = self.random.random()
+        if roll < self.throttle_rate:
+            headers = {"Retry-After": str(self.retry_after)} if self.retry_after is not None else None
+            return web.Response(status=429, headers=headers)
+        if roll < self.throttle_rate + self.error_rate:
+            return web.Response(status=500)
+
+        issue_ids = [
+            condition.split(":", 1)[1].strip()
+            for condition in request.query.get("query", "").split(" OR ")
+            if condition.strip().startswith("issue id:")
+        ]
+        found = [self.issues[issue_id] for issue_id in dict.fromkeys(issue_ids) if issue_id in self.issues]
+
+        skip = int(request.query.get("$skip", 0))
+        top = int(request.query["$top"]) if "$top" in request.query else self.max_page_size
+        page = found[skip:skip + top] if top is not None else found[skip:]
+
+        fields = split_fields(request.query.get("fields", "idReadable"))
+        custom_fields = request.query.getall("customFields", [])
+        return web.json_response([self.__project(issue, fields, custom_fields) for issue in page])
+
+    @staticmethod
+    def __project(issue: Dict[str, Any], fields: List[str], custom_fields: List[str]) -> Dict[str, Any]:
+        projected = {name: issue[name] for name in fields if name in issue}
+        if "customFields" in projected and custom_fields:
+            projected["customFields"] = [field for field in issue["customFields"] if field["name"] in custom_fields]
+        return projected
@@ -1,5 +1,6 @@
+import sys
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
 
 
 @dataclass
@@ -7,28 +8,103 @@ class Issue:
     id: str
     title: str
     state: Optional[str]
+    updated: Optional[int] = None # Время последнего изменения в YouTrack (мс от эпохи)
 
 
-def convert_to_issue(data: Dict[str, Any]) -> Issue:
+@dataclass(frozen=True, slots=True)
+class CompactIssue:
+    """Неизменяемая задача без `__dict__` для хранения большого числа задач в памяти."""
+
+    id: str
+    title: str
+    state: Optional[str]
+    updated: Optional[int] = None
+
+    @classmethod
+    def from_issue(cls, issue: Issue) -> "CompactIssue":
+        """Создает компактную задачу из Issue, интернируя состояние.
+
+        Аргументы:
+            issue (Issue): Задача.
+
+        Возвращает:
+            CompactIssue: Компактная задача.
+        """
+        return cls(issue.id, issue.title, intern_value(issue.state), issue.updated)
+
+    def to_issue(self) -> Issue:
+        """Преобразует компактную задачу в Issue.
+
+        Возвращает:
+            Issue: Задача.
+        """
+        return Issue(self.id, self.title, self.state, self.updated)
+
+
+def intern_value(value: Optional[str]) -> Optional[str]:
+    """Интернирует строку с небольшим числом различных значений (например, состояние задачи).
+
+    Все задачи с одинаковым состоянием ссылаются на один объект строки вместо собственных копий.
+
+    Аргументы:
+        value (Optional[str]): Строка или None.
+
+    Возвращает:
+        Optional[str]: Интернированная строка или None.
+    """
+    return sys.intern(value) if value is not None else None
+
+
+class IssueFields(NamedTuple):
+    """Набор полей задачи, запрашиваемых у YouTrack.
+
+    Пользовательские поля фильтруются на стороне сервера (параметр `customFields`),
+    поэтому в ответе приходит только поле состояния, а не все поля задачи.
+    """
+
+    state_field: Optional[str] = "State" # Пользовательское поле с состоянием задачи; None — не запрашивать
+    updated: bool = True # Запрашивать время последнего изменения
+
+    def to_params(self) -> List[Tuple[str, str]]:
+        """Формирует параметры запроса `/api/issues`.
+
+        Возвращает:
+            List[Tuple[str, str]]: Параметры `fields` и, если нужно, `customFields`.
+        """
+        fields = ["idReadable", "summary"]
+        if self.updated:
+            fields.append("updated")
+        if self.state_field is None:
+            return [("fields", ",".join(fields))]
+
+        fields.append("customFields(name,value(name))")
+        return [("fields", ",".join(fields)), ("customFields", self.state_field)]
+
+
+DEFAULT_ISSUE_FIELDS = IssueFields()
+
+
+def convert_to_issue(data: Dict[str, Any], state_field: Optional[str] = "State") -> Issue:
     """Преобразует данные задачи из формата YouTrack в объект Issue.
 
     Аргументы:
         data (Dict[str, Any]): Словарь с данными задачи из YouTrack.
+        state_field (Optional[str], optional): Пользовательское поле с состоянием задачи.
 
     Возвращает:
         Issue: Объект задачи.
     """
-    state = next(
-        (
-            field.get("value", {}).get("name")
-            for field in data.get("customFields", [])
-            if field.get("name") == "State"
-        ),
-        None
-    )
+    state = None
+    # При фильтрации на сервере поле состояния — единственное, так что цикл обычно завершается на первой итерации
+    for field in data.get("customFields") or ():
+        if field.get("name") == state_field:
+            value = field.get("value")
+            state = intern_value(value.get("name")) if value else None
+            break
 
     return Issue(
         id=data["idReadable"],
         title=data["summary"], # Решил, что title очевиднее summary
-        state=state
+        state=state,
+        updated=data.get("updated")
     )
@@ -0,0 +1,71 @@
+from array import array
+from .youtrack_issue import CompactIssue, Issue
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+
+# Значение столбца `updated`, означающее отсутствие времени изменения.
+MISSING_UPDATED = -1
+
+
+class IssueTable:
+    """Колоночное хранилище большого числа задач.
+
+    ID и заголовки хранятся в списках строк, состояния — кодами в массиве `array('H')` со справочником
+    различных значений, время изменения — в массиве `array('q')`. Объект задачи на каждую строку
+    не создается, поэтому на задачу приходится только память ее строк и несколько байт кодов.
+    """
+
+    def __init__(self, issues: Iterable[Union[Issue, CompactIssue]] = ()):
+        """Инициализирует IssueTable.
+
+        Аргументы:
+            issues (Iterable[Union[Issue, CompactIssue]], optional): Начальные задачи.
+        """
+        self.ids: List[str] = []
+        self.titles: List[str] = []
+        self.state_codes = array("H")
+        self.updated = array("q")
+        self.states: List[Optional[str]] = [None] # Справочник состояний; код 0 — отсутствие состояния
+        self.__state_codes: Dict[Optional[str], int] = {None: 0}
+        self.extend(issues)
+
+    def append(self, issue: Union[Issue, CompactIssue]):
+        """Добавляет задачу в таблицу.
+
+        Аргументы:
+            issue (Union[Issue, CompactIssue]): Задача.
+        """
+        code = self.__state_codes.get(issue.state)
+        if code is None:
+            code = self.__state_codes[issue.state] = len(self.states)
+            self.states.append(issue.state)
+
+        self.ids.append(issue.id)
+        self.titles.append(issue.title)
+        self.state_codes.append(code)
+        self.updated.append(MISSING_UPDATED if issue.updated is None else issue.updated)
+
+    def extend(self, issues: Iterable[Union[Issue, CompactIssue]]):
+        """Добавляет задачи в таблицу.
+
+        Аргументы:
+            issues (Iterable[Union[Issue, CompactIssue]]): Задачи.
+        """
+        for issue in issues:
+            self.append(issue)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> CompactIssue:
+        updated = self.updated[index]
+        return CompactIssue(
+            self.ids[index],
+            self.titles[index],
+            self.states[self.state_codes[index]],
+            None if updated == MISSING_UPDATED else updated,
+        )
+
+    def __iter__(self) -> Iterator[CompactIssue]:
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,166 @@
+import asyncio
+import random
+import aiohttp
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Mapping, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# Коды ответа, после которых запрос стоит повторить.
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Коды ответа, которыми сервер сообщает о перегрузке: после них число одновременных запросов резко снижается.
+THROTTLING_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]], now: Optional[datetime] = None) -> Optional[float]:
+    """Разбирает заголовок Retry-After.
+
+    Аргументы:
+        headers (Optional[Mapping[str, str]]): Заголовки ответа.
+        now (Optional[datetime], optional): Текущее время (для значения в виде HTTP-даты).
+
+    Возвращает:
+        Optional[float]: Задержка в секундах или None, если заголовка нет или он некорректен.
+    """
+    value = headers.get("Retry-After") if headers else None
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, (retry_at - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class RequestScheduler:
+    """Планировщик запросов к YouTrack с повторами и адаптивным числом одновременных запросов.
+
+    Число одновременных запросов подбирается по схеме AIMD: после каждого успешного запроса лимит
+    растет примерно на единицу за "окно" запросов, а после ответа о перегрузке (429/503) умножается
+    на `decrease_factor`. Лимит снижается не чаще одного раза за эпизод перегрузки: ответы на запросы,
+    начатые до последнего снижения, его больше не уменьшают. Неудачные запросы повторяются с экспоненциальной задержкой со случайным
+    разбросом; если сервер прислал Retry-After, задержка не меньше указанной.
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: int = 4,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        decrease_factor: float = 0.5,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: Callable[[], float] = random.random,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """Инициализирует RequestScheduler.
+
+        Аргументы:
+            initial_concurrency (int, optional): Начальное число одновременных запросов.
+            min_concurrency (int, optional): Минимальное число одновременных запросов.
+            max_concurrency (int, optional): Максимальное число одновременных запросов.
+            decrease_factor (float, optional): Во сколько раз уменьшается лимит после ответа о перегрузке.
+            max_retries (int, optional): Максимальное число повторов одного запроса.
+            base_delay (float, optional): Базовая задержка перед повтором (в секундах).
+            max_delay (float, optional): Максимальная задержка перед повтором (в секундах).
+            jitter (Callable[[], float], optional): Источник случайного множителя задержки из [0, 1).
+            sleep (Callable[[float], Awaitable[None]], optional): Функция ожидания.
+        """
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.sleep = sleep
+        self.limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self.active = 0
+        self.retries = 0
+        self.cuts = 0
+        self.__condition: Optional[asyncio.Condition] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def run(self, send: Callable[[], Awaitable[T]]) -> T:
+        """Выполняет запрос, дождавшись свободного слота, и повторяет его при временных ошибках.
+
+        Аргументы:
+            send (Callable[[], Awaitable[T]]): Функция, выполняющая запрос. При неуспешном ответе
+                должна выбрасывать `aiohttp.ClientResponseError` (например, через `raise_for_status`).
+
+        Возвращает:
+            T: Результат запроса.
+
+        Исключения:
+            aiohttp.ClientResponseError: Если ответ неуспешен и повторять нельзя или попытки исчерпаны.
+            aiohttp.ClientConnectionError: Если соединение не удалось установить после всех попыток.
+        """
+        attempt = 0
+        while True:
+            await self.__acquire()
+            cuts = self.cuts
+            try:
+                result = await send()
+            except aiohttp.ClientResponseError as error:
+                # Запросы, начатые до последнего снижения, сообщают о той же перегрузке
+                if error.status in THROTTLING_STATUSES and cuts == self.cuts:
+                    self.limit = max(float(self.min_concurrency), self.limit * self.decrease_factor)
+                    self.cuts += 1
+                if error.status not in RETRYABLE_STATUSES or attempt >= self.max_retries:
+                    raise
+                delay = max(self.get_backoff_delay(attempt), parse_retry_after(error.headers) or 0.0)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.get_backoff_delay(attempt)
+            else:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+                return result
+            finally:
+                await self.__release()
+
+            attempt += 1
+            self.retries += 1
+            await self.sleep(delay)
+
+    def get_backoff_delay(self, attempt: int) -> float:
+        """Возвращает задержку перед повтором: экспоненциальную, со случайным разбросом.
+
+        Аргументы:
+            attempt (int): Номер неудачной попытки, начиная с нуля.
+
+        Возвращает:
+            float: Задержка в секундах.
+        """
+        return min(self.max_delay, self.base_delay * 2 ** attempt) * self.jitter()
+
+    async def __acquire(self):
+        condition = self.__get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.active < int(self.limit))
+            self.active += 1
+
+    async def __release(self):
+        condition = self.__get_condition()
+        async with condition:
+            self.active -= 1
+            condition.notify_all()
+
+    def __get_condition(self) -> asyncio.Condition:
+        # Condition привязан к циклу событий, поэтому создается в цикле, в котором выполняются запросы
+        loop = asyncio.get_running_loop()
+        if self.__loop is not loop:
+            self.__condition = asyncio.Condition()
+            self.__loop = loop
+        return self.__condition